@@ -0,0 +1,71 @@
+"""Distinctive keywords (weighted log-odds) for every offer and destination.
+
+Baseline: one Counter scan of the reviews per category plus per-word scoring in Python.
+Optimized: one sparse group-by product and vectorized scoring for all categories.
+
+Run from the project root: python benchmarks/bench_distinctive_terms.py
+"""
+
+import math
+from collections import Counter
+
+from common import best_of, load_dataset, load_mapping, report
+
+TOP_K = 15
+
+
+def counter_log_odds(df, column):
+    """Per-category scan, scoring every word with the same formula in pure Python."""
+    totals = Counter(t for tokens in df["tokens"] for t in tokens)
+    corpus_size = sum(totals.values())
+    result = {}
+    for value in df[column].dropna().unique():
+        subset = df[df[column] == value]
+        counts = Counter(t for tokens in subset["tokens"] for t in tokens)
+        size = sum(counts.values())
+        scores = []
+        for word, y in counts.items():
+            a = totals[word]
+            rest = a - y
+            delta = math.log(y + a) - math.log(size + corpus_size - y - a)
+            delta -= math.log(rest + a) - math.log(
+                corpus_size - size + corpus_size - rest - a
+            )
+            scores.append((word, delta / math.sqrt(1 / (y + a) + 1 / (rest + a))))
+        result[value] = sorted(scores, key=lambda item: -item[1])[:TOP_K]
+    return result
+
+
+def main():
+    from src.data.tag_parser import TagParser
+    from src.eda.term_index import DocTermIndex
+
+    df = TagParser.flatten_tags(load_dataset(), load_mapping())
+    # Whitespace tokens keep the benchmark independent of the NLTK corpora
+    df["tokens"] = df["content"].fillna("").str.lower().str.split()
+    index = DocTermIndex(df["tokens"])
+
+    for column in ("offer", "destination"):
+        baseline_s, expected = best_of(lambda: counter_log_odds(df, column), repeat=3)
+        optimized_s, result = best_of(
+            lambda: index.distinctive_terms(df[column], n=TOP_K)
+        )
+        for value, top_words in expected.items():
+            assert [round(s, 6) for _, s in result[value]] == [
+                round(s, 6) for _, s in top_words
+            ]
+        report(
+            f"log-odds, all {df[column].nunique()} {column}s",
+            baseline_s,
+            optimized_s,
+            len(df),
+        )
+
+    seconds, _ = best_of(
+        lambda: index.distinctive_terms(df["destination"], method="tfidf")
+    )
+    print(f"class TF-IDF, all destinations: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
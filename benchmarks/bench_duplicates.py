@@ -0,0 +1,58 @@
+"""Row-by-row duplicate offer-destination check (previous version) vs the vectorized one.
+
+Run from the project root: python benchmarks/bench_duplicates.py
+"""
+
+import contextlib
+import io
+
+import pandas as pd
+from common import best_of, load_dataset, load_mapping, report
+
+from src.data.duplicates_checks import find_duplicate_offer_destination
+from src.data.tag_bridge import build_tag_bridge
+from src.data.tag_parser import TagParser
+
+
+def duplicate_rows_iterrows(df):
+    """Previous implementation: iterrows over the first five pairs, printing each hit."""
+    hits = 0
+    for idx, row in df.iterrows():
+        pairs = []
+        for i in range(1, 6):
+            offer = row[f"offer_{i}"] if f"offer_{i}" in row else row["offer"]
+            destination = (
+                row[f"destination_{i}"]
+                if f"destination_{i}" in row
+                else row["destination"]
+            )
+            if pd.notna(offer) and pd.notna(destination):
+                pairs.append((offer, destination))
+        if len(pairs) != len(set(pairs)):
+            print(f"Row {idx} has duplicate offer-destination pairs: {pairs}")
+            hits += 1
+    return hits
+
+
+def main():
+    df = TagParser.flatten_tags(load_dataset(), load_mapping())
+    bridge = build_tag_bridge(df, load_mapping(), drop_duplicates=False)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        baseline_s, expected = best_of(lambda: duplicate_rows_iterrows(df), repeat=1)
+    wide_s, wide = best_of(lambda: find_duplicate_offer_destination(df))
+    long_s, long = best_of(
+        lambda: find_duplicate_offer_destination(bridge, layout="long")
+    )
+
+    assert wide["row"].nunique() == expected, "vectorized count differs"
+    report("duplicates (wide layout)", baseline_s, wide_s, len(df))
+    report("duplicates (long bridge)", baseline_s, long_s, len(df))
+    print(
+        f"rows with repeated pairs: {wide['row'].nunique()} (wide), "
+        f"ids with repeated pairs: {long['id'].nunique()} (long)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Default read_csv + later date parsing vs the typed loader and its Feather cache.
+
+Run from the project root: python benchmarks/bench_loader.py
+"""
+
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+from common import DATASET_PATH, best_of, load_dataset, report
+
+from src.data.loader import load_reviews, read_reviews_csv
+
+
+def load_default():
+    """Current path: object dtypes, dates parsed again by the plotting code."""
+    df = load_dataset()
+    df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+def main():
+    baseline_s, expected = best_of(load_default)
+    optimized_s, typed = best_of(lambda: read_reviews_csv(DATASET_PATH))
+    assert typed["date"].equals(expected["date"])
+    report("read_reviews_csv", baseline_s, optimized_s, len(typed))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "dataset.feather"
+        load_reviews(DATASET_PATH, cache_path)
+        optimized_s, cached = best_of(lambda: load_reviews(DATASET_PATH, cache_path))
+        pd.testing.assert_frame_equal(cached, typed)
+        report(
+            "load_reviews (memory-mapped Feather)", baseline_s, optimized_s, len(typed)
+        )
+
+    default_mb = load_dataset().memory_usage(deep=True).sum() / 1e6
+    typed_mb = typed.memory_usage(deep=True).sum() / 1e6
+    print(f"memory: default {default_mb:.1f} MB, typed {typed_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
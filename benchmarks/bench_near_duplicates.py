@@ -0,0 +1,22 @@
+"""Near-duplicate clustering of the review texts and the share of inference it saves.
+
+Run from the project root: python benchmarks/bench_near_duplicates.py
+"""
+
+from common import best_of, load_dataset
+
+from src.data.near_duplicates import NearDuplicateIndex, inference_saved
+
+
+def main():
+    texts = load_dataset()["content"].fillna("").tolist()
+    exact_saved = 1 - len(set(texts)) / len(texts)
+
+    seconds, labels = best_of(lambda: NearDuplicateIndex().cluster(texts), repeat=3)
+    print(f"clustered {len(texts):,} texts in {seconds * 1000:.1f} ms")
+    print(f"inference saved: exact duplicates only {exact_saved:.1%}")
+    print(f"inference saved: near-duplicates       {inference_saved(labels):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Aspect normalization: per-row apply of normalize_aspect vs normalizing unique values,
+and consolidation: groupby-apply over Python sets vs de-duplicated integer codes.
+
+Run from the project root: python benchmarks/bench_normalize_aspect.py
+"""
+
+import pandas as pd
+
+from common import ASPECTS_PATH, best_of, report
+
+
+def set_consolidation(aspect_df):
+    """The previous clean_and_consolidate_data: sorted(set(x)) per group, then sizes."""
+    tmp = aspect_df[["aspect_normalized", "aspect"]].dropna()
+    tmp = tmp[tmp["aspect_normalized"].str.strip() != ""]
+    tmp["aspect"] = tmp["aspect"].astype(str).str.strip()
+    consolidation = (
+        tmp.groupby("aspect_normalized")["aspect"]
+        .apply(lambda x: sorted(set(x)))
+        .to_frame("original_variants")
+    )
+    consolidation["count"] = tmp.groupby("aspect_normalized").size()
+    return consolidation.sort_values("count", ascending=False)
+
+
+def main():
+    from src.post_analysis.normalize_aspect import (
+        ARABIC_LETTER_FORMS,
+        clean_and_consolidate_data,
+        normalize_aspect,
+        normalize_aspects,
+    )
+
+    aspects = pd.read_csv(ASPECTS_PATH)["aspect"]
+    for copies in (1, 100):
+        column = pd.concat([aspects] * copies, ignore_index=True)
+        baseline_s, expected = best_of(lambda: column.apply(normalize_aspect), repeat=3)
+        optimized_s, result = best_of(lambda: normalize_aspects(column))
+        # Arabic keys are labelled with an unfolded spelling; the keys match
+        assert result.str.translate(ARABIC_LETTER_FORMS).tolist() == expected.tolist()
+        report(
+            f"normalize {len(column):,} aspects ({column.nunique():,} unique)",
+            baseline_s,
+            optimized_s,
+            len(column),
+        )
+
+        aspect_df = pd.DataFrame({"aspect": column, "aspect_normalized": result})
+        baseline_s, expected = best_of(lambda: set_consolidation(aspect_df), repeat=3)
+        optimized_s, result = best_of(
+            lambda: clean_and_consolidate_data(aspect_df, max_examples=None)
+        )
+        assert result.sort_index()["count"].equals(expected.sort_index()["count"])
+        report(
+            f"consolidate {len(column):,} aspects", baseline_s, optimized_s, len(column)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Polarity statistics of the post-analysis plots: per-plot group-bys over lower-cased
+polarity strings vs one shared PolarityAggregates.
+
+The aspect CSV has no review metadata, so offers, destinations and dates are drawn at
+random (seeded). Run from the project root: python benchmarks/bench_polarity_aggregates.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from common import ASPECTS_PATH, best_of, report
+
+
+def aspect_frame(copies=20, seed=0):
+    from src.post_analysis.normalize_aspect import normalize_aspects
+
+    df = pd.concat([pd.read_csv(ASPECTS_PATH)] * copies, ignore_index=True)
+    rng = np.random.default_rng(seed)
+    df["aspect_normalized"] = normalize_aspects(df["aspect"])
+    df["offer"] = rng.choice([f"offer {i}" for i in range(15)], len(df))
+    df["destination"] = rng.choice([f"destination {i}" for i in range(40)], len(df))
+    df["date"] = pd.Timestamp("2023-01-01") + pd.to_timedelta(
+        rng.integers(0, 730, len(df)), unit="D"
+    )
+    return df
+
+
+def row_wise_statistics(df):
+    """The previous plots: every statistic re-derives the polarity flags and re-groups."""
+    results = []
+    for column in ("offer", "destination"):
+        results.append(
+            df.groupby(column)
+            .apply(
+                lambda g: g["polarity"].astype(str).str.lower().eq("positive").mean()
+            )
+            .sort_values(ascending=False)
+        )
+        pol = df["polarity"].astype(str).str.lower()
+        results.append(
+            df.assign(is_neg=pol.eq("negative"))
+            .groupby(column)
+            .agg(n=("is_neg", "size"), neg_share=("is_neg", "mean"))
+            .sort_values("neg_share", ascending=False)
+        )
+    pol = df["polarity"].astype(str).str.lower()
+    focus = df.loc[pol.eq("negative"), "aspect_normalized"].value_counts().head(12)
+    sub = df[df["aspect_normalized"].isin(focus.index)]
+    results.append(
+        sub.assign(is_neg=pol.eq("negative"))
+        .groupby(["aspect_normalized", "offer"])
+        .agg(total_count=("is_neg", "size"), neg_share=("is_neg", "mean"))
+    )
+    month = df["date"].dt.to_period("M").dt.to_timestamp()
+    results.append(
+        df.assign(is_neg=pol.eq("negative"))
+        .groupby(month)
+        .agg(count=("is_neg", "size"), neg_share=("is_neg", "mean"))
+    )
+    return results
+
+
+def aggregate_statistics(df):
+    from src.post_analysis.polarity_aggregates import PolarityAggregates
+
+    aggregates = PolarityAggregates.from_frame(df)
+    results = []
+    for column in ("offer", "destination"):
+        shares = aggregates.shares(column)
+        results.append(shares["positive_share"].sort_values(ascending=False))
+        results.append(shares[["n_rows", "negative_share"]])
+    focus = aggregates.top("aspect_normalized", "negative", n=12)
+    shares = aggregates.shares(["aspect_normalized", "offer"])
+    results.append(shares[shares.index.get_level_values(0).isin(focus.index)])
+    results.append(aggregates.shares("month")[["n_rows", "negative_share"]])
+    return results
+
+
+def main():
+    df = aspect_frame()
+    baseline_s, expected = best_of(lambda: row_wise_statistics(df), repeat=3)
+    optimized_s, result = best_of(lambda: aggregate_statistics(df), repeat=3)
+    assert np.allclose(result[-1]["negative_share"], expected[-1]["neg_share"])
+    assert np.allclose(
+        result[1]["negative_share"], expected[1]["neg_share"].sort_index()
+    )
+    report("polarity statistics of all plots", baseline_s, optimized_s, len(df))
+
+
+if __name__ == "__main__":
+    main()
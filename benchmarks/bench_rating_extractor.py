@@ -0,0 +1,25 @@
+"""Per-row RatingExtractor.extract_ratings vs extract_ratings_bulk on origins/dataset.csv.
+
+Run from the project root: python benchmarks/bench_rating_extractor.py
+"""
+
+from common import best_of, load_dataset, report
+
+from src.data.rating_extractor import RatingExtractor
+
+
+def main():
+    df = load_dataset()
+    ratings = df["ratings"]
+
+    baseline_s, expected = best_of(
+        lambda: ratings.apply(RatingExtractor.extract_ratings), repeat=3
+    )
+    optimized_s, result = best_of(lambda: RatingExtractor.extract_ratings_bulk(ratings))
+
+    assert result.equals(expected.astype("float64")), "bulk output differs"
+    report("RatingExtractor (ratings column)", baseline_s, optimized_s, len(df))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Cold import and ready times of the service and analysis modules, checked against
+the budgets in startup_budget.json. Exits with status 1 when a budget is exceeded or
+a target fails to import or start; a target can be opted out with "skip": true in
+its budget entry.
+
+Run from the project root: python benchmarks/bench_startup.py [--repeat N]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+from common import ROOT
+
+BUDGET_PATH = ROOT / "benchmarks" / "startup_budget.json"
+
+# name -> (import statement, statement that makes the module ready to use)
+TARGETS = {
+    "app": ("import app", "app.app.openapi()"),
+    "text_cleaner": (
+        "from src.data.text_cleaner import TextCleaner",
+        "TextCleaner()",
+    ),
+    "tokenizer": (
+        "from src.data.tokenizer import TextTokenizer",
+        "TextTokenizer()",
+    ),
+    "pipeline": ("from src.data.pipeline import ReviewPipeline", "ReviewPipeline()"),
+    "eda_visualizations": (
+        "from src.eda.visiualizations import ReviewDataVisualizer",
+        "ReviewDataVisualizer(None)",
+    ),
+    "normalize_aspect": (
+        "from src.post_analysis.normalize_aspect import print_aspect_analysis",
+        "None",
+    ),
+}
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+{import_stmt}
+imported = time.perf_counter()
+{ready_stmt}
+ready = time.perf_counter()
+print(json.dumps({{"import_s": imported - start, "ready_s": ready - start}}))
+"""
+
+
+def measure(import_stmt, ready_stmt):
+    """Times one cold start in a fresh interpreter; None if the target cannot start."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            PROBE.format(import_stmt=import_stmt, ready_stmt=ready_stmt),
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        lines = [line.strip() for line in result.stderr.strip().splitlines()]
+        errors = [i for i, line in enumerate(lines) if "Error" in line]
+        start = errors[-1] if errors else len(lines) - 1
+        # Some errors (e.g. NLTK's LookupError) carry their message on the next lines
+        message = [line for line in lines[start:] if line.strip("*= ")][:2]
+        return None, " ".join(message)
+    return json.loads(result.stdout.strip().splitlines()[-1]), None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(BUDGET_PATH, "r") as f:
+        budget = json.load(f)
+
+    over_budget = []
+    for name, (import_stmt, ready_stmt) in TARGETS.items():
+        limits = budget.get(name, {})
+        if limits.get("skip"):
+            print(f"{name:20s} skipped (opted out in {BUDGET_PATH.name})")
+            continue
+        runs, error = [], None
+        for _ in range(args.repeat):
+            timing, error = measure(import_stmt, ready_stmt)
+            if timing is None:
+                break
+            runs.append(timing)
+        if not runs:
+            # A module that no longer imports or starts is the regression to catch
+            print(f"{name:20s} FAILED: {error}")
+            over_budget.append(f"{name} (failed to start)")
+            continue
+
+        best = {key: min(run[key] for run in runs) for key in ("import_s", "ready_s")}
+        status = "ok"
+        for key, seconds in best.items():
+            if key in limits and seconds > limits[key]:
+                status = "OVER BUDGET"
+                over_budget.append(f"{name}.{key}")
+        print(
+            f"{name:20s} import {best['import_s'] * 1000:8.1f} ms "
+            f"(budget {limits.get('import_s', float('nan')) * 1000:6.0f}) | "
+            f"ready {best['ready_s'] * 1000:8.1f} ms "
+            f"(budget {limits.get('ready_s', float('nan')) * 1000:6.0f}) | {status}"
+        )
+
+    if over_budget:
+        print(f"Startup check failed: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
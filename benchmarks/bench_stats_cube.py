@@ -0,0 +1,61 @@
+"""Grouped rating statistics (DataAnalyzer / Plotter queries): raw group-bys vs the cube.
+
+The dataset is tiled to 1M rows to show how the raw path grows with the corpus while
+the cube only grows with the number of destination x offer x language x month cells.
+
+Run from the project root: python benchmarks/bench_stats_cube.py
+"""
+
+import pandas as pd
+
+from common import best_of, load_dataset, load_mapping, report
+
+GROUPS = ("destination", "offer", "language", "month")
+ROWS = 1_000_000
+
+
+def raw_queries(df):
+    results = []
+    for group_col in GROUPS:
+        grouped = df.groupby(group_col, observed=True).agg(
+            {"id": "count", "normalized_ratings": ["mean", "std", "min", "max"]}
+        )
+        results.append(grouped)
+    results.append(pd.crosstab(df["destination"], df["offer"]))
+    return results
+
+
+def cube_queries(cube):
+    results = [cube.stats(group_col, "normalized_ratings") for group_col in GROUPS]
+    results.append(cube.rollup(["destination", "offer"])["n_rows"].unstack())
+    return results
+
+
+def main():
+    from src.data.rating_extractor import RatingExtractor
+    from src.data.tag_parser import TagParser
+    from src.eda.stats_cube import StatsCube, month_column
+
+    df = TagParser.flatten_tags(load_dataset(), load_mapping())
+    df["normalized_ratings"] = RatingExtractor.extract_ratings_bulk(df["ratings"]).iloc[
+        :, 0
+    ]
+    df["word_count"] = df["content"].fillna("").str.split().str.len()
+    df["month"] = month_column(df["date"])
+    df = pd.concat([df] * (ROWS // len(df) + 1), ignore_index=True).head(ROWS)
+
+    baseline_s, _ = best_of(lambda: raw_queries(df), repeat=3)
+    build_s, cube = best_of(lambda: StatsCube.from_frame(df), repeat=3)
+    # Fresh cube per run, so rollups are recomputed from the cells every time
+    query_s, _ = best_of(
+        lambda: cube_queries(StatsCube(cube.cells, cube.dimensions, cube.measures))
+    )
+
+    print(
+        f"cube built in {build_s * 1000:.1f} ms ({len(cube.cells):,} cells for {len(df):,} rows)"
+    )
+    report("4 group stats + dest x offer counts", baseline_s, query_s, len(df))
+
+
+if __name__ == "__main__":
+    main()
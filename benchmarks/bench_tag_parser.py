@@ -0,0 +1,62 @@
+"""Loop-based TagParser.flatten_tags (previous version) vs the bulk version.
+
+Run from the project root: python benchmarks/bench_tag_parser.py
+"""
+
+import pandas as pd
+from common import best_of, load_dataset, load_mapping, report
+
+from src.data.tag_parser import TagParser
+
+
+def flatten_tags_loop(df, mapping, tags_col="tags"):
+    """Previous implementation: per-cell parsing, per-code lookup and df.at writes."""
+    tag_map = mapping.get("tags_mapping", {})
+    pairs_per_row = []
+    max_pairs = 0
+    for cell in df[tags_col].tolist():
+        pairs = []
+        for code in TagParser._parse_tags_cell(cell):
+            vals = tag_map.get(code, [])
+            if not isinstance(vals, list):
+                vals = [vals]
+            offer = vals[0] if len(vals) >= 1 else None
+            destination = vals[1] if len(vals) >= 2 else None
+            pairs.append((offer, destination))
+        pairs_per_row.append(pairs)
+        max_pairs = max(max_pairs, len(pairs))
+
+    out_cols = []
+    if max_pairs >= 1:
+        out_cols.extend(["offer", "destination"])
+    for i in range(2, max_pairs + 1):
+        out_cols.extend([f"offer_{i}", f"destination_{i}"])
+    for col in out_cols:
+        df[col] = pd.NA
+
+    for idx, pairs in enumerate(pairs_per_row):
+        for j, (offer, dest) in enumerate(pairs, start=1):
+            if j == 1:
+                df.at[idx, "offer"] = offer
+                df.at[idx, "destination"] = dest
+            else:
+                df.at[idx, f"offer_{j}"] = offer
+                df.at[idx, f"destination_{j}"] = dest
+    return df
+
+
+def main():
+    df = load_dataset()
+    mapping = load_mapping()
+
+    baseline_s, expected = best_of(
+        lambda: flatten_tags_loop(df.copy(), mapping), repeat=3
+    )
+    optimized_s, result = best_of(lambda: TagParser.flatten_tags(df.copy(), mapping))
+
+    pd.testing.assert_frame_equal(result, expected)
+    report("TagParser.flatten_tags", baseline_s, optimized_s, len(df))
+
+
+if __name__ == "__main__":
+    main()
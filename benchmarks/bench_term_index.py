@@ -0,0 +1,59 @@
+"""Top-N word queries of ReviewAnalysis: Counter over token lists vs the sparse term index.
+
+Run from the project root: python benchmarks/bench_term_index.py
+"""
+
+from collections import Counter
+
+from common import best_of, load_dataset, load_mapping, report
+
+
+def counter_queries(df, categories):
+    """The previous ReviewAnalysis approach: re-filter and re-count per query."""
+    results = [Counter(t for tokens in df["tokens"] for t in tokens).most_common(10)]
+    for column, values in categories.items():
+        for value in values:
+            subset = df[df[column] == value]
+            tokens = [t for tokens in subset["tokens"] for t in tokens]
+            results.append(Counter(tokens).most_common(15))
+    return results
+
+
+def index_queries(index, df, categories):
+    results = [index.most_common(10)]
+    for column, values in categories.items():
+        top = index.most_common_by_group(df[column], groups=values, n=15)
+        results.extend(top[value] for value in values)
+    return results
+
+
+def main():
+    from src.data.tag_parser import TagParser
+    from src.eda.term_index import DocTermIndex
+
+    df = TagParser.flatten_tags(load_dataset(), load_mapping())
+    # Whitespace tokens keep the benchmark independent of the NLTK corpora
+    df["tokens"] = df["content"].fillna("").str.lower().str.split()
+    categories = {
+        column: df[column].value_counts().head(5).index
+        for column in ("offer", "destination")
+    }
+
+    build_s, index = best_of(lambda: DocTermIndex(df["tokens"]), repeat=3)
+    baseline_s, expected = best_of(lambda: counter_queries(df, categories), repeat=3)
+    optimized_s, result = best_of(lambda: index_queries(index, df, categories))
+    assert result == expected
+
+    print(
+        f"index built once in {build_s * 1000:.1f} ms ({len(index.vocabulary):,} terms)"
+    )
+    report(
+        "top words overall + top 5 offers/destinations",
+        baseline_s,
+        optimized_s,
+        len(df),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Row-wise TextTokenizer vs tokenize_column (process pool, NLTK and fast modes),
+plus memory and counting cost of list tokens vs EncodedTokens.
+
+Run from the project root: python benchmarks/bench_tokenizer.py
+"""
+
+import sys
+from collections import Counter
+
+from common import best_of, load_dataset, report
+
+from src.data.text_cleaner import TextCleaner
+from src.data.tokenizer import EncodedTokens, TextTokenizer
+
+
+def list_nbytes(tokens) -> int:
+    """Size of the list-of-lists-of-str representation, strings included."""
+    return sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(word) for word in row) for row in tokens
+    )
+
+
+def main():
+    df = load_dataset()
+    df["text_for_analysis"] = df["content"].fillna("")
+    df["cleaned_text"] = TextCleaner().clean_column(df)
+    tokenizer = TextTokenizer()
+
+    baseline_s, expected = best_of(
+        lambda: df.apply(
+            lambda row: tokenizer.remove_stopwords_and_tokenize(
+                row["cleaned_text"], row["language"]
+            ),
+            axis=1,
+        ),
+        repeat=1,
+    )
+    for label, kwargs in [
+        ("tokenize_column (NLTK, pool)", {}),
+        ("tokenize_column (fast, in-process)", {"fast": True, "n_jobs": 1}),
+        ("tokenize_column (fast, pool)", {"fast": True}),
+    ]:
+        optimized_s, result = best_of(
+            lambda: tokenizer.tokenize_column(df, **kwargs), repeat=3
+        )
+        assert result.equals(expected), f"{label} output differs"
+        report(label, baseline_s, optimized_s, len(df))
+
+    encoded = EncodedTokens.from_lists(expected)
+    assert encoded.to_lists().equals(expected)
+    print(
+        f"memory: lists {list_nbytes(expected) / 1e6:.1f} MB, "
+        f"encoded {encoded.nbytes / 1e6:.1f} MB"
+    )
+    baseline_s, most_common = best_of(
+        lambda: Counter(w for row in expected for w in row).most_common(20)
+    )
+    optimized_s, result = best_of(lambda: encoded.most_common(20))
+    assert result == most_common
+    report("most_common(20)", baseline_s, optimized_s, len(df))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DATASET_PATH = ROOT / "origins" / "dataset.csv"
+MAPPINGS_PATH = ROOT / "origins" / "mappings.json"
+ASPECTS_PATH = ROOT / "data" / "tourism_reviews_aspect_sentiment.csv"
+
+
+def load_dataset():
+    """Loads the raw review dataset the same way the EDA notebook does."""
+    import pandas as pd
+
+    return pd.read_csv(DATASET_PATH)
+
+
+def load_mapping():
+    """Loads the tag code -> (offer, destination) mapping."""
+    with open(MAPPINGS_PATH, "r") as f:
+        return json.load(f)
+
+
+def best_of(fn, repeat=5):
+    """Returns the fastest wall-clock time (seconds) of 'repeat' calls and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def report(name, baseline_s, optimized_s, rows):
+    """Prints a one-line comparison between a baseline and an optimized run."""
+    print(
+        f"{name:40s} baseline {baseline_s * 1000:9.1f} ms | "
+        f"optimized {optimized_s * 1000:9.1f} ms | "
+        f"speedup x{baseline_s / optimized_s:6.1f} | "
+        f"{rows / optimized_s:,.0f} rows/s"
+    )
@@ -1,8 +1,43 @@
 # dataframe_processor.py
+import os
+from pathlib import Path
 import pandas as pd
-from rating_extractor import RatingExtractor
-from tag_parser import TagParser
-from duplicates_checks import print_duplicate_offer_destination
+from src.data.rating_extractor import RatingExtractor
+from src.data.tag_parser import TagParser
+from src.data.tag_bridge import build_tag_bridge
+from src.data.duplicates_checks import print_duplicate_offer_destination
+from src.data.text_cleaner import TextCleaner
+from src.data.tokenizer import TextTokenizer
+from src.data.loader import iter_reviews_csv
+
+CHUNK_STAGES = [
+    ("process_ratings", {}),
+    ("process_tags", {}),
+    ("process_text", {}),
+    ("process_tokens", {}),
+]
+
+
+def _write_part(df: pd.DataFrame, path: Path):
+    """Writes one processed chunk as Parquet, giving all-empty columns a string type."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # A chunk where e.g. 'offer_5' is all NA or every token list is empty has no type
+    # to infer; use the type the other chunks will have so the parts read back as one
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            target = pa.string()
+        elif pa.types.is_list(field.type) and pa.types.is_null(field.type.value_type):
+            target = pa.list_(pa.string())
+        else:
+            continue
+        table = table.set_column(i, field.name, table.column(i).cast(target))
+
+    tmp_path = path.with_suffix(".tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
 
 
 class DataFrameProcessor:
@@ -10,17 +45,82 @@ class DataFrameProcessor:
         """Initializes the DataFrameProcessor with a DataFrame and a mapping dictionary."""
         self.df = df
         self.mapping = mapping
+        self.bridge = None
+        self.cleaner = None
+        self.tokenizer = None
 
-    def process_ratings(self):
+    def process_ratings(self, columns=("normalized", "raw")):
         """Extracts and normalizes ratings from the DataFrame."""
-        self.df[["normalized", "raw"]] = self.df["ratings"].apply(
-            RatingExtractor.extract_ratings
-        )
+        self.df[list(columns)] = RatingExtractor.extract_ratings_bulk(
+            self.df["ratings"]
+        ).to_numpy()
 
-    def process_tags(self):
+    def process_tags(self, max_pairs: int = None):
         """Flattens tags in the DataFrame based on the provided mapping."""
-        self.df = TagParser.flatten_tags(self.df, self.mapping)
+        self.df = TagParser.flatten_tags(self.df, self.mapping, max_pairs=max_pairs)
+
+    def process_text(self, text_col: str = "content"):
+        """Builds 'text_for_analysis' from the text column and cleans it by language."""
+        self.cleaner = self.cleaner or TextCleaner()
+        self.df["text_for_analysis"] = self.df[text_col].fillna("")
+        self.df["cleaned_text"] = self.cleaner.clean_column(self.df)
+
+    def process_tokens(self, fast: bool = False, n_jobs: int = None):
+        """Tokenizes 'cleaned_text' and removes stopwords into a 'tokens' column."""
+        self.tokenizer = self.tokenizer or TextTokenizer()
+        self.df["tokens"] = self.tokenizer.tokenize_column(
+            self.df, fast=fast, n_jobs=n_jobs
+        )
+
+    @classmethod
+    def process_in_chunks(
+        cls,
+        data_path,
+        mapping: dict,
+        output_dir,
+        chunksize: int = 50_000,
+        stages=None,
+    ) -> list:
+        """
+        Streams a reviews CSV through the processing stages one chunk at a time.
+
+        A first pass reads only the tags column to find the longest tag list, so every
+        chunk gets the same offer/destination columns. Each processed chunk is then
+        written to 'output_dir' as part-NNNNN.parquet before the next one is read, which
+        bounds peak memory by the chunk size. Read the result back with
+        'read_processed(output_dir)'.
+
+        :param stages: List of (method name, kwargs), defaults to ratings, tags, text
+            and tokens
+        :return: Paths of the written part files, in input order
+        """
+        stages = CHUNK_STAGES if stages is None else stages
+        max_pairs = 0
+        for chunk in iter_reviews_csv(data_path, chunksize, usecols=["tags"]):
+            codes = TagParser.parse_tags_column(chunk["tags"])
+            max_pairs = max(max_pairs, max(map(len, codes), default=0))
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        processor = cls(None, mapping)
+        parts = []
+        for i, chunk in enumerate(iter_reviews_csv(data_path, chunksize)):
+            processor.df = chunk
+            for method, params in stages:
+                if method == "process_tags":
+                    params = {"max_pairs": max_pairs, **params}
+                getattr(processor, method)(**params)
+            path = output_dir / f"part-{i:05d}.parquet"
+            _write_part(processor.df, path)
+            parts.append(path)
+        processor.df = None
+        return parts
+
+    def process_tag_bridge(self, id_col: str = "id"):
+        """Builds the long review-offer-destination bridge table from the tags."""
+        self.bridge = build_tag_bridge(self.df, self.mapping, id_col=id_col)
+        return self.bridge
 
     def find_duplicates(self):
-        """Prints duplicate offer destinations in the DataFrame."""
-        print_duplicate_offer_destination(self.df)
+        """Prints duplicate offer destinations in the DataFrame and returns the row count."""
+        return print_duplicate_offer_destination(self.df)
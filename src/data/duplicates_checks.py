@@ -1,40 +1,95 @@
+import numpy as np
 import pandas as pd
+from src.data.tag_bridge import WIDE_TAG_COLUMN
+
+
+def _wide_pairs(df: pd.DataFrame, id_col: str) -> pd.DataFrame:
+    """Stack the wide offer/destination columns into one (row, offer, destination) frame."""
+    pairs = {}
+    for col in df.columns:
+        match = WIDE_TAG_COLUMN.match(str(col))
+        if match:
+            pairs.setdefault(int(match.group(2) or 1), {})[match.group(1)] = col
+    # Only pair numbers that have both an offer and a destination column
+    pairs = [cols for _, cols in sorted(pairs.items()) if len(cols) == 2]
+
+    n = len(df)
+    long = pd.DataFrame(
+        {
+            "row": np.tile(df.index.to_numpy(), len(pairs)),
+            "position": np.tile(np.arange(n), len(pairs)),
+            "offer": np.concatenate(
+                [df[c["offer"]].to_numpy(dtype=object) for c in pairs] or [[]]
+            ),
+            "destination": np.concatenate(
+                [df[c["destination"]].to_numpy(dtype=object) for c in pairs] or [[]]
+            ),
+        }
+    )
+    if id_col in df.columns:
+        long.insert(1, id_col, np.tile(df[id_col].to_numpy(), len(pairs)))
+    return long
+
+
+def _repeated_pairs(df: pd.DataFrame, layout: str, id_col: str) -> tuple:
+    """
+    Repeated (review, offer, destination) counts plus the column keying reviews:
+    'position' for the wide layout, since index labels may repeat, or id_col.
+    """
+    if layout == "wide":
+        pairs = _wide_pairs(df, id_col)
+        keys = ["position"]
+    elif layout == "long":
+        pairs = df[[id_col, "offer", "destination"]].astype(
+            {"offer": object, "destination": object}
+        )
+        keys = [id_col]
+    else:
+        raise ValueError(f"Unknown layout: {layout!r} (expected 'wide' or 'long')")
+
+    pairs = pairs[pairs["offer"].notna() & pairs["destination"].notna()]
+    subset = keys + ["offer", "destination"]
+    repeated = pairs[pairs.duplicated(subset=subset, keep=False)]
+
+    duplicates = (
+        repeated.groupby(
+            [c for c in repeated.columns if c in subset or c in ("row", id_col)],
+            sort=False,
+            dropna=False,
+        )
+        .size()
+        .reset_index(name="count")
+        .sort_values(keys, kind="stable")
+    )
+    return duplicates, keys[0]
+
+
+def find_duplicate_offer_destination(
+    df: pd.DataFrame, layout: str = "wide", id_col: str = "id"
+) -> pd.DataFrame:
+    """
+    Find reviews whose tags repeat the same offer-destination pair.
+
+    :param df: Either the wide 'TagParser.flatten_tags' output or a long bridge built
+        with 'build_tag_bridge(..., drop_duplicates=False)'
+    :param layout: 'wide' (reviews keyed by index label) or 'long' (keyed by id_col, so
+        review records that share an id are checked together)
+    :return: One row per repeated (review, offer, destination) with a 'count' column,
+        sorted by review
+    """
+    duplicates, _ = _repeated_pairs(df, layout, id_col)
+    return duplicates.drop(columns=["position"], errors="ignore").reset_index(drop=True)
 
 
 @staticmethod
-def print_duplicate_offer_destination(df: pd.DataFrame) -> None:
-    """Print rows where duplicate offer-destination pairs are found."""
-    for idx, row in df.iterrows():
-        # Collect all (offer, destination) pairs from the row
-        pairs = []
-        for i in range(1, 6):  # Loop through offer_2 to offer_5
-            offer = row[f"offer_{i}"] if f"offer_{i}" in row else row["offer"]
-            destination = (
-                row[f"destination_{i}"]
-                if f"destination_{i}" in row
-                else row["destination"]
-            )
-            if pd.notna(offer) and pd.notna(destination):
-                pairs.append((offer, destination))
-
-        # Check for duplicates in pairs
-        if len(pairs) != len(set(pairs)):  # If duplicates exist
-            print(f"Row {idx} has duplicate offer-destination pairs: {pairs}")
-            print(
-                row[
-                    [
-                        "id",
-                        "tags",
-                        "offer",
-                        "destination",
-                        "offer_2",
-                        "destination_2",
-                        "offer_3",
-                        "destination_3",
-                        "offer_4",
-                        "destination_4",
-                        "offer_5",
-                        "destination_5",
-                    ]
-                ]
-            )
+def print_duplicate_offer_destination(
+    df: pd.DataFrame, layout: str = "wide", id_col: str = "id"
+) -> int:
+    """Print rows where duplicate offer-destination pairs are found and return how many."""
+    duplicates, key = _repeated_pairs(df, layout, id_col)
+    num_rows = duplicates[key].nunique()
+
+    if num_rows:
+        shown = duplicates.drop(columns=["position"], errors="ignore")
+        print(shown.to_string(index=False))
+    return num_rows
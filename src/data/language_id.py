@@ -0,0 +1,72 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Arabic letters (base block, supplement, extended-A and presentation forms)
+ARABIC_LETTERS = re.compile(
+    r"[\u0620-\u064A\u066E-\u06D3\u06FA-\u06FC\u0750-\u077F\u08A0-\u08FF"
+    r"\uFB50-\uFDFF\uFE70-\uFEFC]"
+)
+# Latin letters, including accented ones
+LATIN_LETTERS = re.compile(r"[A-Za-z\u00C0-\u024F]")
+
+# Language codes used by the dataset and the cleaning/tokenizing steps
+KNOWN_LANGUAGES = ("ara", "eng")
+
+
+def arabic_ratio(texts: pd.Series) -> pd.Series:
+    """Share of Arabic letters among the Arabic and Latin letters of every text (NaN if none)."""
+    texts = texts.fillna("").astype(str)
+    arabic = texts.str.count(ARABIC_LETTERS).to_numpy(dtype=float)
+    latin = texts.str.count(LATIN_LETTERS).to_numpy(dtype=float)
+    letters = arabic + latin
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = np.where(letters > 0, arabic / letters, np.nan)
+    return pd.Series(ratio, index=texts.index)
+
+
+def detect_language_column(
+    texts: pd.Series, threshold: float = 0.5, default: str = "eng"
+) -> pd.Series:
+    """
+    Script-ratio language id: 'ara' when at least 'threshold' of the letters are Arabic,
+    'eng' otherwise, and 'default' for texts without any letters.
+    """
+    ratio = arabic_ratio(texts).to_numpy()
+    codes = np.where(ratio >= threshold, "ara", "eng").astype(object)
+    codes[np.isnan(ratio)] = default
+    return pd.Series(codes, index=texts.index, dtype=object)
+
+
+def detect_language(text: str, threshold: float = 0.5, default: str = "eng") -> str:
+    """'detect_language_column' for a single text (e.g. one API request)."""
+    return detect_language_column(pd.Series([text]), threshold, default).iloc[0]
+
+
+def fill_language(
+    df: pd.DataFrame,
+    text_col: str = "text_for_analysis",
+    language_col: str = "language",
+    overwrite: bool = False,
+    threshold: float = 0.5,
+) -> pd.Series:
+    """
+    Language codes for routing rows through the cleaner, tokenizer and model.
+
+    Missing or unknown codes (anything but 'ara'/'eng') are replaced by the detected
+    language. With overwrite=True every row is re-detected, except rows without
+    letters, which keep their code.
+
+    :return: Series of language codes aligned to df.index
+    """
+    detected = detect_language_column(df[text_col], threshold, default="")
+    if language_col in df.columns:
+        given = df[language_col].astype(object)
+    else:
+        given = pd.Series(np.nan, index=df.index, dtype=object)
+    known = given.isin(KNOWN_LANGUAGES)
+
+    use_detected = detected.ne("") & (~known | overwrite)
+    languages = given.where(~use_detected, detected)
+    # Unknown code and no letters to go by: fall back to English, as before
+    return languages.where(languages.isin(KNOWN_LANGUAGES), "eng")
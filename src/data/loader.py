@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+import pandas as pd
+
+# Explicit dtypes of origins/dataset.csv; 'date' is parsed separately
+DATASET_DTYPES = {
+    "id": "object",
+    "content": "object",
+    "date": "object",
+    "language": "category",
+    "tags": "object",
+    "title": "object",
+    "ratings": "object",
+}
+
+
+def _csv_engine() -> str:
+    """The multithreaded pyarrow CSV reader when installed, pandas' C reader otherwise."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
+
+
+def _parse_dates(df: pd.DataFrame) -> pd.DataFrame:
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"], format="ISO8601", utc=True).astype(
+            "datetime64[ns, UTC]"
+        )
+    return df
+
+
+def read_reviews_csv(path="origins/dataset.csv") -> pd.DataFrame:
+    """
+    Reads the raw reviews CSV with explicit dtypes.
+
+    'date' is parsed once into a UTC datetime column and 'language' is categorical,
+    so downstream code does not have to re-parse or re-compare strings.
+    """
+    return _parse_dates(pd.read_csv(path, engine=_csv_engine(), dtype=DATASET_DTYPES))
+
+
+def iter_reviews_csv(path="origins/dataset.csv", chunksize: int = 50_000, **kwargs):
+    """
+    Yields the reviews CSV in typed chunks of at most 'chunksize' rows.
+
+    Only one chunk is held in memory at a time; extra keyword arguments (e.g. usecols)
+    go to 'pd.read_csv'.
+    """
+    with pd.read_csv(
+        path, chunksize=chunksize, dtype=DATASET_DTYPES, **kwargs
+    ) as reader:
+        for chunk in reader:
+            yield _parse_dates(chunk)
+
+
+def load_reviews(
+    path="origins/dataset.csv", cache_path="data/cache/dataset.feather"
+) -> pd.DataFrame:
+    """
+    Loads the typed review dataset, converting the CSV to Feather on first use.
+
+    The uncompressed Feather copy is memory-mapped on later loads and is rebuilt
+    whenever the CSV is newer than it. Pass cache_path=None to always read the CSV.
+    """
+    if cache_path is None:
+        return read_reviews_csv(path)
+
+    from pyarrow import feather
+
+    cache_path = Path(cache_path)
+    if (
+        not cache_path.exists()
+        or cache_path.stat().st_mtime < Path(path).stat().st_mtime
+    ):
+        df = read_reviews_csv(path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        feather.write_feather(df, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cache_path)
+        return df
+
+    return feather.read_table(cache_path, memory_map=True).to_pandas()
+
+
+def read_processed(path) -> pd.DataFrame:
+    """
+    Reads processed reviews back from a Parquet file or a directory of part files.
+
+    Arrow hands list columns (e.g. 'tokens') back as numpy arrays; they are restored
+    to plain lists so the frame matches the one that was written.
+    """
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path)
+    df = table.to_pandas()
+    for field in table.schema:
+        if str(field.type).startswith(("list", "large_list")):
+            df[field.name] = pd.Series(
+                table.column(field.name).to_pylist(), index=df.index, dtype=object
+            )
+    return df
@@ -0,0 +1,147 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Everything that is not a word character or whitespace (punctuation, emoji, symbols)
+NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+
+# Odd 64-bit multiplier of the rolling shingle hash
+SHINGLE_BASE = np.uint64(0x9E3779B97F4A7C15)
+
+
+def normalize_for_matching(text: str) -> str:
+    """Lowercase, drop punctuation/emoji and collapse whitespace."""
+    return " ".join(NON_WORD_PATTERN.sub(" ", text.lower()).split())
+
+
+def inference_saved(labels) -> float:
+    """Fraction of texts that reuse another text's result instead of being scored."""
+    labels = np.asarray(labels)
+    return 1 - len(np.unique(labels)) / len(labels) if len(labels) else 0.0
+
+
+class NearDuplicateIndex:
+    def __init__(
+        self,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5,
+        threshold: float = 0.8,
+        normalize: bool = True,
+        seed: int = 0,
+    ):
+        """
+        MinHash/LSH index grouping near-duplicate texts.
+
+        Texts are cut into character shingles, summarized by 'num_perm' MinHash values
+        and split into 'bands' LSH bands; texts sharing a band bucket are candidates and
+        are linked when their estimated Jaccard similarity reaches 'threshold'.
+
+        :param shingle_size: Characters per shingle (character shingles work the same
+            for Arabic and English)
+        :param normalize: Apply 'normalize_for_matching' first, so texts that only
+            differ by emoji, punctuation or case are exact duplicates
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.normalize = normalize
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hash family: (a * x + b) >> 32 with odd a, on wrapping uint64
+        self._a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+
+    def _shingle_hashes(self, texts: list) -> tuple:
+        """Hash every character shingle of every text, vectorized over the corpus."""
+        k = self.shingle_size
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+        codes = codes.astype(np.uint64)
+
+        # Texts shorter than one shingle are hashed whole as a single shingle
+        n_shingles = np.where(lengths >= k, lengths - k + 1, (lengths > 0).astype(int))
+        starts = np.repeat(np.cumsum(lengths) - lengths, n_shingles)
+        starts += np.arange(len(starts)) - np.repeat(
+            np.cumsum(n_shingles) - n_shingles, n_shingles
+        )
+        widths = np.repeat(np.minimum(lengths, k), n_shingles)
+
+        hashes = np.zeros(len(starts), dtype=np.uint64)
+        padded = np.append(codes, np.zeros(k, dtype=np.uint64))
+        with np.errstate(over="ignore"):
+            for j in range(k):
+                part = np.where(j < widths, padded[starts + j], np.uint64(0))
+                hashes = hashes * SHINGLE_BASE + part
+        rows = np.repeat(np.arange(len(texts)), n_shingles)
+        return rows, hashes, n_shingles
+
+    def signatures(self, texts: list) -> np.ndarray:
+        """MinHash signatures, one row of 'num_perm' uint64 values per text."""
+        rows, hashes, n_shingles = self._shingle_hashes(texts)
+        signatures = np.full(
+            (len(texts), self.num_perm), np.iinfo(np.uint64).max, dtype=np.uint64
+        )
+        has_shingles = n_shingles > 0
+        if not has_shingles.any():
+            return signatures
+        # reduceat needs the first shingle position of every non-empty text
+        offsets = (np.cumsum(n_shingles) - n_shingles)[has_shingles]
+        with np.errstate(over="ignore"):
+            for p in range(self.num_perm):
+                permuted = (self._a[p] * hashes + self._b[p]) >> np.uint64(32)
+                signatures[has_shingles, p] = np.minimum.reduceat(permuted, offsets)
+        return signatures
+
+    def cluster(self, texts) -> np.ndarray:
+        """
+        Group near-duplicate texts.
+
+        :param texts: Sequence of texts (e.g. the 'cleaned_text' column)
+        :return: int64 array with, for every text, the position of its cluster's
+            representative (the cluster's first text); unique texts point to themselves
+        """
+        # Deferred so importing the batch processor (and the API) stays light
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
+
+        texts = ["" if t is None or t != t else str(t) for t in texts]
+        if self.normalize:
+            texts = [normalize_for_matching(t) for t in texts]
+
+        # Exact duplicates first, MinHash only runs on distinct texts
+        exact, distinct = pd.factorize(pd.Index(texts, dtype=object))
+        signatures = self.signatures(list(distinct))
+        n = len(distinct)
+
+        rows_per_band = self.num_perm // self.bands
+        left, right = [], []
+        for band in range(self.bands):
+            block = signatures[:, band * rows_per_band : (band + 1) * rows_per_band]
+            buckets = pd.factorize(
+                pd.Series([row.tobytes() for row in block], dtype=object)
+            )[0]
+            # Link every bucket member to the bucket's first member
+            first = pd.Series(np.arange(n)).groupby(buckets).transform("first")
+            linked = first.to_numpy() != np.arange(n)
+            left.append(first.to_numpy()[linked])
+            right.append(np.flatnonzero(linked))
+        left = np.concatenate(left) if left else np.array([], dtype=np.int64)
+        right = np.concatenate(right) if right else np.array([], dtype=np.int64)
+
+        # Keep candidate pairs whose estimated Jaccard similarity is high enough
+        similarity = (signatures[left] == signatures[right]).mean(axis=1)
+        keep = similarity >= self.threshold
+        graph = coo_matrix(
+            (np.ones(keep.sum()), (left[keep], right[keep])), shape=(n, n)
+        )
+        _, components = connected_components(graph, directed=False)
+
+        # Representative = first text (in input order) of each component
+        component_of_text = components[exact]
+        first_text = (
+            pd.Series(np.arange(len(texts))).groupby(component_of_text).transform("min")
+        )
+        return first_text.to_numpy(dtype=np.int64)
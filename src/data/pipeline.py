@@ -0,0 +1,164 @@
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+import pandas as pd
+from src.data.data_processor import DataFrameProcessor
+from src.data.loader import read_processed, read_reviews_csv
+
+DEFAULT_STAGES = [
+    ("ratings", "process_ratings", {}),
+    ("tags", "process_tags", {}),
+    ("text", "process_text", {}),
+    ("tokens", "process_tokens", {}),
+]
+
+# Parameters that change how a stage runs but not what it produces
+RUNTIME_PARAMS = {"n_jobs"}
+
+
+def file_hash(path) -> str:
+    """SHA-256 of a file's content, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_version(package_dir=Path(__file__).parent) -> str:
+    """Hash of every module in the 'src.data' package, so code edits invalidate caches."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(package_dir).glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def stage_code_version(func) -> str:
+    """
+    Hash of a stage method's own source, so editing one stage only invalidates the
+    caches from that stage on. Helpers the stage calls are not hashed; clear the
+    cache directory after changing them.
+    """
+    func = inspect.unwrap(func)
+    digest = hashlib.sha256(func.__qualname__.encode())
+    digest.update(inspect.getsource(func).encode())
+    return digest.hexdigest()
+
+
+# Marks object columns whose missing values are pd.NA, which Parquet reads back as None
+NA_COLUMNS_KEY = b"review_pipeline.na_columns"
+
+
+class ReviewPipeline:
+    def __init__(
+        self,
+        data_path="origins/dataset.csv",
+        mapping_path="origins/mappings.json",
+        cache_dir="data/cache",
+        stages=None,
+    ):
+        """
+        Runs the DataFrameProcessor stages and caches each stage's output as Parquet.
+
+        A stage's fingerprint chains the previous stage's fingerprint with its name,
+        method, parameters and the source of the code the stage runs (see
+        'stage_code_version'), starting from the hashes of the
+        data and mapping files. Stages whose fingerprint already has a cache file are
+        loaded instead of recomputed.
+
+        :param stages: List of (name, DataFrameProcessor method, kwargs), run in order
+        """
+        self.data_path = Path(data_path)
+        self.mapping_path = Path(mapping_path)
+        self.cache_dir = Path(cache_dir)
+        self.stages = DEFAULT_STAGES if stages is None else stages
+
+    def fingerprints(self) -> list:
+        """Fingerprint of every stage, in order."""
+        previous = hashlib.sha256(
+            (file_hash(self.data_path) + file_hash(self.mapping_path)).encode()
+        ).hexdigest()
+        fingerprints = []
+        for name, method, params in self.stages:
+            params = {k: v for k, v in params.items() if k not in RUNTIME_PARAMS}
+            version = stage_code_version(getattr(DataFrameProcessor, method))
+            key = json.dumps(
+                [previous, name, method, params, version], sort_keys=True, default=str
+            )
+            previous = hashlib.sha256(key.encode()).hexdigest()
+            fingerprints.append(previous)
+        return fingerprints
+
+    def _cache_path(self, name: str, fingerprint: str) -> Path:
+        return self.cache_dir / f"{name}-{fingerprint[:16]}.parquet"
+
+    def _save(self, df: pd.DataFrame, name: str, fingerprint: str):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_path(name, fingerprint)
+        na_columns = [
+            column
+            for column in df.columns
+            if df[column].dtype == object
+            and df[column].isna().any()
+            and all(v is pd.NA for v in df[column][df[column].isna()])
+        ]
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata(
+            {**table.schema.metadata, NA_COLUMNS_KEY: json.dumps(na_columns)}
+        )
+        # Write then rename, so an interrupted run never leaves a truncated cache file
+        tmp_path = path.with_suffix(".tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+        for stale in self.cache_dir.glob(f"{name}-*.parquet"):
+            if stale != path:
+                stale.unlink()
+
+    @staticmethod
+    def _load(path: Path) -> pd.DataFrame:
+        """Reads a cached stage back as the frame that was saved, missing values included."""
+        import pyarrow.parquet as pq
+
+        df = read_processed(path)
+        metadata = pq.read_schema(path).metadata or {}
+        for column in json.loads(metadata.get(NA_COLUMNS_KEY, b"[]")):
+            df[column] = df[column].astype(object).where(df[column].notna(), pd.NA)
+        return df
+
+    def run(self, force: bool = False, verbose: bool = True) -> pd.DataFrame:
+        """
+        Returns the processed DataFrame, recomputing only stages that changed.
+
+        :param force: Ignore the cache and rerun every stage
+        """
+        fingerprints = self.fingerprints()
+        start, df = 0, None
+        if not force:
+            for i in range(len(self.stages) - 1, -1, -1):
+                path = self._cache_path(self.stages[i][0], fingerprints[i])
+                if path.exists():
+                    df, start = self._load(path), i + 1
+                    if verbose:
+                        print(f"✓ Loaded stage '{self.stages[i][0]}' from {path}")
+                    break
+
+        with open(self.mapping_path, "r", encoding="utf-8") as f:
+            mapping = json.load(f)
+        if df is None:
+            df = read_reviews_csv(self.data_path)
+
+        processor = DataFrameProcessor(df, mapping)
+        for (name, method, params), fingerprint in zip(
+            self.stages[start:], fingerprints[start:]
+        ):
+            getattr(processor, method)(**params)
+            self._save(processor.df, name, fingerprint)
+            if verbose:
+                print(f"✓ Ran stage '{name}'")
+        return processor.df
@@ -1,6 +1,12 @@
 import ast
+import re
+import numpy as np
 import pandas as pd
 
+# Canonical rating payload, e.g. "{'normalized': 100, 'raw': 5}"
+_NUMBER = r"(-?\d+(?:\.\d+)?|None)"
+RATING_PATTERN = re.compile(rf"^\s*\{{'normalized': {_NUMBER}, 'raw': {_NUMBER}\}}\s*$")
+
 
 class RatingExtractor:
     @staticmethod
@@ -25,3 +31,35 @@ class RatingExtractor:
             return pd.Series({"normalized": None, "raw": None})
 
         return pd.Series({"normalized": None, "raw": None})
+
+    @staticmethod
+    def extract_ratings_bulk(ratings: pd.Series) -> pd.DataFrame:
+        """
+        Extracts normalized and raw ratings for a whole column in one pass.
+
+        Canonical dict strings are parsed with a single vectorized regex; only the
+        remaining non-null cells (other key orders, dict objects, lists, malformed
+        strings) fall back to 'extract_ratings', so the None semantics are unchanged.
+        Missing ratings come back as NaN in two float64 columns.
+        """
+        normalized = np.full(len(ratings), np.nan)
+        raw = np.full(len(ratings), np.nan)
+
+        types = ratings.map(type)
+        is_str = types.eq(str).to_numpy()
+        # Object dtype, so the .str accessor works on all-NaN or empty float columns
+        parsed = ratings[is_str].astype(object).str.extract(RATING_PATTERN)
+        matched = parsed[0].notna().to_numpy()
+        positions = np.flatnonzero(is_str)[matched]
+        normalized[positions] = pd.to_numeric(parsed[0][matched], errors="coerce")
+        raw[positions] = pd.to_numeric(parsed[1][matched], errors="coerce")
+
+        # Rare non-canonical cells go through the scalar parser (lists stay None)
+        rest = ratings.notna().to_numpy() & types.ne(list).to_numpy()
+        rest[positions] = False
+        if rest.any():
+            fallback = ratings[rest].apply(RatingExtractor.extract_ratings)
+            normalized[rest] = pd.to_numeric(fallback["normalized"], errors="coerce")
+            raw[rest] = pd.to_numeric(fallback["raw"], errors="coerce")
+
+        return pd.DataFrame({"normalized": normalized, "raw": raw}, index=ratings.index)
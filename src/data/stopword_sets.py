@@ -0,0 +1,14 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def load_stopwords(language: str) -> frozenset:
+    """
+    NLTK stopwords of a language, read from the corpus once per process.
+
+    TextCleaner and TextTokenizer instances share the returned set instead of each
+    re-reading the corpus; NLTK itself is only imported on first call.
+    """
+    from nltk.corpus import stopwords
+
+    return frozenset(stopwords.words(language))
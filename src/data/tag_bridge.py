@@ -0,0 +1,136 @@
+import re
+import numpy as np
+import pandas as pd
+from src.data.tag_parser import TagParser
+
+WIDE_TAG_COLUMN = re.compile(r"^(offer|destination)(?:_(\d+))?$")
+
+
+def _categories(values) -> list:
+    """Sorted distinct non-null labels, used as a stable categorical vocabulary."""
+    return sorted({v for v in values if isinstance(v, str)})
+
+
+def _finalize(
+    bridge, id_col, offer_categories, destination_categories, drop_duplicates
+):
+    """Drop empty pairs, dedupe and encode offer/destination as categoricals."""
+    bridge = bridge[bridge["offer"].notna() | bridge["destination"].notna()]
+    bridge = bridge.assign(
+        offer=pd.Categorical(bridge["offer"], categories=offer_categories),
+        destination=pd.Categorical(
+            bridge["destination"], categories=destination_categories
+        ),
+    )
+    if drop_duplicates:
+        bridge = bridge.drop_duplicates(subset=[id_col, "offer", "destination"])
+    return bridge.reset_index(drop=True)
+
+
+def build_tag_bridge(
+    df: pd.DataFrame,
+    mapping,
+    tags_col: str = "tags",
+    id_col: str = "id",
+    drop_duplicates: bool = True,
+) -> pd.DataFrame:
+    """
+    Build the long review-offer-destination bridge straight from the raw tags column.
+
+    :param df: Reviews with an id column and a tags column
+    :param mapping: Mapping dict holding 'tags_mapping', or a 'TagIndex'
+    :param drop_duplicates: Keep one row per (id, offer, destination); set to False to
+        keep repeated pairs (e.g. for duplicate checks)
+    :return: DataFrame with columns [id_col, 'pair', 'offer', 'destination'], where
+        'pair' is the 1-based position of the tag and offer/destination are categoricals
+    """
+    # Compile once: tag_pairs and the categories then share one mapping snapshot
+    compiled = TagParser.compile_mapping(mapping)
+    row_pos, pair_pos, offers, destinations, _ = TagParser.tag_pairs(
+        df[tags_col], compiled
+    )
+    _, offer_values, destination_values = compiled
+    bridge = pd.DataFrame(
+        {
+            id_col: df[id_col].to_numpy()[row_pos],
+            "pair": (pair_pos + 1).astype(np.int16),
+            "offer": offers,
+            "destination": destinations,
+        }
+    )
+    return _finalize(
+        bridge,
+        id_col,
+        _categories(offer_values),
+        _categories(destination_values),
+        drop_duplicates,
+    )
+
+
+def bridge_from_wide(
+    df: pd.DataFrame, id_col: str = "id", drop_duplicates: bool = True
+) -> pd.DataFrame:
+    """
+    Build the bridge from the wide offer/destination, offer_N/destination_N layout
+    produced by 'TagParser.flatten_tags'.
+    """
+    pairs = {}
+    for col in df.columns:
+        match = WIDE_TAG_COLUMN.match(str(col))
+        if match:
+            pairs.setdefault(int(match.group(2) or 1), {})[match.group(1)] = col
+
+    frames = []
+    for pair, cols in sorted(pairs.items()):
+        frames.append(
+            pd.DataFrame(
+                {
+                    id_col: df[id_col].to_numpy(),
+                    "pair": np.int16(pair),
+                    "offer": (
+                        df[cols["offer"]].to_numpy(dtype=object)
+                        if "offer" in cols
+                        else None
+                    ),
+                    "destination": (
+                        df[cols["destination"]].to_numpy(dtype=object)
+                        if "destination" in cols
+                        else None
+                    ),
+                }
+            )
+        )
+    if not frames:
+        bridge = pd.DataFrame(columns=[id_col, "pair", "offer", "destination"])
+    else:
+        # Stable sort keeps row order inside each review id
+        bridge = pd.concat(frames, ignore_index=True)
+        order = np.argsort(np.tile(np.arange(len(df)), len(frames)), kind="stable")
+        bridge = bridge.iloc[order]
+    return _finalize(
+        bridge,
+        id_col,
+        _categories(bridge["offer"]),
+        _categories(bridge["destination"]),
+        drop_duplicates,
+    )
+
+
+def _drop_wide_tag_columns(df: pd.DataFrame) -> pd.DataFrame:
+    return df.drop(columns=[c for c in df.columns if WIDE_TAG_COLUMN.match(str(c))])
+
+
+def join_reviews(
+    bridge: pd.DataFrame, reviews: pd.DataFrame, id_col: str = "id", how="inner"
+) -> pd.DataFrame:
+    """
+    Join reviews, or predicted aspects merged with their review id, to the bridge:
+    each row is repeated once per (offer, destination) pair of its review.
+
+    Any wide offer/destination columns on the reviews are replaced by the bridge's
+    categorical ones, so group-bys on 'offer' or 'destination' count every tagged pair
+    rather than only the first one.
+    """
+    return _drop_wide_tag_columns(reviews).merge(
+        bridge.drop(columns=["pair"]), on=id_col, how=how
+    )
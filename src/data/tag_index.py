@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+import numpy as np
+import pandas as pd
+
+
+def _compile(tag_map: dict) -> tuple:
+    """
+    Compile a 'tags_mapping' dict into (code index, offer ids, destination ids,
+    offer categories, destination categories, offer labels, destination labels).
+
+    Ids are positions in the sorted category lists; -1 marks a code without a (string)
+    offer or destination. Id and label arrays carry one trailing entry (-1 / None) so
+    unknown codes (-1 from 'get_indexer') resolve to it as well.
+    """
+    offers, destinations = [], []
+    for vals in tag_map.values():
+        # Normalize to list
+        if not isinstance(vals, list):
+            vals = [vals]
+        offers.append(vals[0] if len(vals) >= 1 else None)
+        destinations.append(vals[1] if len(vals) >= 2 else None)
+
+    code_index = pd.Index(list(tag_map.keys()), dtype=object)
+    offer_categories = pd.Index(sorted({v for v in offers if isinstance(v, str)}))
+    destination_categories = pd.Index(
+        sorted({v for v in destinations if isinstance(v, str)})
+    )
+    offer_ids = np.append(offer_categories.get_indexer(offers), -1).astype(np.int32)
+    destination_ids = np.append(
+        destination_categories.get_indexer(destinations), -1
+    ).astype(np.int32)
+    offer_labels = np.append(offer_categories.to_numpy(dtype=object), None)
+    destination_labels = np.append(destination_categories.to_numpy(dtype=object), None)
+    return (
+        code_index,
+        offer_ids,
+        destination_ids,
+        offer_categories,
+        destination_categories,
+        offer_labels[offer_ids],
+        destination_labels[destination_ids],
+    )
+
+
+class TagIndex:
+    def __init__(self, mapping: dict, path=None, auto_reload: bool = False):
+        """
+        Compiled tag code -> (offer, destination) lookup.
+
+        :param mapping: Mapping dict holding 'tags_mapping'
+        :param path: mappings.json the index was read from, used by 'reload'
+        :param auto_reload: Check the file for changes before every lookup
+        """
+        self.path = path
+        self.auto_reload = auto_reload
+        self._lock = threading.Lock()
+        self._signature = self._file_signature() if path is not None else None
+        self._state = _compile(mapping.get("tags_mapping", {}))
+
+    @classmethod
+    def from_file(cls, path="origins/mappings.json", auto_reload: bool = False):
+        """Builds the index from a mappings.json file."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f), path=path, auto_reload=auto_reload)
+
+    def _file_signature(self) -> tuple:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Recompiles the index if the mapping file changed since it was last read.
+
+        The new index is built aside and swapped in with a single assignment, so
+        concurrent lookups see either the old or the new mapping, never a mix. A file
+        that cannot be parsed (e.g. caught mid-write) leaves the current index in place
+        and is retried on the next call.
+
+        :return: True if the index was reloaded
+        """
+        if self.path is None:
+            return False
+        with self._lock:
+            signature = self._file_signature()
+            if not force and signature == self._signature:
+                return False
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    state = _compile(json.load(f).get("tags_mapping", {}))
+            except (OSError, ValueError):
+                return False
+            self._state, self._signature = state, signature
+            return True
+
+    def _current(self) -> tuple:
+        if self.auto_reload:
+            self.reload()
+        return self._state
+
+    @property
+    def codes(self) -> pd.Index:
+        return self._current()[0]
+
+    @property
+    def offer_categories(self) -> pd.Index:
+        return self._current()[3]
+
+    @property
+    def destination_categories(self) -> pd.Index:
+        return self._current()[4]
+
+    def __len__(self):
+        return len(self._current()[0])
+
+    def lookup(self, codes) -> tuple:
+        """
+        Vectorized lookup of an array of codes.
+
+        :return: (offer_ids, destination_ids) int32 arrays, -1 for unknown codes
+        """
+        code_index, offer_ids, destination_ids = self._current()[:3]
+        found = code_index.get_indexer(pd.Index(codes, dtype=object))
+        return offer_ids[found], destination_ids[found]
+
+    def labels(self) -> tuple:
+        """
+        Offer/destination labels per code, in the layout of 'TagParser.compile_mapping'.
+
+        :return: (code index, offers, destinations) where the label arrays carry one
+            trailing None for unknown codes
+        """
+        state = self._current()
+        return state[0], state[5], state[6]
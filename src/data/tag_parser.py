@@ -1,5 +1,23 @@
 import ast
+import re
+from itertools import chain
+import numpy as np
 import pandas as pd
+from src.data.tag_index import TagIndex
+
+# Canonical tags payload, e.g. "[{'value': 'code', 'sentiment': None}, ...]"
+TAGS_PATTERN = re.compile(
+    r"\[(?:\{'value': '[^'\\]*', 'sentiment': (?:None|'[^'\\]*')\}(?:, (?=\{))?)*\]"
+)
+TAG_VALUE_PATTERN = re.compile(r"\{'value': '([^'\\]*)'")
+
+
+def _object_array(values: list) -> np.ndarray:
+    """1-D object array of the given lists (np.array would stack equal-length lists)."""
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
 
 
 class TagParser:
@@ -28,57 +46,109 @@ class TagParser:
                     codes.append(item)
         return codes
 
+    @staticmethod
+    def parse_tags_column(tags: pd.Series) -> list:
+        """
+        Return the list of tag codes for every cell of a tags column.
+
+        Canonical cells are validated and parsed with vectorized regexes; any other
+        cell goes through '_parse_tags_cell', so the result is the same as parsing
+        each cell on its own.
+        """
+        codes = np.empty(len(tags), dtype=object)
+        is_str = tags.map(type).eq(str).to_numpy()
+        # Object dtype, so the .str accessor works on all-NaN or empty float columns
+        strings = tags[is_str].astype(object)
+        canonical = strings.str.fullmatch(TAGS_PATTERN).to_numpy(dtype=bool)
+        positions = np.flatnonzero(is_str)[canonical]
+        codes[positions] = _object_array(
+            strings[canonical].str.findall(TAG_VALUE_PATTERN).tolist()
+        )
+
+        rest = np.ones(len(tags), dtype=bool)
+        rest[positions] = False
+        codes[rest] = _object_array(
+            [TagParser._parse_tags_cell(c) for c in tags[rest].tolist()]
+        )
+        return codes.tolist()
+
+    @staticmethod
+    def compile_mapping(mapping) -> tuple:
+        """
+        Precompile 'tags_mapping' into a code index plus offer/destination arrays.
+
+        The arrays carry one trailing None so that unknown codes (-1 from
+        'get_indexer') resolve to None, like 'tag_map.get(code, [])' did.
+
+        :param mapping: Mapping dict holding 'tags_mapping', an already compiled
+            'TagIndex', or the tuple this method returns (both reused as is)
+        """
+        if isinstance(mapping, tuple):
+            return mapping
+        if not isinstance(mapping, TagIndex):
+            mapping = TagIndex(mapping)
+        return mapping.labels()
+
+    @staticmethod
+    def tag_pairs(tags: pd.Series, mapping) -> tuple:
+        """
+        Resolve a tags column into flat (row position, pair position, offer, destination).
+
+        :return: Tuple of (row_pos, pair_pos, offers, destinations, max_pairs) where the
+            first four are aligned arrays with one entry per tag code
+        """
+        code_index, offers, destinations = TagParser.compile_mapping(mapping)
+        codes_per_row = TagParser.parse_tags_column(tags)
+
+        lengths = np.fromiter(
+            (len(c) for c in codes_per_row), dtype=np.int64, count=len(codes_per_row)
+        )
+        max_pairs = int(lengths.max()) if len(lengths) else 0
+        flat_codes = list(chain.from_iterable(codes_per_row))
+        row_pos = np.repeat(np.arange(len(lengths)), lengths)
+        pair_pos = np.arange(len(flat_codes)) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+        found = code_index.get_indexer(pd.Index(flat_codes, dtype=object))
+        return row_pos, pair_pos, offers[found], destinations[found], max_pairs
+
     @staticmethod
     def flatten_tags(
         df: pd.DataFrame,
-        mapping: dict,
+        mapping,
         tags_col: str = "tags",
         drop_original: bool = False,
+        max_pairs: int = None,
     ) -> pd.DataFrame:
         """
-        Flatten a tags column into offer/destination pairs using a mapping dict.
+        Flatten a tags column into offer/destination pairs using a mapping dict or a
+        'TagIndex'.
+
+        Produces 'offer'/'destination' for the first pair, then 'offer_2'/'destination_2'
+        ... up to the longest tag list. Cells are parsed in bulk, every code is looked up
+        once through the precompiled mapping and the wide columns are filled in one shot,
+        so any index (not only a RangeIndex) is supported.
+
+        :param max_pairs: Create at least this many offer/destination column pairs,
+            e.g. the longest tag list of a whole dataset processed in chunks
         """
-        tag_map = mapping.get("tags_mapping", {})
-
-        # For each row, build a list of (offer, destination) pairs (destination may be None)
-        pairs_per_row = []
-        max_pairs = 0
-        for cell in df[tags_col].tolist():
-            codes = TagParser._parse_tags_cell(cell)
-            pairs = []
-            for code in codes:
-                vals = tag_map.get(code, [])
-                # Normalize to list
-                if not isinstance(vals, list):
-                    vals = [vals]
-                offer = vals[0] if len(vals) >= 1 else None
-                destination = vals[1] if len(vals) >= 2 else None
-                pairs.append((offer, destination))
-            pairs_per_row.append(pairs)
-            if len(pairs) > max_pairs:
-                max_pairs = len(pairs)
+        row_pos, pair_pos, offers, destinations, n_pairs = TagParser.tag_pairs(
+            df[tags_col], mapping
+        )
+        max_pairs = max(n_pairs, max_pairs or 0)
+
+        # Wide grids, one column per pair number, NA where the row has fewer pairs
+        offer_grid = np.full((len(df), max_pairs), pd.NA, dtype=object)
+        destination_grid = np.full((len(df), max_pairs), pd.NA, dtype=object)
+        offer_grid[row_pos, pair_pos] = offers
+        destination_grid[row_pos, pair_pos] = destinations
 
         # Create columns: offer/destination for the first pair,
         # then offer_2/destination_2 ... up to max_pairs
-        out_cols = []
-        if max_pairs >= 1:
-            out_cols.extend(["offer", "destination"])
-        for i in range(2, max_pairs + 1):
-            out_cols.extend([f"offer_{i}", f"destination_{i}"])
-
-        # Initialize with NaNs
-        for col in out_cols:
-            df[col] = pd.NA
-
-        # Fill row-by-row
-        for idx, pairs in enumerate(pairs_per_row):
-            for j, (offer, dest) in enumerate(pairs, start=1):
-                if j == 1:
-                    df.at[idx, "offer"] = offer
-                    df.at[idx, "destination"] = dest
-                else:
-                    df.at[idx, f"offer_{j}"] = offer
-                    df.at[idx, f"destination_{j}"] = dest
+        for j in range(max_pairs):
+            suffix = "" if j == 0 else f"_{j + 1}"
+            df[f"offer{suffix}"] = offer_grid[:, j]
+            df[f"destination{suffix}"] = destination_grid[:, j]
 
         if drop_original:
             df = df.drop(columns=[tags_col])
@@ -1,23 +1,40 @@
 # text_cleaner.py
 import re
 import pandas as pd
-from nltk.corpus import stopwords
+from src.data.language_id import fill_language
+from src.data.stopword_sets import load_stopwords
+
+# Precompiled patterns shared by the per-row and the column-level cleaners
+URL_PATTERN = re.compile(r"http\S+|www\S+")
+ENGLISH_SPECIAL_CHARS = re.compile(r"[^\w\s]")
+ARABIC_SPECIAL_CHARS = re.compile(r"[^\w\s\u0600-\u06FF]")
+ARABIC_DIACRITICS = re.compile(r"[\u064B\u064C\u064D\u064E\u064F\u0650\u0651\u0652]")
+
+# Character-level normalization, applied with str.replace (much faster than
+# re.sub or str.translate with a dict table on non-ASCII text)
+ARABIC_CHAR_REPLACEMENTS = [
+    ("إ", "ا"),  # Alif variants
+    ("أ", "ا"),
+    ("ٱ", "ا"),
+    ("آ", "ا"),
+    ("ؤ", "ء"),  # Hamza variants
+]
+
+# Column-level cleaning runs every pattern once over all rows joined by a newline
+ROW_SEPARATOR = "\n"
 
 
 class TextCleaner:
     def __init__(self):
-        # Define stopwords for English and Arabic
-        self.stop_words_eng = set(stopwords.words("english"))
-        self.stop_words_ara = set(stopwords.words("arabic"))
+        # Define stopwords for English and Arabic (loaded once, shared by instances)
+        self.stop_words_eng = load_stopwords("english")
+        self.stop_words_ara = load_stopwords("arabic")
 
     def normalize_arabic(self, text: str) -> str:
         """Normalize Arabic text to handle variations in certain characters."""
-        text = re.sub(r"[إأٱآا]", "ا", text)  # Normalize Alif variants
-        text = re.sub(r"[ؤء]", "ء", text)  # Normalize Hamza variants
-        text = re.sub(
-            r"[\u064B\u064C\u064D\u064E\u064F\u0650\u0651\u0652]", "", text
-        )  # Remove diacritics
-        return text
+        for variant, replacement in ARABIC_CHAR_REPLACEMENTS:
+            text = text.replace(variant, replacement)
+        return ARABIC_DIACRITICS.sub("", text)  # Remove diacritics
 
     def clean_text_english(self, text: str) -> str:
         """Clean and normalize English text."""
@@ -26,10 +43,10 @@ class TextCleaner:
 
         # Convert to lowercase and remove URLs
         text = str(text).lower()
-        text = re.sub(r"http\S+|www\S+", "", text)
+        text = URL_PATTERN.sub("", text)
 
         # Remove special characters but keep spaces and clean extra whitespace
-        text = re.sub(r"[^\w\s]", " ", text)
+        text = ENGLISH_SPECIAL_CHARS.sub(" ", text)
         text = " ".join(text.split())
 
         return text
@@ -41,12 +58,10 @@ class TextCleaner:
 
         # Normalize Arabic text and remove URLs
         text = self.normalize_arabic(text)
-        text = re.sub(r"http\S+|www\S+", "", text)
+        text = URL_PATTERN.sub("", text)
 
         # Remove Arabic punctuation and special characters
-        text = re.sub(
-            r"[^\w\s\u0600-\u06FF]", " ", text
-        )  # Keep Arabic letters and spaces
+        text = ARABIC_SPECIAL_CHARS.sub(" ", text)  # Keep Arabic letters and spaces
         text = " ".join(text.split())
 
         return text
@@ -57,3 +72,67 @@ class TextCleaner:
             return self.clean_text_arabic(row["text_for_analysis"])
         else:
             return self.clean_text_english(row["text_for_analysis"])
+
+    @staticmethod
+    def _join_rows(text: pd.Series) -> str:
+        # Newlines inside a text are whitespace either way; folding them to spaces
+        # keeps the separator unique without changing the cleaned output
+        return ROW_SEPARATOR.join(
+            text.astype(str).str.replace(ROW_SEPARATOR, " ", regex=False)
+        )
+
+    @staticmethod
+    def _split_rows(blob: str) -> list:
+        return [" ".join(text.split()) for text in blob.split(ROW_SEPARATOR)]
+
+    def clean_english_series(self, text: pd.Series) -> pd.Series:
+        """Column-level 'clean_text_english' for a Series of non-empty texts."""
+        blob = self._join_rows(text).lower()
+        blob = URL_PATTERN.sub("", blob)
+        blob = ENGLISH_SPECIAL_CHARS.sub(" ", blob)
+        return pd.Series(self._split_rows(blob), index=text.index, dtype=object)
+
+    def clean_arabic_series(self, text: pd.Series) -> pd.Series:
+        """Column-level 'clean_text_arabic' for a Series of non-empty texts."""
+        blob = self.normalize_arabic(self._join_rows(text))
+        blob = URL_PATTERN.sub("", blob)
+        blob = ARABIC_SPECIAL_CHARS.sub(" ", blob)
+        return pd.Series(self._split_rows(blob), index=text.index, dtype=object)
+
+    def clean_column(
+        self,
+        df: pd.DataFrame,
+        text_col: str = "text_for_analysis",
+        language_col: str = "language",
+        detect: bool = False,
+        overwrite: bool = False,
+    ) -> pd.Series:
+        """
+        Clean a whole text column, split by language, with the same output as
+        'apply_cleaning' row by row but without a Python call per row.
+
+        :param df: DataFrame holding the text and language columns
+        :param detect: Detect the language of rows with a missing or unknown code
+            from their script (always done when the language column is absent)
+        :param overwrite: Re-detect every row, also those already coded 'ara'/'eng',
+            for sources whose codes are not trusted (rows without letters keep theirs)
+        :return: Series of cleaned texts aligned to df.index
+        """
+        text = df[text_col]
+        cleaned = pd.Series("", index=df.index, dtype=object)
+
+        if detect or overwrite or language_col not in df.columns:
+            languages = fill_language(df, text_col, language_col, overwrite=overwrite)
+        else:
+            languages = df[language_col]
+
+        has_text = (text.notna() & text.ne("")).to_numpy()
+        is_arabic = languages.eq("ara").to_numpy()
+
+        arabic = has_text & is_arabic
+        english = has_text & ~is_arabic
+        if arabic.any():
+            cleaned[arabic] = self.clean_arabic_series(text[arabic]).to_numpy()
+        if english.any():
+            cleaned[english] = self.clean_english_series(text[english]).to_numpy()
+        return cleaned
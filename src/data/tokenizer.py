@@ -1,30 +1,168 @@
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+import numpy as np
+import pandas as pd
+from src.data.language_id import fill_language
+from src.data.stopword_sets import load_stopwords
+
+# On cleaned text (word characters and whitespace only) NLTK's word_tokenize
+# reduces to a whitespace split plus the Treebank contraction rules below
+FAST_CONTRACTIONS = re.compile(
+    r"(?i)\b(?:(can)(not)|(gim)(me)|(gon)(na)|(got)(ta)|(lem)(me)|(wan)(na))\b"
+)
+
+# Stopword sets of the current pool worker, set once by the pool initializer
+_worker_stopwords = None
+
+
+def fast_word_tokenize(text: str) -> list:
+    """Regex tokenizer matching 'word_tokenize' on cleaned Arabic and English text."""
+    text = FAST_CONTRACTIONS.sub(
+        lambda m: " ".join(g for g in m.groups() if g is not None), text
+    )
+    return text.split()
+
+
+def _nltk_word_tokenize():
+    # NLTK takes about a second to import, so only pay for it when it is used
+    from nltk.tokenize import word_tokenize
+
+    return word_tokenize
+
+
+def _filter_tokens(tokens: list, stop_words: set) -> list:
+    # Filter out stopwords and very short words (length > 2)
+    return [word for word in tokens if word.lower() not in stop_words and len(word) > 2]
+
+
+def _init_worker(stopwords_by_language: dict):
+    global _worker_stopwords
+    _worker_stopwords = stopwords_by_language
+
+
+def _tokenize_chunk(
+    texts: list, languages: list, fast: bool, stopwords_by_language: dict = None
+) -> list:
+    """Tokenize one chunk of texts (inside a pool worker unless stopwords are given)."""
+    tokenize = fast_word_tokenize if fast else _nltk_word_tokenize()
+    stopwords_by_language = stopwords_by_language or _worker_stopwords
+    arabic, english = stopwords_by_language["ara"], stopwords_by_language["eng"]
+    return [
+        (
+            _filter_tokens(tokenize(text), arabic if language == "ara" else english)
+            if text
+            else []
+        )
+        for text, language in zip(texts, languages)
+    ]
+
+
+class EncodedTokens:
+    def __init__(self, vocabulary, ids, offsets, index=None):
+        """
+        Token lists stored as a shared vocabulary plus a CSR-style pair of arrays.
+
+        :param vocabulary: Array of distinct tokens; a token id is a position in it
+        :param ids: int32 token ids of all rows, concatenated
+        :param offsets: int64 row boundaries, row i is ids[offsets[i]:offsets[i + 1]]
+        :param index: Index of the rows (defaults to a RangeIndex)
+        """
+        self.vocabulary = np.asarray(vocabulary, dtype=object)
+        self.ids = np.asarray(ids, dtype=np.int32)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.index = pd.RangeIndex(len(self.offsets) - 1) if index is None else index
+
+    @classmethod
+    def from_lists(cls, tokens, vocabulary=None):
+        """
+        Encode a Series (or list) of token lists.
+
+        Ids follow first-occurrence order, so ties in 'most_common' break the same way
+        as 'collections.Counter'. Pass an existing vocabulary to keep ids stable across
+        batches; unseen tokens are appended to it.
+        """
+        index = tokens.index if isinstance(tokens, pd.Series) else None
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        flat = pd.Index(list(chain.from_iterable(tokens)), dtype=object)
+
+        if vocabulary is None:
+            ids, vocabulary = pd.factorize(flat)
+        else:
+            vocabulary = pd.Index(vocabulary, dtype=object)
+            ids = vocabulary.get_indexer(flat)
+            unseen = ids < 0
+            if unseen.any():
+                new_ids, new_tokens = pd.factorize(flat[unseen])
+                ids[unseen] = new_ids + len(vocabulary)
+                vocabulary = vocabulary.append(new_tokens)
+
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(np.asarray(vocabulary, dtype=object), ids, offsets, index)
+
+    def to_lists(self) -> pd.Series:
+        """Decode back to a Series of token lists aligned to the original index."""
+        words = self.vocabulary[self.ids].tolist()
+        return pd.Series(
+            [
+                words[start:end]
+                for start, end in zip(self.offsets[:-1], self.offsets[1:])
+            ],
+            index=self.index,
+            dtype=object,
+        )
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def row_lengths(self) -> np.ndarray:
+        """Number of tokens in each row."""
+        return np.diff(self.offsets)
+
+    def row_ids(self) -> np.ndarray:
+        """Row position of every entry in 'ids'."""
+        return np.repeat(np.arange(len(self)), self.row_lengths())
+
+    def term_counts(self) -> np.ndarray:
+        """Occurrences of every vocabulary entry across all rows."""
+        return np.bincount(self.ids, minlength=len(self.vocabulary))
+
+    def most_common(self, n: int = 10) -> list:
+        """Same result as Counter(all tokens).most_common(n), from the integer arrays."""
+        counts = self.term_counts()
+        order = np.argsort(-counts, kind="stable")[:n]
+        return [(self.vocabulary[i], int(counts[i])) for i in order if counts[i]]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint, vocabulary strings included."""
+        vocabulary_bytes = pd.Series(self.vocabulary).memory_usage(deep=True)
+        return int(self.ids.nbytes + self.offsets.nbytes + vocabulary_bytes)
 
 
 class TextTokenizer:
     def __init__(self):
-        # Define stopwords for English and Arabic
-        self.english_stopwords = set(stopwords.words("english"))
-        self.arabic_stopwords = set(stopwords.words("arabic"))
+        # Define stopwords for English and Arabic (loaded once, shared by instances)
+        self.english_stopwords = load_stopwords("english")
+        self.arabic_stopwords = load_stopwords("arabic")
 
-    def remove_stopwords_and_tokenize(self, text, language_code: str) -> list:
+    def remove_stopwords_and_tokenize(
+        self, text, language_code: str, fast: bool = False
+    ) -> list:
         """Tokenize the text and remove stopwords based on the language."""
 
         if not text:
             return []
 
         # Tokenize the text
-        tokens = word_tokenize(text)
+        tokens = fast_word_tokenize(text) if fast else _nltk_word_tokenize()(text)
 
         # Determine the stopwords set based on the language
         stop_words = self.get_stopwords(language_code)
 
-        # Filter out stopwords and very short words (length > 2)
-        filtered_tokens = [
-            word for word in tokens if word.lower() not in stop_words and len(word) > 2
-        ]
-        return filtered_tokens
+        return _filter_tokens(tokens, stop_words)
 
     def get_stopwords(self, language_code: str) -> set:
         """Get the stopwords set based on language code."""
@@ -32,3 +170,65 @@ class TextTokenizer:
             return self.arabic_stopwords
         else:
             return self.english_stopwords
+
+    def tokenize_column(
+        self,
+        df: pd.DataFrame,
+        text_col: str = "cleaned_text",
+        language_col: str = "language",
+        n_jobs: int = None,
+        chunk_size: int = 2000,
+        fast: bool = False,
+        encode: bool = False,
+        detect: bool = False,
+        overwrite: bool = False,
+    ):
+        """
+        Tokenize and filter a whole text column, in chunks across a process pool.
+
+        :param df: DataFrame holding the cleaned text and language columns
+        :param n_jobs: Number of worker processes (default: CPU count, 1 runs in-process)
+        :param chunk_size: Number of rows sent to a worker at a time
+        :param fast: Use 'fast_word_tokenize' instead of NLTK's 'word_tokenize'; both
+            give the same tokens on text produced by 'TextCleaner'
+        :param encode: Return an 'EncodedTokens' (vocabulary + id/offset arrays)
+            instead of a Series of Python lists
+        :param detect: Detect the language of rows with a missing or unknown code
+            from their script (always done when the language column is absent)
+        :param overwrite: Re-detect every row, also those already coded 'ara'/'eng',
+            for sources whose codes are not trusted (rows without letters keep theirs)
+        :return: Series of token lists aligned to df.index, or 'EncodedTokens'
+        """
+        texts = df[text_col].tolist()
+        if detect or overwrite or language_col not in df.columns:
+            languages = fill_language(
+                df, text_col, language_col, overwrite=overwrite
+            ).tolist()
+        else:
+            languages = df[language_col].tolist()
+        stopwords_by_language = {
+            "ara": self.arabic_stopwords,
+            "eng": self.english_stopwords,
+        }
+        starts = range(0, len(texts), chunk_size)
+        n_jobs = min(n_jobs or os.cpu_count() or 1, max(len(starts), 1))
+
+        if n_jobs == 1:
+            tokens = _tokenize_chunk(texts, languages, fast, stopwords_by_language)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_worker,
+                initargs=(stopwords_by_language,),
+            ) as pool:
+                chunks = pool.map(
+                    _tokenize_chunk,
+                    [texts[i : i + chunk_size] for i in starts],
+                    [languages[i : i + chunk_size] for i in starts],
+                    [fast] * len(starts),
+                )
+                tokens = [row for chunk in chunks for row in chunk]
+
+        if encode:
+            return EncodedTokens.from_lists(pd.Series(tokens, index=df.index))
+        return pd.Series(tokens, index=df.index, dtype=object)
@@ -1,10 +1,11 @@
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
+from src.eda.stats_cube import StatsCube
 
 
 class DataAnalyzer:
-    def __init__(self, df):
+    def __init__(self, df, cube=None):
         """
         Initialize the DataAnalyzer with the dataframe.
 
@@ -12,15 +13,46 @@ class DataAnalyzer:
         ----------
         df : pd.DataFrame
             DataFrame containing the data to analyze.
+        cube : StatsCube, optional
+            Precomputed statistics cube of df (e.g. shared with a Plotter); built on
+            first use otherwise.
         """
         self.df = df
+        self._cube = cube
 
-    def analyze_grouped_data(self, group_col: str, stats_col: str) -> pd.DataFrame
+    @property
+    def cube(self) -> StatsCube:
+        if self._cube is None:
+            self._cube = StatsCube.from_frame(self.df)
+        return self._cube
+
+    def analyze_grouped_data(self, group_col: str, stats_col: str) -> pd.DataFrame:
         """
         General function to group the data and calculate statistics.
+
+        Groupings over the cube's dimensions are answered from the cube; any other
+        column is grouped from the raw rows.
         """
+        if (
+            self.cube.covers(group_col, stats_col)
+            and "word_count" in self.cube.measures
+        ):
+            rating = self.cube.stats(group_col, stats_col)
+            words = self.cube.stats(group_col, "word_count")
+            grouped = pd.DataFrame(
+                {
+                    "Review_Count": rating["n_rows"],
+                    "Avg_Rating": rating["mean"],
+                    "Rating_Std": rating["std"],
+                    "Min_Rating": rating["min"],
+                    "Max_Rating": rating["max"],
+                    "Avg_Word_Count": words["mean"],
+                }
+            ).round(2)
+            return grouped.sort_values("Review_Count", ascending=False)
+
         grouped = (
-            self.df.groupby(group_col)
+            self.df.groupby(group_col, observed=True)
             .agg(
                 {
                     "id": "count",
@@ -71,7 +103,7 @@ class DataAnalyzer:
 
 
 class Plotter:
-    def __init__(self, df):
+    def __init__(self, df, cube=None):
         """
         Initialize the Plotter with the dataframe.
 
@@ -79,18 +111,36 @@ class Plotter:
         ----------
         df : pd.DataFrame
             DataFrame containing the data to plot.
+        cube : StatsCube, optional
+            Precomputed statistics cube of df; built on first use otherwise.
         """
         self.df = df
+        self._cube = cube
+
+    @property
+    def cube(self) -> StatsCube:
+        if self._cube is None:
+            self._cube = StatsCube.from_frame(self.df)
+        return self._cube
 
     def plot_heatmap(self):
         """
         Plots a heatmap showing the number of reviews for each combination of destination and offering.
         """
-        # Create a crosstab between destination and offer to get the number of reviews
-        dest_offer = pd.crosstab(self.df["destination"], self.df["offer"])
+        # Reviews per destination and offer from the cube (same as a crosstab)
+        dest_offer = (
+            self.cube.rollup(["destination", "offer"])["n_rows"]
+            .unstack("offer", fill_value=0)
+            .astype(int)
+        )
 
         # Get the top 15 destinations based on review count
-        top_destinations = self.df["destination"].value_counts().head(15).index
+        top_destinations = (
+            self.cube.rollup("destination")["n_rows"]
+            .sort_values(ascending=False, kind="stable")
+            .head(15)
+            .index
+        )
         dest_offer_subset = dest_offer.loc[top_destinations]
 
         # Plot heatmap
@@ -119,12 +169,11 @@ class Plotter:
         """
         Generic function to plot comparison bar plots for either destination or offering types.
         """
-        ratings = (
-            self.df.groupby(group_col)[stats_col]
-            .mean()
-            .sort_values(ascending=False)
-            .head(15)
-        )
+        if self.cube.covers(group_col, stats_col):
+            means = self.cube.stats(group_col, stats_col)["mean"]
+        else:
+            means = self.df.groupby(group_col, observed=True)[stats_col].mean()
+        ratings = means.sort_values(ascending=False).head(15)
 
         # Plot the bar graph
         plt.figure(figsize=(10, 6))
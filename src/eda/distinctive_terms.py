@@ -0,0 +1,103 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# Scores are computed only where a group uses a term (the non-zeros of the groups x
+# terms count matrix) and returned with the same sparsity pattern.
+
+
+def _canonical(counts) -> csr_matrix:
+    # copy=True: sorting the indices of a view would scramble the caller's matrix
+    counts = csr_matrix(counts, dtype=float, copy=True)
+    counts.sum_duplicates()
+    return counts
+
+
+def _entries(counts) -> tuple:
+    """(CSR counts, row of every non-zero, column totals, row totals) as floats."""
+    counts = _canonical(counts)
+    rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+    totals = np.asarray(counts.sum(axis=0)).ravel()
+    group_sizes = np.asarray(counts.sum(axis=1)).ravel()
+    return counts, rows, totals, group_sizes
+
+
+def _like(counts: csr_matrix, data: np.ndarray) -> csr_matrix:
+    return csr_matrix((data, counts.indices, counts.indptr), shape=counts.shape)
+
+
+def weighted_log_odds(counts, prior_strength: float = None) -> csr_matrix:
+    """
+    Weighted log-odds ratio of every term in every group against all other groups,
+    with an informative Dirichlet prior (Monroe et al., "Fightin' Words").
+
+    The prior is the corpus-wide term distribution scaled to 'prior_strength' pseudo
+    counts, and log-odds are divided by their standard deviation, so frequent generic
+    words shrink towards 0 and rare words do not dominate.
+
+    :param counts: groups x terms count matrix (e.g. from 'DocTermIndex.group_term_counts')
+    :param prior_strength: Total pseudo count of the prior (default: corpus size)
+    :return: groups x terms CSR matrix of z-scores
+    """
+    counts, rows, totals, group_sizes = _entries(counts)
+    corpus_size = totals.sum()
+    alpha0 = corpus_size if prior_strength is None else float(prior_strength)
+
+    y = counts.data
+    alpha = alpha0 * totals[counts.indices] / corpus_size
+    rest = totals[counts.indices] - y
+    size = group_sizes[rows]
+    rest_size = corpus_size - size
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = np.log(y + alpha) - np.log(size + alpha0 - y - alpha)
+        delta -= np.log(rest + alpha) - np.log(rest_size + alpha0 - rest - alpha)
+        scores = delta / np.sqrt(1 / (y + alpha) + 1 / (rest + alpha))
+    return _like(counts, np.nan_to_num(scores, nan=0.0, posinf=0.0, neginf=0.0))
+
+
+def class_tfidf(counts) -> csr_matrix:
+    """
+    Class-based TF-IDF: every group is one document.
+
+    tf is the term's share of the group's tokens, idf is log(1 + average tokens per
+    group / corpus count of the term), so terms spread over all groups score low.
+
+    :param counts: groups x terms count matrix
+    :return: groups x terms CSR matrix of scores
+    """
+    counts, rows, totals, group_sizes = _entries(counts)
+    average_size = totals.sum() / counts.shape[0]
+    tf = counts.data / group_sizes[rows]
+    idf = np.log1p(average_size / totals[counts.indices])
+    return _like(counts, tf * idf)
+
+
+SCORERS = {"log_odds": weighted_log_odds, "tfidf": class_tfidf}
+
+
+def top_terms(scores, counts, vocabulary, groups, n: int = 10, min_count: int = 1):
+    """
+    Top 'n' terms per group by score.
+
+    :param scores: groups x terms CSR scores, as returned by the scorers above
+    :param counts: The groups x terms counts they were computed from; terms seen fewer
+        than 'min_count' times in a group are not reported for it
+    :param vocabulary: Term of every column
+    :param groups: Label of every row
+    :return: Dict group -> list of (term, score), best first (ties by column order)
+    """
+    counts = _canonical(counts)
+    result = {}
+    for row, group in enumerate(groups):
+        start, end = counts.indptr[row], counts.indptr[row + 1]
+        keep = counts.data[start:end] >= min_count
+        candidates = counts.indices[start:end][keep]
+        row_scores = scores.data[start:end][keep]
+        if n < len(candidates):
+            cutoff = np.partition(row_scores, -n)[-n]
+            keep = row_scores >= cutoff
+            candidates, row_scores = candidates[keep], row_scores[keep]
+        order = np.lexsort((candidates, -row_scores))[:n]
+        result[group] = [
+            (vocabulary[candidates[i]], float(row_scores[i])) for i in order
+        ]
+    return result
@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+from src.eda.stats_cube import month_column
+
+STRATA = ("offer", "destination", "language", "month")
+
+# Two-sided 95% normal quantile, for the error bars of sampled plots
+Z_95 = 1.96
+
+
+def allocate(
+    stratum_sizes: np.ndarray, size: int, min_per_stratum: int = 2
+) -> np.ndarray:
+    """
+    Proportional allocation of 'size' sample rows over strata (largest remainder),
+    with at least 'min_per_stratum' rows per stratum and never more than it holds.
+    """
+    stratum_sizes = np.asarray(stratum_sizes, dtype=np.int64)
+    exact = size * stratum_sizes / stratum_sizes.sum()
+    allocation = np.floor(exact).astype(np.int64)
+    remainder = size - allocation.sum()
+    allocation[np.argsort(-(exact - allocation), kind="stable")[:remainder]] += 1
+    allocation = np.maximum(allocation, min_per_stratum)
+    return np.minimum(allocation, stratum_sizes)
+
+
+class StratifiedSample:
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        size: int,
+        strata=STRATA,
+        seed: int = 0,
+        min_per_stratum: int = 2,
+        date_col: str = "date",
+    ):
+        """
+        Reproducible stratified sample of a review table, with design-based estimates.
+
+        Rows are grouped into strata by 'strata' (a 'month' stratum is derived from
+        'date_col'; missing columns are skipped), the sample size is allocated in
+        proportion to the stratum sizes and every stratum keeps its rows with the
+        lowest seeded random keys. Each sampled row carries a 'sample_weight' (stratum
+        size / stratum sample size), so weighted counts estimate population counts.
+
+        :param size: Target number of sampled rows (slightly more when small strata are
+            topped up to 'min_per_stratum')
+        :param seed: Seed of the random keys; the same frame and seed give the same sample
+        """
+        columns = {}
+        for stratum in strata:
+            if stratum in df.columns:
+                columns[stratum] = df[stratum]
+            elif stratum == "month" and date_col in df.columns:
+                columns[stratum] = month_column(df[date_col])
+        self.strata = list(columns)
+        self.seed = seed
+        self.population_size = len(df)
+
+        codes = (
+            pd.DataFrame(columns, index=df.index)
+            .groupby(self.strata, observed=True, dropna=False, sort=False)
+            .ngroup()
+            .to_numpy()
+            if self.strata
+            else np.zeros(len(df), dtype=np.int64)
+        )
+        self.stratum_sizes = np.bincount(codes)
+        self.sample_sizes = allocate(self.stratum_sizes, size, min_per_stratum)
+
+        # Rank rows by random key within their stratum and keep the first n_h
+        keys = np.random.default_rng(seed).random(len(df))
+        order = np.lexsort((keys, codes))
+        starts = np.cumsum(self.stratum_sizes) - self.stratum_sizes
+        rank = np.arange(len(df)) - starts[codes[order]]
+        selected = np.sort(order[rank < self.sample_sizes[codes[order]]])
+
+        self.codes = codes[selected]
+        self.frame = df.iloc[selected].copy()
+        self.frame["sample_weight"] = (
+            self.stratum_sizes[self.codes] / self.sample_sizes[self.codes]
+        )
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self.frame["sample_weight"].to_numpy()
+
+    def annotation(self) -> str:
+        """One-line description of the sample for plot footers and printed output."""
+        return (
+            f"Stratified sample: {len(self):,} of {self.population_size:,} reviews "
+            f"by {', '.join(self.strata) or 'none'} (seed {self.seed}); "
+            f"error bars are 95% intervals"
+        )
+
+    def counts(self, column: str) -> pd.DataFrame:
+        """
+        Estimated population count of every value of a column, with standard errors.
+
+        :return: DataFrame with 'count' and 'se', sorted by count like 'value_counts'
+        """
+        values = self.frame[column].to_numpy()
+        table = pd.crosstab(self.codes, values)
+        strata = table.index.to_numpy()
+        n_h = self.sample_sizes[strata][:, None]
+        big_n = self.stratum_sizes[strata][:, None]
+        p = table.to_numpy() / n_h
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Strata with a single sampled row contribute no variance estimate
+            s2 = np.where(n_h > 1, n_h / (n_h - 1) * p * (1 - p), 0.0)
+        variance = (big_n**2 * (1 - n_h / big_n) * s2 / n_h).sum(axis=0)
+        result = pd.DataFrame(
+            {"count": (big_n * p).sum(axis=0), "se": np.sqrt(variance)},
+            index=table.columns.rename(column),
+        )
+        return result.sort_values("count", ascending=False, kind="stable")
+
+    def mean(self, column: str) -> tuple:
+        """
+        Stratified estimate of a column's mean and its standard error.
+
+        Strata without non-null values are left out and the others reweighted.
+        """
+        values = pd.to_numeric(self.frame[column], errors="coerce")
+        grouped = values.groupby(self.codes).agg(["count", "mean", "var"])
+        grouped = grouped[grouped["count"] > 0]
+        big_n = self.stratum_sizes[grouped.index.to_numpy()]
+        n_h = grouped["count"].to_numpy()
+        share = big_n / big_n.sum()
+        estimate = float((share * grouped["mean"].to_numpy()).sum())
+        s2 = np.nan_to_num(grouped["var"].to_numpy())
+        fpc = 1 - np.minimum(n_h / big_n, 1)
+        se = float(np.sqrt((share**2 * fpc * s2 / n_h).sum()))
+        return estimate, se
+
+    def _values(self, column: str) -> tuple:
+        values = pd.to_numeric(self.frame[column], errors="coerce").to_numpy(float)
+        present = ~np.isnan(values)
+        return values[present], self.weights[present]
+
+    def quantile(self, column: str, q):
+        """
+        Weighted estimate of a column's population quantile(s) 'q'.
+
+        Each sampled value stands for 'sample_weight' rows; the weighted empirical
+        distribution is interpolated at the middle of every value's weight, which
+        matches 'Series.quantile' when all weights are equal.
+        """
+        values, weights = self._values(column)
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        if not len(values):
+            return np.full(np.shape(q), np.nan)[()]
+        total = weights.sum()
+        if total == weights[0]:
+            return np.full(np.shape(q), values[0])[()]
+        # Positions in [0, 1] of every value, first at 0 and last at 1
+        positions = np.cumsum(weights) - weights / 2
+        positions = (positions - positions[0]) / (positions[-1] - positions[0])
+        return np.interp(q, positions, values)
+
+    def std(self, column: str) -> float:
+        """Weighted estimate of a column's population standard deviation."""
+        values, weights = self._values(column)
+        total = weights.sum()
+        if total <= 1:
+            return np.nan
+        mean = (weights * values).sum() / total
+        variance = (weights * (values - mean) ** 2).sum() / (total - 1)
+        return float(np.sqrt(variance))
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = ("destination", "offer", "language", "month")
+MEASURES = ("normalized_ratings", "word_count")
+
+# Per-measure aggregates kept in every cell; all of them roll up exactly
+AGGREGATES = ("count", "sum", "sumsq", "min", "max")
+
+
+def month_column(dates: pd.Series) -> pd.Series:
+    """Monthly periods of a date column (timezone dropped, UTC if tz-aware)."""
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, format="ISO8601", utc=True)
+    if getattr(dates.dt, "tz", None) is not None:
+        dates = dates.dt.tz_convert(None)
+    return dates.dt.to_period("M")
+
+
+class StatsCube:
+    def __init__(self, cells: pd.DataFrame, dimensions: list, measures: list):
+        """
+        Rollup cube of review statistics.
+
+        One row per observed combination of 'dimensions', with the row count and, per
+        measure, the non-null count, sum, sum of squares, min and max. Any grouping
+        over a subset of the dimensions is answered by summing cells, and mean/std
+        follow from count, sum and sum of squares.
+
+        :param cells: Cell table as built by 'from_frame'
+        """
+        self.cells = cells
+        self.dimensions = list(dimensions)
+        self.measures = list(measures)
+        self._rollups = {}
+
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, dimensions=DIMENSIONS, measures=MEASURES, date_col="date"
+    ):
+        """
+        Builds the cube in one group-by pass over the review table.
+
+        A 'month' dimension is derived from 'date_col' when the frame has no such
+        column; dimensions and measures missing from the frame are left out.
+        """
+        frame = {}
+        for dimension in dimensions:
+            if dimension in df.columns:
+                frame[dimension] = df[dimension]
+            elif dimension == "month" and date_col in df.columns:
+                frame[dimension] = month_column(df[date_col])
+        dimensions = list(frame)
+        measures = [m for m in measures if m in df.columns]
+
+        named = {"n_rows": (dimensions[0], "size")}
+        for measure in measures:
+            values = pd.to_numeric(df[measure], errors="coerce").astype(float)
+            frame[measure] = values
+            frame[f"{measure}__sq"] = values**2
+            named[f"{measure}_count"] = (measure, "count")
+            named[f"{measure}_sum"] = (measure, "sum")
+            named[f"{measure}_sumsq"] = (f"{measure}__sq", "sum")
+            named[f"{measure}_min"] = (measure, "min")
+            named[f"{measure}_max"] = (measure, "max")
+
+        cells = (
+            pd.DataFrame(frame, index=df.index)
+            .groupby(dimensions, observed=True, dropna=False, sort=False)
+            .agg(**named)
+            .reset_index()
+        )
+        return cls(cells, dimensions, measures)
+
+    def covers(self, by, measure=None) -> bool:
+        """Whether the cube can answer a grouping by 'by' (and stats of 'measure')."""
+        by = [by] if isinstance(by, str) else list(by)
+        return set(by) <= set(self.dimensions) and (
+            measure is None or measure in self.measures
+        )
+
+    def rollup(self, by) -> pd.DataFrame:
+        """
+        Cells summed up to the 'by' dimensions, sorted by key like 'groupby'.
+
+        Rows with a missing key are dropped, as 'groupby' does by default. Rollups are
+        kept, so repeated queries on the same dimensions do not re-group the cells.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        if tuple(by) in self._rollups:
+            return self._rollups[tuple(by)]
+        how = {"n_rows": "sum"}
+        for measure in self.measures:
+            for aggregate in AGGREGATES:
+                how[f"{measure}_{aggregate}"] = (
+                    aggregate if aggregate in ("min", "max") else "sum"
+                )
+        self._rollups[tuple(by)] = self.cells.groupby(by, observed=True).agg(how)
+        return self._rollups[tuple(by)]
+
+    def stats(self, by, measure: str) -> pd.DataFrame:
+        """
+        Count, mean, sample std, min and max of 'measure' per group.
+
+        :return: DataFrame indexed by the 'by' dimensions with columns n_rows, count,
+            mean, std, min and max
+        """
+        rolled = self.rollup(by)
+        count = rolled[f"{measure}_count"]
+        total = rolled[f"{measure}_sum"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+            variance = (rolled[f"{measure}_sumsq"] - total * mean) / (count - 1)
+        return pd.DataFrame(
+            {
+                "n_rows": rolled["n_rows"],
+                "count": count,
+                "mean": mean.where(count > 0),
+                # Cancellation can leave tiny negative variances for constant groups
+                "std": np.sqrt(variance.clip(lower=0)).where(count > 1),
+                "min": rolled[f"{measure}_min"],
+                "max": rolled[f"{measure}_max"],
+            }
+        )
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+from src.data.tokenizer import EncodedTokens
+from src.eda.distinctive_terms import SCORERS, top_terms
+
+
+class DocTermIndex:
+    def __init__(self, tokens):
+        """
+        Sparse review x term count matrix, built once from a tokens column.
+
+        Term ids follow first occurrence in the token stream, and every (review, term)
+        also keeps the position of its first occurrence, so rankings break ties exactly
+        like 'collections.Counter.most_common' over the same reviews.
+
+        :param tokens: Series of token lists, or an 'EncodedTokens'
+        """
+        encoded = (
+            tokens
+            if isinstance(tokens, EncodedTokens)
+            else EncodedTokens.from_lists(tokens)
+        )
+        self.vocabulary = encoded.vocabulary
+        self.index = encoded.index
+        shape = (len(encoded), len(encoded.vocabulary))
+        rows = encoded.row_ids()
+
+        self.counts = csr_matrix(
+            (np.ones(len(encoded.ids), dtype=np.int64), (rows, encoded.ids)),
+            shape=shape,
+        )
+
+        # First stream position of each (review, term), stored as 'n_tokens - position'
+        # so a column-wise max gives the earliest occurrence (implicit zeros lose)
+        first = ~pd.DataFrame({"row": rows, "term": encoded.ids}).duplicated()
+        positions = np.flatnonzero(first.to_numpy())
+        self._first_seen = csr_matrix(
+            (
+                len(encoded.ids) - positions,
+                (rows[positions], encoded.ids[positions]),
+            ),
+            shape=shape,
+        )
+
+    def _row_positions(self, rows) -> np.ndarray:
+        if rows is None:
+            return None
+        rows = np.asarray(rows)
+        return np.flatnonzero(rows) if rows.dtype == bool else rows
+
+    def term_counts(self, rows=None) -> np.ndarray:
+        """Occurrences of every term over all reviews, or over a boolean mask/positions."""
+        rows = self._row_positions(rows)
+        matrix = self.counts if rows is None else self.counts[rows]
+        return np.asarray(matrix.sum(axis=0)).ravel()
+
+    def _rank(self, counts: np.ndarray, rows, n: int) -> list:
+        present = np.flatnonzero(counts)
+        if n < len(present):
+            # Only terms reaching the n-th highest count can make the top n
+            cutoff = np.partition(counts[present], -n)[-n]
+            present = present[counts[present] >= cutoff]
+        seen = self._first_seen if rows is None else self._first_seen[rows]
+        latest_first = np.asarray(seen[:, present].max(axis=0).todense()).ravel()
+        # Highest count first, then earliest first occurrence
+        order = present[np.lexsort((-latest_first, -counts[present]))][:n]
+        return [(self.vocabulary[i], int(counts[i])) for i in order]
+
+    def most_common(self, n: int = 10, rows=None) -> list:
+        """Same result as Counter(tokens of the selected reviews).most_common(n)."""
+        rows = self._row_positions(rows)
+        return self._rank(self.term_counts(rows), rows, n)
+
+    def frequencies(self, rows=None) -> dict:
+        """Term -> count of the selected reviews, in first-occurrence order like a Counter."""
+        rows = self._row_positions(rows)
+        counts = self.term_counts(rows)
+        if rows is None:
+            return dict(zip(self.vocabulary.tolist(), counts.tolist()))
+        return dict(self._rank(counts, rows, len(counts)))
+
+    def _group_indicator(self, labels) -> tuple:
+        codes, groups = pd.factorize(pd.Series(labels).to_numpy())
+        valid = np.flatnonzero(codes >= 0)
+        indicator = csr_matrix(
+            (np.ones(len(valid), dtype=np.int64), (codes[valid], valid)),
+            shape=(len(groups), self.counts.shape[0]),
+        )
+        return pd.Index(groups), indicator
+
+    def group_term_counts(self, labels) -> tuple:
+        """
+        Term sums per group with one sparse product (group indicator x counts).
+
+        :param labels: Group label of every review (e.g. the 'offer' column); missing
+            labels belong to no group
+        :return: (groups Index, groups x terms CSR matrix of counts)
+        """
+        groups, indicator = self._group_indicator(labels)
+        return groups, indicator @ self.counts
+
+    def most_common_by_group(self, labels, groups=None, n: int = 10) -> dict:
+        """
+        Top terms of several groups from a single group-by product.
+
+        :param groups: Groups to rank (default: all groups, in order of appearance)
+        :return: Dict group -> list of (term, count), as 'Counter.most_common(n)'
+        """
+        all_groups, indicator = self._group_indicator(labels)
+        sums = indicator @ self.counts
+        result = {}
+        for group in all_groups if groups is None else groups:
+            if group not in all_groups:
+                result[group] = []
+                continue
+            position = all_groups.get_loc(group)
+            rows = indicator[position].indices
+            counts = sums[position].toarray().ravel()
+            result[group] = self._rank(counts, rows, n)
+        return result
+
+    def distinctive_terms(
+        self,
+        labels,
+        groups=None,
+        n: int = 10,
+        method: str = "log_odds",
+        min_count: int = 1,
+    ) -> dict:
+        """
+        Terms that set each group apart from the others, scored for all groups at once.
+
+        :param method: 'log_odds' (weighted log-odds with informative prior) or
+            'tfidf' (class-based TF-IDF), see 'src.eda.distinctive_terms'
+        :param groups: Groups to report (default: all groups, in order of appearance)
+        :param min_count: Minimum occurrences of a term within a group
+        :return: Dict group -> list of (term, score), best first
+        """
+        if method not in SCORERS:
+            raise ValueError(f"method must be one of {sorted(SCORERS)}")
+        all_groups, sums = self.group_term_counts(labels)
+        scores = SCORERS[method](sums)
+        result = top_terms(scores, sums, self.vocabulary, all_groups, n, min_count)
+        if groups is None:
+            return result
+        return {group: result.get(group, []) for group in groups}
@@ -1,35 +1,61 @@
 import pandas as pd
-from collections import Counter
 import matplotlib.pyplot as plt
 from wordcloud import WordCloud
+from src.eda.sampling import Z_95, StratifiedSample
+from src.eda.term_index import DocTermIndex
 
 
 class ReviewAnalysis:
-    def __init__(self, df):
+    def __init__(self, df, sample_size=None, seed=0):
         """
         Initializes the ReviewAnalysis class with the provided DataFrame.
 
         :param df: DataFrame containing review data, including a 'tokens' column.
+        :param sample_size: Opt-in: analyze a reproducible stratified sample of about
+            this many reviews (by offer, destination, language and month) when df is
+            larger. Word counts are then counts within the sample, review counts are
+            population estimates with 95% errors, and outputs note the sample.
+        :param seed: Sampling seed
         """
+        self.sample = None
+        if sample_size is not None and len(df) > sample_size:
+            self.sample = StratifiedSample(df, sample_size, seed=seed)
+            df = self.sample.frame
         self.df = df
+        self._term_index = None
+
+    def _print_sample(self):
+        if self.sample is not None:
+            print(self.sample.annotation())
+
+    def _annotate_figure(self):
+        if self.sample is not None:
+            plt.figtext(
+                0.99, 0.005, self.sample.annotation(), ha="right", fontsize=8, alpha=0.7
+            )
+
+    @property
+    def term_index(self) -> DocTermIndex:
+        """
+        Sparse review x term index of the 'tokens' column, built on first use and
+        shared by every query below (rankings match 'Counter.most_common').
+        """
+        if self._term_index is None:
+            self._term_index = DocTermIndex(self.df["tokens"])
+        return self._term_index
 
     def extract_most_common_words(self):
         """
         Extracts and returns the most common words across all reviews.
         """
-        # Extract all tokens from the 'tokens' column
-        all_tokens = [token for tokens in self.df["tokens"] for token in tokens]
-
-        # Count the frequency of each word using Counter
-        word_freq = Counter(all_tokens)
-
         # Get the 10 most common words
-        most_common = word_freq.most_common(10)
+        most_common = self.term_index.most_common(10)
 
         # Print the top 10 most common words
         print("=" * 100)
         print("TOP 10 MOST COMMON WORDS ACROSS ALL REVIEWS")
         print("=" * 100)
+        self._print_sample()
         for i, (word, count) in enumerate(most_common, 1):
             print(f"{i:2d}. {word:20s} - {count:,} occurrences")
 
@@ -43,12 +69,9 @@ class ReviewAnalysis:
         """
         Visualizes the top words using both a bar chart and a word cloud.
         """
-        # Extract all tokens from the 'tokens' column and count word frequencies
-        all_tokens = [token for tokens in self.df["tokens"] for token in tokens]
-        word_freq = Counter(all_tokens)
-
-        # Get the 10 most common words
-        most_common = word_freq.most_common(10)
+        # Word frequencies and the 10 most common words from the term index
+        word_freq = self.term_index.frequencies()
+        most_common = self.term_index.most_common(10)
 
         # Create a DataFrame for easier analysis
         common_words_df = pd.DataFrame(most_common, columns=["Word", "Frequency"])
@@ -85,6 +108,7 @@ class ReviewAnalysis:
         axes[1].set_title(
             "Word Cloud of Most Common Terms", fontsize=14, fontweight="bold"
         )
+        self._annotate_figure()
 
         # Adjust layout to make sure everything fits
         plt.tight_layout()
@@ -100,40 +124,79 @@ class ReviewAnalysis:
         :param category_value: The value within the column to filter by (e.g., 'hotel', 'Paris')
         :param top_n: The number of top words to return (default is 20)
         """
-        # Filter the DataFrame for the specific category (offering type)
-        subset = self.df[self.df[category_column] == category_value]
-
-        # Extract all tokens from the 'tokens' column
-        tokens = [token for tokens in subset["tokens"] for token in tokens]
-
-        # Count the frequency of each word using Counter
-        return Counter(tokens).most_common(top_n)
+        # Rows of the specific category (offering type)
+        mask = (self.df[category_column] == category_value).to_numpy(
+            dtype=bool, na_value=False
+        )
+        return self.term_index.most_common(top_n, rows=mask)
 
-    def keyword_analysis(self, category_column, top_n=5, top_words_count=15):
+    def keyword_analysis(
+        self, category_column, top_n=5, top_words_count=15, method=None, min_count=5
+    ):
         """
         Performs keyword analysis for a specific category column (e.g., offering type or destination).
 
         :param category_column: The column name to analyze (e.g., 'offer' or 'destination')
         :param top_n: Number of top categories to analyze (default is 5)
         :param top_words_count: Number of top words to extract per category (default is 15)
+        :param method: None for raw word counts, or 'log_odds' / 'tfidf' for the words
+            that distinguish each category from the others
+        :param min_count: Minimum occurrences of a distinctive word within a category
         """
         print("=" * 100)
-        print(f"TOP KEYWORDS BY {category_column.upper()}")
+        title = "TOP KEYWORDS" if method is None else "DISTINCTIVE KEYWORDS"
+        print(f"{title} BY {category_column.upper()}")
         print("=" * 100)
+        self._print_sample()
+
+        # Top words of the top 'n' categories (by review count) in one group-by pass
+        categories = self.df[category_column].value_counts().head(top_n).index
+        if method is None:
+            top_words_by_category = self.term_index.most_common_by_group(
+                self.df[category_column], groups=categories, n=top_words_count
+            )
+        else:
+            top_words_by_category = self.term_index.distinctive_terms(
+                self.df[category_column],
+                groups=categories,
+                n=top_words_count,
+                method=method,
+                min_count=min_count,
+            )
 
-        # Loop through the top 'n' categories based on review count
-        for category_value in self.df[category_column].value_counts().head(top_n).index:
+        for category_value, top_words in top_words_by_category.items():
             print(f"\n{category_value.upper()}:")
             print("-" * 100)
 
-            # Get the top words for each category
-            top_words = self.get_top_words_by_category(
-                category_column, category_value, top_words_count
-            )
+            # Print the top words and their frequencies (or scores)
+            for i, (word, value) in enumerate(top_words, 1):
+                if method is None:
+                    print(f"  {i:2d}. {word:15s} ({value:,} times)")
+                else:
+                    print(f"  {i:2d}. {word:15s} (score {value:.4g})")
+
+    def distinctive_keywords(
+        self, category_column, method="log_odds", top_words_count=15, min_count=5
+    ):
+        """
+        Distinctive words of every category, scored in one pass over the term index.
 
-            # Print the top words and their frequencies
-            for i, (word, count) in enumerate(top_words, 1):
-                print(f"  {i:2d}. {word:15s} ({count:,} times)")
+        :param category_column: The column name to group by (e.g., 'offer' or 'destination')
+        :param method: 'log_odds' (weighted log-odds) or 'tfidf' (class-based TF-IDF)
+        :return: DataFrame with category, rank, word and score columns
+        """
+        top_words_by_category = self.term_index.distinctive_terms(
+            self.df[category_column],
+            n=top_words_count,
+            method=method,
+            min_count=min_count,
+        )
+        rows = [
+            (category, rank, word, score)
+            for category, top_words in top_words_by_category.items()
+            for rank, (word, score) in enumerate(top_words, 1)
+        ]
+        return pd.DataFrame(rows, columns=[category_column, "rank", "word", "score"])
 
     def generate_word_clouds_by_offering(self, top_n=4):
         """
@@ -141,8 +204,22 @@ class ReviewAnalysis:
 
         :param top_n: The number of offering types to display (default is 4)
         """
-        # Get the top 'n' most common offerings
-        offerings = self.df["offer"].value_counts().head(top_n).index
+        # Get the top 'n' most common offerings and their top 100 words
+        if self.sample is None:
+            review_counts = self.df["offer"].value_counts().head(top_n)
+            review_labels = review_counts.map("{:,} reviews".format)
+        else:
+            estimates = self.sample.counts("offer").head(top_n)
+            review_counts = estimates["count"]
+            review_labels = [
+                f"~{count:,.0f} ± {Z_95 * se:,.0f} reviews"
+                for count, se in estimates.itertuples(index=False)
+            ]
+            review_labels = pd.Series(review_labels, index=estimates.index)
+        offerings = review_counts.index
+        top_words_by_offering = self.term_index.most_common_by_group(
+            self.df["offer"], groups=offerings, n=100
+        )
 
         # Create subplots to display word clouds for each offering type
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
@@ -150,14 +227,7 @@ class ReviewAnalysis:
 
         # Iterate over each offering type and generate a word cloud
         for idx, offering in enumerate(offerings):
-            # Filter data for the current offering type
-            subset = self.df[self.df["offer"] == offering]
-
-            # Flatten tokens for this subset
-            tokens = [token for tokens in subset["tokens"] for token in tokens]
-
-            # Count word frequencies
-            word_freq = Counter(tokens)
+            word_freq = dict(top_words_by_offering[offering])
 
             # If there are tokens in the subset, generate the word cloud
             if word_freq:
@@ -168,12 +238,12 @@ class ReviewAnalysis:
                     colormap="plasma",
                     max_words=80,
                     font_path="C:/Windows/Fonts/arial.ttf",
-                ).generate_from_frequencies(dict(word_freq.most_common(100)))
+                ).generate_from_frequencies(word_freq)
 
                 # Display word cloud for this offering type
                 axes[idx].imshow(wordcloud, interpolation="bilinear")
                 axes[idx].set_title(
-                    f"{offering}\n({len(subset):,} reviews)",
+                    f"{offering}\n({review_labels[offering]})",
                     fontsize=12,
                     fontweight="bold",
                 )
@@ -183,6 +253,7 @@ class ReviewAnalysis:
         plt.suptitle(
             "Word Clouds by Offering Type", fontsize=16, fontweight="bold", y=0.98
         )
+        self._annotate_figure()
 
         # Adjust layout to ensure titles and labels fit
         plt.tight_layout()
@@ -1,30 +1,99 @@
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import warnings
+from src.eda.sampling import Z_95, StratifiedSample
 
-# Suppress warnings
-warnings.filterwarnings("ignore")
 
-# Set the visual style for the plots
-plt.style.use("seaborn-v0_8-darkgrid")
-sns.set_palette("husl")
+def configure_display():
+    """
+    Applies the notebook plot style and pandas display options.
 
-# Configure display options for better readability in the notebook
-pd.set_option("display.max_columns", None)
-pd.set_option("display.max_colwidth", 100)
+    Kept out of import time so importing this module has no global side effects;
+    the EDA notebook sets the same options in its first cell.
+    """
+    # Suppress warnings
+    warnings.filterwarnings("ignore")
 
-print("✓ Libraries imported successfully")
+    # Set the visual style for the plots
+    plt.style.use("seaborn-v0_8-darkgrid")
+    sns.set_palette("husl")
+
+    # Configure display options for better readability in the notebook
+    pd.set_option("display.max_columns", None)
+    pd.set_option("display.max_colwidth", 100)
 
 
 class ReviewDataVisualizer:
-    def __init__(self, df):
+    def __init__(self, df, sample_size=None, seed=0):
+        """
+        :param df: Review DataFrame
+        :param sample_size: Opt-in: plot a reproducible stratified sample of about this
+            many rows (by offer, destination, language and month) when df is larger.
+            Counts are then population estimates with 95% error bars and every figure
+            carries a footer describing the sample.
+        :param seed: Sampling seed
+        """
+        self.sample = None
+        if sample_size is not None and len(df) > sample_size:
+            self.sample = StratifiedSample(df, sample_size, seed=seed)
+            df = self.sample.frame
         self.df = df
 
+    def _counts(self, column) -> tuple:
+        """Value counts of a column (estimated when sampled) and their 95% errors."""
+        if self.sample is None:
+            return self.df[column].value_counts(), None
+        counts = self.sample.counts(column)
+        return counts["count"], Z_95 * counts["se"]
+
+    def _weights(self, mask=None):
+        if self.sample is None:
+            return None
+        weights = self.df["sample_weight"]
+        return weights if mask is None else weights[mask]
+
+    def _total(self) -> int:
+        return len(self.df) if self.sample is None else self.sample.population_size
+
+    def _mean(self, column) -> float:
+        if self.sample is None:
+            return self.df[column].mean()
+        return self.sample.mean(column)[0]
+
+    def _quantile(self, column, q) -> float:
+        """Quantile of a column, weighted by 'sample_weight' when sampled."""
+        if self.sample is None:
+            return self.df[column].quantile(q)
+        return self.sample.quantile(column, q)
+
+    def _std(self, column) -> float:
+        if self.sample is None:
+            return self.df[column].std()
+        return self.sample.std(column)
+
+    def _extreme_label(self, value) -> str:
+        """Min and max are only seen in the sample, so say so when sampled."""
+        return f"{value}" if self.sample is None else f"{value} (in sample)"
+
+    def _mean_label(self, column, fmt=".1f") -> str:
+        if self.sample is None:
+            return f"{self.df[column].mean():{fmt}}"
+        mean, se = self.sample.mean(column)
+        return f"{mean:{fmt}} ± {Z_95 * se:{fmt}}"
+
+    def _annotate(self):
+        """Footer describing the sample, so sampled figures are never mistaken."""
+        if self.sample is not None:
+            plt.figtext(
+                0.99, 0.005, self.sample.annotation(), ha="right", fontsize=8, alpha=0.7
+            )
+
     def plot_language_distribution(self):
         """Plot the distribution of languages (Arabic vs English)."""
-        lang_counts = self.df["language"].value_counts()
-        total_reviews = len(self.df)
+        lang_counts, _ = self._counts("language")
+        total_reviews = self._total()
 
         # Pie chart for language distribution
         plt.figure(figsize=(8, 6))
@@ -39,6 +108,7 @@ class ReviewDataVisualizer:
             textprops={"fontsize": 12, "fontweight": "bold"},
         )
         plt.title("Language Distribution", fontsize=14, fontweight="bold", pad=20)
+        self._annotate()
         plt.tight_layout()
         plt.show()
 
@@ -46,10 +116,10 @@ class ReviewDataVisualizer:
         arabic_reviews = lang_counts.get("ara", 0)
         english_reviews = lang_counts.get("eng", 0)
         print(
-            f"Arabic reviews: {arabic_reviews:,} ({(arabic_reviews/total_reviews)*100:.1f}%)"
+            f"Arabic reviews: {arabic_reviews:,.0f} ({(arabic_reviews/total_reviews)*100:.1f}%)"
         )
         print(
-            f"English reviews: {english_reviews:,} ({(english_reviews/total_reviews)*100:.1f}%)"
+            f"English reviews: {english_reviews:,.0f} ({(english_reviews/total_reviews)*100:.1f}%)"
         )
 
     def plot_rating_distribution(self):
@@ -77,24 +147,25 @@ class ReviewDataVisualizer:
         # Histogram with KDE
         axes[1].hist(
             self.df["normalized_ratings"],
+            weights=self._weights(),
             bins=20,
             color="steelblue",
             alpha=0.7,
             edgecolor="black",
         )
         axes[1].axvline(
-            self.df["normalized_ratings"].mean(),
+            self._mean("normalized_ratings"),
             color="red",
             linestyle="--",
             linewidth=2,
-            label=f'Mean: {self.df["normalized_ratings"].mean():.1f}',
+            label=f'Mean: {self._mean_label("normalized_ratings")}',
         )
         axes[1].axvline(
-            self.df["normalized_ratings"].median(),
+            self._quantile("normalized_ratings", 0.5),
             color="green",
             linestyle="--",
             linewidth=2,
-            label=f'Median: {self.df["normalized_ratings"].median():.1f}',
+            label=f'Median: {self._quantile("normalized_ratings", 0.5):.1f}',
         )
         axes[1].set_xlabel("Rating (Normalized 0-100)", fontsize=12)
         axes[1].set_ylabel("Frequency", fontsize=12)
@@ -104,22 +175,27 @@ class ReviewDataVisualizer:
         axes[1].legend(fontsize=10)
         axes[1].grid(axis="y", alpha=0.3)
 
+        self._annotate()
         plt.tight_layout()
         plt.show()
 
         # Print statistics
-        print(f"Mean rating: {self.df['normalized_ratings'].mean():.2f}")
-        print(f"Median rating: {self.df['normalized_ratings'].median():.2f}")
-        print(f"Std deviation: {self.df['normalized_ratings'].std():.2f}")
+        if self.sample is not None:
+            print(self.sample.annotation())
+        print(f"Mean rating: {self._mean_label('normalized_ratings', '.2f')}")
+        print(f"Median rating: {self._quantile('normalized_ratings', 0.5):.2f}")
+        print(f"Std deviation: {self._std('normalized_ratings'):.2f}")
 
     def plot_top_destinations(self, top_n=10):
         """Plot the top N destinations based on review count."""
-        dest_counts = self.df["destination"].value_counts().head(top_n)
+        dest_counts, errors = self._counts("destination")
+        dest_counts = dest_counts.head(top_n)
 
         plt.figure(figsize=(12, 7))
         bars = plt.barh(
             range(len(dest_counts)),
             dest_counts.values,
+            xerr=None if errors is None else errors[dest_counts.index].values,
             color="coral",
             edgecolor="darkred",
             alpha=0.8,
@@ -138,21 +214,28 @@ class ReviewDataVisualizer:
         # Add value labels on bars
         for i, (bar, count) in enumerate(zip(bars, dest_counts.values)):
             plt.text(
-                count + 20, i, f"{count:,}", va="center", fontsize=10, fontweight="bold"
+                count + 20,
+                i,
+                f"{count:,.0f}",
+                va="center",
+                fontsize=10,
+                fontweight="bold",
             )
 
+        self._annotate()
         plt.tight_layout()
         plt.show()
 
     def plot_offering_distribution(self):
         """Plot the distribution of review counts for each offering."""
-        offer_counts = self.df["offer"].value_counts()
+        offer_counts, errors = self._counts("offer")
 
         plt.figure(figsize=(12, 7))
         colors = ["#FF6B6B", "#4ECDC4", "#45B7D1", "#96CEB4", "#FFEAA7", "#DFE6E9"]
         bars = plt.bar(
             range(len(offer_counts)),
             offer_counts.values,
+            yerr=None if errors is None else errors.values,
             color=colors[: len(offer_counts)],
             edgecolor="black",
             alpha=0.8,
@@ -176,13 +259,14 @@ class ReviewDataVisualizer:
             plt.text(
                 bar.get_x() + bar.get_width() / 2.0,
                 height + 50,
-                f"{count:,}",
+                f"{count:,.0f}",
                 ha="center",
                 va="bottom",
                 fontsize=10,
                 fontweight="bold",
             )
 
+        self._annotate()
         plt.tight_layout()
         plt.show()
 
@@ -191,8 +275,10 @@ class ReviewDataVisualizer:
         fig, axes = plt.subplots(1, figsize=(16, 6))
 
         # Focus on reviews with 0-100 words for a zoomed-in view
+        short = self.df["word_count"] <= 100
         axes.hist(
-            self.df[self.df["word_count"] <= 100]["word_count"],
+            self.df[short]["word_count"],
+            weights=self._weights(short),
             bins=50,
             color="mediumpurple",
             alpha=0.7,
@@ -201,18 +287,18 @@ class ReviewDataVisualizer:
 
         # Plot the median and mean lines
         axes.axvline(
-            self.df["word_count"].median(),
+            self._quantile("word_count", 0.5),
             color="red",
             linestyle="--",
             linewidth=2,
-            label=f'Median: {self.df["word_count"].median():.0f}',
+            label=f'Median: {self._quantile("word_count", 0.5):.0f}',
         )
         axes.axvline(
-            self.df["word_count"].mean(),
+            self._mean("word_count"),
             color="green",
             linestyle="--",
             linewidth=2,
-            label=f'Mean: {self.df["word_count"].mean():.1f}',
+            label=f'Mean: {self._mean_label("word_count")}',
         )
 
         axes.set_xlabel("Word Count", fontsize=12, fontweight="bold")
@@ -225,24 +311,29 @@ class ReviewDataVisualizer:
         axes.legend(fontsize=11)
         axes.grid(axis="y", alpha=0.3)
 
+        self._annotate()
         plt.tight_layout()
         plt.show()
 
         # Print word count statistics
-        print(f"Average word count: {self.df['word_count'].mean():.1f}")
-        print(f"Median word count: {self.df['word_count'].median():.0f}")
-        print(f"Max word count: {self.df['word_count'].max()}")
-        print(f"Min word count: {self.df['word_count'].min()}")
-        print(f"95th percentile: {self.df['word_count'].quantile(0.95):.0f}")
-        print(
-            f"% of reviews with ≤100 words: {(self.df['word_count'] <= 100).sum() / len(self.df) * 100:.1f}%"
-        )
+        if self.sample is not None:
+            print(self.sample.annotation())
+        print(f"Average word count: {self._mean_label('word_count')}")
+        print(f"Median word count: {self._quantile('word_count', 0.5):.0f}")
+        print(f"Max word count: {self._extreme_label(self.df['word_count'].max())}")
+        print(f"Min word count: {self._extreme_label(self.df['word_count'].min())}")
+        print(f"95th percentile: {self._quantile('word_count', 0.95):.0f}")
+        short_share = np.average(self.df["word_count"] <= 100, weights=self._weights())
+        print(f"% of reviews with ≤100 words: {short_share * 100:.1f}%")
 
     def plot_reviews_over_time(self):
         """Plot the number of reviews over time."""
-        self.df["date"] = pd.to_datetime(self.df["date"])
+        # Dates from 'load_reviews' are already parsed
+        if not pd.api.types.is_datetime64_any_dtype(self.df["date"]):
+            self.df["date"] = pd.to_datetime(self.df["date"])
         self.df["year_month"] = self.df["date"].dt.to_period("M")
-        time_dist = self.df["year_month"].value_counts().sort_index()
+        time_dist, errors = self._counts("year_month")
+        time_dist = time_dist.sort_index()
 
         plt.figure(figsize=(16, 7))
         plt.plot(
@@ -259,13 +350,23 @@ class ReviewDataVisualizer:
         plt.fill_between(
             range(len(time_dist)), time_dist.values, alpha=0.3, color="lightgreen"
         )
+        if errors is not None:
+            errors = errors[time_dist.index].values
+            plt.fill_between(
+                range(len(time_dist)),
+                time_dist.values - errors,
+                time_dist.values + errors,
+                alpha=0.3,
+                color="darkgreen",
+                label="95% interval",
+            )
 
         # Add value labels on each point
         for i, value in enumerate(time_dist.values):
             plt.text(
                 i,
                 value + 10,
-                str(value),
+                str(round(value)),
                 ha="center",
                 va="bottom",
                 fontsize=14,
@@ -287,12 +388,13 @@ class ReviewDataVisualizer:
             fontsize=9,
         )
 
+        self._annotate()
         plt.tight_layout()
         plt.show()
 
         # Print statistics
         print(f"Date range: {time_dist.index[0]} to {time_dist.index[-1]}")
-        print(f"Peak month: {time_dist.idxmax()} with {time_dist.max():,} reviews")
+        print(f"Peak month: {time_dist.idxmax()} with {time_dist.max():,.0f} reviews")
         print(f"Average reviews per month: {time_dist.mean():.0f}")
 
     def plot_all(self):
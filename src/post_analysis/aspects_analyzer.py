@@ -1,28 +1,63 @@
-from src.post_analysis.utils import display_arabic
+from src.post_analysis.utils import display_arabic_labels
+from src.post_analysis.polarity_aggregates import (
+    POLARITIES,
+    POLARITY_COUNTS,
+    PolarityAggregates,
+)
 import matplotlib.pyplot as plt
 from src.post_analysis.config import sns
 
 
 class AspectVisualization:
-    def __init__(self, aspect_df):
+    # Columns loaded when the class is built from a ResultStore
+    STORE_COLUMNS = ["aspect_normalized", "polarity", "model"]
+
+    def __init__(self, aspect_df, aggregates=None):
         """
         Initializes the AspectVisualization class with the given dataframe.
 
         :param aspect_df: DataFrame containing aspect information, including 'aspect_normalized' and 'polarity'
+        :param aggregates: Precomputed PolarityAggregates of aspect_df (e.g. shared with the other visualizers); built on first use otherwise
         """
         self.aspect_df = aspect_df
-        self.top_aspects = self.aspect_df["aspect_normalized"].value_counts().head(20)
-        self.absa_df = self.aspect_df.loc[self.aspect_df.model == "pyabsa-multilingual"]
+        self._aggregates = aggregates
+
+    @property
+    def aggregates(self) -> PolarityAggregates:
+        if self._aggregates is None:
+            self._aggregates = PolarityAggregates.from_frame(self.aspect_df)
+        return self._aggregates
+
+    @property
+    def top_aspects(self):
+        return self.aggregates.top("aspect_normalized", n=20)
+
+    @classmethod
+    def from_store(cls, store, **filters):
+        """
+        Builds the class from a ResultStore, loading only the rows and columns it needs.
+
+        :param store: ResultStore holding the predictions
+        :param filters: Column filters forwarded to 'ResultStore.query' (e.g. offer="Retail")
+        """
+        return cls(store.query(columns=cls.STORE_COLUMNS, **filters))
 
     def plot_polarity_distribution(self):
-        """Plots the distribution of polarity in the ABSA dataset."""
-        plt.figure(figsize=(10, 6))
-        sns.countplot(
-            data=self.absa_df,
-            x="polarity",
-            order=self.absa_df["polarity"].value_counts().index,
-            palette="viridis",
+        """
+        Plots the distribution of polarity in the ABSA dataset.
+
+        Labels are compared case-insensitively; labels outside POLARITIES share one
+        'Other' bar, drawn when any exist.
+        """
+        counts = (
+            self.aggregates.counts("model")
+            .reindex(["pyabsa-multilingual"], fill_value=0)[list(POLARITY_COUNTS)]
+            .iloc[0]
         )
+        counts = counts[counts > 0].sort_values(ascending=False, kind="stable")
+
+        plt.figure(figsize=(10, 6))
+        sns.barplot(x=counts.index.str.capitalize(), y=counts.values, palette="viridis")
         plt.title("Aspect Polarity Distribution (ABSA)", fontsize=16)
         plt.xlabel("Polarity", fontsize=14)
         plt.ylabel("Count", fontsize=14)
@@ -32,7 +67,7 @@ class AspectVisualization:
         """Plots the most mentioned 20 aspects (normalized) from the aspect dataset."""
         # Apply Arabic fix only to aspect labels (index)
         top_aspects_ar = self.top_aspects.copy()
-        top_aspects_ar.index = [display_arabic(x) for x in self.top_aspects.index]
+        top_aspects_ar.index = display_arabic_labels(self.top_aspects.index)
 
         plt.figure(figsize=(10, 6))
         sns.barplot(x=top_aspects_ar.values, y=top_aspects_ar.index, palette="Blues_d")
@@ -45,18 +80,28 @@ class AspectVisualization:
 
     def plot_polarity_by_top_aspects(self):
         """Plots the polarity distribution by the most mentioned aspects."""
-        top_list = set(self.top_aspects.index)
-        sub = self.aspect_df[self.aspect_df["aspect_normalized"].isin(top_list)].copy()
+        top_aspects = self.top_aspects
+        counts = self.aggregates.counts("aspect_normalized").loc[
+            top_aspects.index, list(POLARITIES)
+        ]
+        sub = (
+            counts.rename(columns=str.capitalize)
+            .rename_axis(columns="polarity")
+            .stack()
+            .rename("n")
+            .reset_index()
+        )
 
         # Add a reshaped version just for display
-        sub["aspect_ar"] = sub["aspect_normalized"].apply(display_arabic)
+        sub["aspect_ar"] = display_arabic_labels(sub["aspect_normalized"])
 
         plt.figure(figsize=(12, 8))
-        sns.countplot(
-            data=sub,
+        sns.barplot(
+            data=sub[sub["n"] > 0],
+            x="n",
             y="aspect_ar",
             hue="polarity",
-            order=[display_arabic(x) for x in self.top_aspects.index],
+            order=display_arabic_labels(top_aspects.index),
             palette="Set2",
         )
         plt.title("Polarity by most mentioned aspects", fontsize=16)
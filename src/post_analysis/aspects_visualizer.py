@@ -1,30 +1,45 @@
 import matplotlib.pyplot as plt
 from src.post_analysis.config import sns
-from src.post_analysis.utils import display_arabic
+from src.post_analysis.utils import display_arabic_labels
 import pandas as pd
+from src.post_analysis.polarity_aggregates import PolarityAggregates
 
 
 class AspectAnalysisself:
-    def __init__(self, aspect_df):
+    # Columns loaded when the class is built from a ResultStore
+    STORE_COLUMNS = ["aspect_normalized", "polarity", "offer", "destination", "date"]
+
+    def __init__(self, aspect_df, aggregates=None):
         """
         Initializes the AspectAnalysisself class with the given dataframe.
 
         :param aspect_df: DataFrame containing aspect information, including 'aspect_normalized', 'polarity', 'offer', 'destination'
+        :param aggregates: Precomputed PolarityAggregates of aspect_df (e.g. shared with the other visualizers); built on first use otherwise
         """
         self.aspect_df = aspect_df
+        self._aggregates = aggregates
+
+    @property
+    def aggregates(self) -> PolarityAggregates:
+        if self._aggregates is None:
+            self._aggregates = PolarityAggregates.from_frame(self.aspect_df)
+        return self._aggregates
+
+    @classmethod
+    def from_store(cls, store, **filters):
+        """
+        Builds the class from a ResultStore, loading only the rows and columns it needs.
+
+        :param store: ResultStore holding the predictions
+        :param filters: Column filters forwarded to 'ResultStore.query' (e.g. offer="Retail")
+        """
+        return cls(store.query(columns=cls.STORE_COLUMNS, **filters))
 
     def plot_aspect_mentions(self):
         """Plots the aspect mentions by offering and destination."""
         # Aspect counts by offering and destination
-        by_offering = (
-            self.aspect_df.groupby("offer").size().sort_values(ascending=False).head(15)
-        )
-        by_destination = (
-            self.aspect_df.groupby("destination")
-            .size()
-            .sort_values(ascending=False)
-            .head(20)
-        )
+        by_offering = self.aggregates.top("offer", n=15)
+        by_destination = self.aggregates.top("destination", n=20)
 
         fig, axes = plt.subplots(1, 2, figsize=(14, 6), sharey=True)
 
@@ -54,21 +69,12 @@ class AspectAnalysisself:
 
     def plot_positivity_rate(self):
         """Plots the positivity rate by offering and destination."""
-
-        # Positivity rate calculation function
-        def positivity_rate(g):
-            return g["polarity"].astype(str).str.lower().eq("positive").mean()
-
-        pos_by_off = (
-            self.aspect_df.groupby("offer")
-            .apply(positivity_rate)
-            .sort_values(ascending=False)
-        )
-        pos_by_dest = (
-            self.aspect_df.groupby("destination")
-            .apply(positivity_rate)
-            .sort_values(ascending=False)
+        pos_by_off = self.aggregates.shares("offer")["positive_share"].sort_values(
+            ascending=False, kind="stable"
         )
+        pos_by_dest = self.aggregates.shares("destination")[
+            "positive_share"
+        ].sort_values(ascending=False, kind="stable")
 
         fig, axes = plt.subplots(1, 2, figsize=(14, 6))
 
@@ -102,38 +108,29 @@ class AspectAnalysisself:
     def plot_polarity_share_heatmap(self):
         """Plots the heatmap of polarity share by offering and aspect (top 12 normalized aspects)."""
         # Get the top 12 most normalized aspects
-        focus_aspects = (
-            self.aspect_df["aspect_normalized"].value_counts().head(12).index.tolist()
-        )
-        sub = self.aspect_df[
-            self.aspect_df["aspect_normalized"].isin(focus_aspects)
-        ].copy()
-        sub = sub.dropna(subset=["offer", "aspect_normalized", "polarity"])
-        sub["polarity"] = sub["polarity"].astype(str).str.lower()
+        focus_aspects = self.aggregates.top("aspect_normalized", n=12).index
+
+        counts = self.aggregates.counts(["offer", "aspect_normalized"])
+        counts = counts[
+            counts.index.get_level_values("aspect_normalized").isin(focus_aspects)
+        ]
+        # Shares among the mentions with a polarity label, in polarity order
+        labelled = counts.drop(columns="n_rows")
+        labelled = labelled.loc[labelled.sum(axis=1) > 0]
+        labelled = labelled.loc[:, (labelled > 0).any()]
+        pivot = labelled.div(labelled.sum(axis=1), axis=0)
 
         # Apply Arabic reshaping only to aspect labels
-        sub["aspect_ar"] = sub["aspect_normalized"].apply(display_arabic)
-
-        hm_counts = (
-            sub.groupby(["offer", "aspect_ar", "polarity"]).size().reset_index(name="n")
-        )
-        hm_counts["share"] = hm_counts["n"] / hm_counts.groupby(["offer", "aspect_ar"])[
-            "n"
-        ].transform("sum")
-
-        pivot = hm_counts.pivot_table(
-            index=["offer", "aspect_ar"],
-            columns="polarity",
-            values="share",
-            fill_value=0,
-        )
-
-        # Keep polarity column order if present
-        pol_order = ["positive", "neutral", "negative"]
-        existing = [c for c in pol_order if c in pivot.columns]
-        pivot = pivot.reindex(
-            columns=existing + [c for c in pivot.columns if c not in existing]
+        pivot.index = pd.MultiIndex.from_arrays(
+            [
+                pivot.index.get_level_values("offer"),
+                display_arabic_labels(
+                    pivot.index.get_level_values("aspect_normalized")
+                ),
+            ],
+            names=["offer", "aspect_ar"],
         )
+        pivot = pivot.rename_axis(columns="polarity").sort_index()
 
         # Plot the heatmap
         plt.figure(figsize=(14, 10))
@@ -163,17 +160,9 @@ class AspectAnalysisself:
 
     def plot_monthly_positivity_share(self):
         """Plots the monthly positivity share of aspects."""
-        # Normalize the 'date' to month-period
-        self.aspect_df["month"] = (
-            pd.to_datetime(self.aspect_df["date"]).dt.to_period("M").dt.to_timestamp()
-        )
-
-        # Group by month and calculate the counts and positive share
-        by_month = self.aspect_df.groupby("month").size().rename("count").to_frame()
-
-        # Calculate the share of 'positive' aspects for each month
-        by_month["positive_share"] = self.aspect_df.groupby("month")["polarity"].apply(
-            lambda s: s.str.lower().eq("positive").mean()  # Calculate positivity share
+        # Counts and positive share per month (months come from the 'date' column)
+        by_month = self.aggregates.shares("month")[["n_rows", "positive_share"]].rename(
+            columns={"n_rows": "count"}
         )
 
         # Create the plot with two y-axes
@@ -1,8 +1,49 @@
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
 from src.post_analysis.config import sns
 
+# Above this many rows the 'auto' modes switch from per-row to binned rendering
+MAX_EXACT_ROWS = 50_000
+
+
+def binned_kde(values, grid_size: int = 512, bw_adjust: float = 1.0) -> tuple:
+    """
+    Gaussian KDE evaluated on binned counts, in linear time.
+
+    Values are counted into 'grid_size' bins over their range (one pass) and the counts
+    are convolved with a Gaussian kernel of Scott's bandwidth, so the cost after
+    binning does not depend on the number of values.
+
+    :return: (grid, density) arrays; the density integrates to 1 over the grid
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    low, high = values.min(), values.max()
+    if high == low:
+        high = low + 1.0
+    counts, edges = np.histogram(values, bins=grid_size, range=(low, high))
+    grid = (edges[:-1] + edges[1:]) / 2
+    step = edges[1] - edges[0]
+
+    bandwidth = bw_adjust * values.std(ddof=1) * len(values) ** (-1 / 5)
+    if not bandwidth > 0:
+        bandwidth = step
+    offsets = np.arange(
+        -int(np.ceil(4 * bandwidth / step)), int(np.ceil(4 * bandwidth / step)) + 1
+    )
+    kernel = np.exp(-0.5 * (offsets * step / bandwidth) ** 2)
+    kernel /= kernel.sum()
+    smoothed = np.convolve(counts, kernel, mode="full")
+    center = len(offsets) // 2
+    density = smoothed[center : center + grid_size] / (len(values) * step)
+    return grid, density
+
 
 class ConfidenceEvidenceVisualizer:
+    # Columns loaded when the class is built from a ResultStore
+    STORE_COLUMNS = ["confidence", "evidence_span", "polarity"]
+
     def __init__(self, aspect_df):
         """
         Initializes the ConfidenceEvidenceVisualizer class with the given dataframe.
@@ -11,35 +52,145 @@ class ConfidenceEvidenceVisualizer:
         """
         self.aspect_df = aspect_df
 
-    def plot_confidence_distribution(self):
-        """Plots the confidence distribution."""
+    @classmethod
+    def from_store(cls, store, **filters):
+        """
+        Builds the class from a ResultStore, loading only the rows and columns it needs.
+
+        :param store: ResultStore holding the predictions
+        :param filters: Column filters forwarded to 'ResultStore.query' (e.g. offer="Retail")
+        """
+        return cls(store.query(columns=cls.STORE_COLUMNS, **filters))
+
+    def _resolve(self, mode: str, aggregated: str, exact: str, modes: tuple) -> str:
+        if mode not in ("auto",) + modes:
+            raise ValueError(f"mode must be one of {('auto',) + modes}")
+        if mode != "auto":
+            return mode
+        return aggregated if len(self.aspect_df) > MAX_EXACT_ROWS else exact
+
+    def plot_confidence_distribution(self, mode="auto", bins=20):
+        """
+        Plots the confidence distribution.
+
+        :param mode: 'exact' (seaborn histogram + KDE over all rows), 'binned'
+            (NumPy histogram + KDE on binned counts, linear time) or 'auto' (binned
+            above MAX_EXACT_ROWS rows)
+        """
+        mode = self._resolve(mode, "binned", "exact", ("exact", "binned"))
+        confidence = self.aspect_df["confidence"].dropna()
+
         plt.figure(figsize=(6, 4))
-        sns.histplot(self.aspect_df["confidence"].dropna(), bins=20, kde=True)
+        if mode == "exact":
+            sns.histplot(confidence, bins=bins, kde=True)
+        else:
+            counts, edges = np.histogram(confidence.to_numpy(dtype=float), bins=bins)
+            plt.stairs(counts, edges, fill=True, alpha=0.5)
+            plt.stairs(counts, edges)
+            if len(confidence) > 1:
+                # Scale the density to the histogram's counts, as seaborn does
+                grid, density = binned_kde(confidence)
+                plt.plot(grid, density * len(confidence) * (edges[1] - edges[0]))
         plt.title("Confidence Distribution", fontsize=16)
         plt.xlabel("Confidence", fontsize=14)
         plt.ylabel("Frequency", fontsize=14)
         plt.tight_layout()
         plt.show()
 
-    def plot_evidence_length_vs_confidence(self):
-        """Plots the relationship between evidence length and confidence."""
+    def plot_evidence_length_vs_confidence(self, mode="auto", gridsize=40):
+        """
+        Plots the relationship between evidence length and confidence.
+
+        :param mode: 'points' (one scatter point per row), 'hexbin' or 'hist2d' (one
+            panel of log-scaled bin counts per polarity; drawing cost depends on the
+            grid, not on the row count) or 'auto' (hexbin above MAX_EXACT_ROWS rows).
+            Rows without a polarity get an 'unlabelled' panel.
+        :param gridsize: Bins along the x axis of the aggregated modes
+        """
+        mode = self._resolve(mode, "hexbin", "points", ("points", "hexbin", "hist2d"))
+
         # Create a new column for the length of the evidence span
         self.aspect_df["evidence_len"] = (
             self.aspect_df["evidence_span"].fillna("").str.len()
         )
 
-        plt.figure(figsize=(6, 4))
-        sns.scatterplot(
-            data=self.aspect_df,
-            x="evidence_len",
-            y="confidence",
-            hue="polarity",
-            alpha=0.5,
+        if mode == "points":
+            plt.figure(figsize=(6, 4))
+            sns.scatterplot(
+                data=self.aspect_df,
+                x="evidence_len",
+                y="confidence",
+                hue="polarity",
+                alpha=0.5,
+            )
+            plt.title("Evidence Length vs Confidence", fontsize=16)
+            plt.xlabel("Evidence length (chars)", fontsize=14)
+            plt.ylabel("Confidence", fontsize=14)
+            plt.tight_layout()
+            plt.show()
+            return
+
+        data = self.aspect_df[["evidence_len", "confidence", "polarity"]].dropna(
+            subset=["evidence_len", "confidence"]
         )
-        plt.title("Evidence Length vs Confidence", fontsize=16)
-        plt.xlabel("Evidence length (chars)", fontsize=14)
-        plt.ylabel("Confidence", fontsize=14)
-        plt.tight_layout()
+        if data.empty:
+            # No confidence to bin: say so instead of failing on an empty extent
+            plt.figure(figsize=(6, 4))
+            plt.text(0.5, 0.5, "No aspects with a confidence", ha="center")
+            plt.axis("off")
+            plt.title("Evidence Length vs Confidence", fontsize=16)
+            plt.show()
+            return
+
+        x = data["evidence_len"].to_numpy(dtype=float)
+        y = data["confidence"].to_numpy(dtype=float)
+        extent = (
+            x.min(),
+            max(x.max(), x.min() + 1),
+            y.min(),
+            max(y.max(), y.min() + 1e-6),
+        )
+        # One panel per polarity, plus one for rows without a polarity (code -1)
+        codes, uniques = data["polarity"].factorize(sort=True)
+        panels = [(str(u), codes == code) for code, u in enumerate(uniques)]
+        if (codes < 0).any():
+            panels.append(("unlabelled", codes < 0))
+
+        fig, axes = plt.subplots(
+            1,
+            len(panels),
+            figsize=(4 * len(panels) + 2, 4),
+            sharex=True,
+            sharey=True,
+            squeeze=False,
+        )
+        for ax, (polarity, mask) in zip(axes[0], panels):
+            if mode == "hexbin":
+                image = ax.hexbin(
+                    x[mask],
+                    y[mask],
+                    gridsize=gridsize,
+                    extent=extent,
+                    bins="log",
+                    mincnt=1,
+                    cmap="viridis",
+                )
+            else:
+                counts, x_edges, y_edges = np.histogram2d(
+                    x[mask],
+                    y[mask],
+                    bins=(gridsize, gridsize // 2),
+                    range=[extent[:2], extent[2:]],
+                )
+                counts = np.ma.masked_equal(counts, 0)
+                image = ax.pcolormesh(
+                    x_edges, y_edges, counts.T, norm=LogNorm(vmin=1), cmap="viridis"
+                )
+            ax.set_title(f"{polarity} (n={mask.sum():,})", fontsize=12)
+            ax.set_xlabel("Evidence length (chars)", fontsize=12)
+        axes[0][0].set_ylabel("Confidence", fontsize=12)
+        fig.colorbar(image, ax=axes[0].tolist(), label="Aspects per bin")
+        fig.suptitle("Evidence Length vs Confidence", fontsize=16)
         plt.show()
 
     def plot_all(self):
@@ -1,29 +1,66 @@
 import matplotlib.pyplot as plt
 from src.post_analysis.config import sns
-from src.post_analysis.utils import display_arabic
-import pandas as pd
+from src.post_analysis.utils import display_arabic_labels
+from src.post_analysis.polarity_aggregates import PolarityAggregates
 
 
 class NegativeAnalysisVisualizer:
-    def __init__(self, aspect_df):
+    # Columns loaded when the class is built from a ResultStore
+    STORE_COLUMNS = [
+        "polarity",
+        "aspect_normalized",
+        "offer",
+        "destination",
+        "date",
+        "month",
+    ]
+
+    def __init__(self, aspect_df, aggregates=None):
         """
         Initializes the NegativeAnalysisVisualizer class with the given dataframe.
 
         :param aspect_df: DataFrame containing aspect information, including 'polarity', 'aspect_normalized', 'offer', 'destination', 'confidence', 'evidence_span', and 'month'
+        :param aggregates: Precomputed PolarityAggregates of aspect_df (e.g. shared with the other visualizers); built on first use otherwise
         """
         self.aspect_df = aspect_df
-        self.pol = self.aspect_df["polarity"].astype(str).str.lower().fillna("")
-        self.neg_mask = self.pol.eq("negative")
+        self._aggregates = aggregates
+
+    @property
+    def aggregates(self) -> PolarityAggregates:
+        if self._aggregates is None:
+            self._aggregates = PolarityAggregates.from_frame(self.aspect_df)
+        return self._aggregates
+
+    def negative_share(self, by, min_rows=0):
+        """
+        Mentions and negative share per group, highest share first.
+
+        :param min_rows: Groups with fewer mentions are left out
+        :return: DataFrame with 'n' and 'neg_share'
+        """
+        shares = self.aggregates.shares(by)
+        agg = shares.loc[shares["n_rows"] >= min_rows, ["n_rows", "negative_share"]]
+        return agg.set_axis(["n", "neg_share"], axis=1).sort_values(
+            "neg_share", ascending=False, kind="stable"
+        )
+
+    @classmethod
+    def from_store(cls, store, **filters):
+        """
+        Builds the class from a ResultStore, loading only the rows and columns it needs.
+
+        :param store: ResultStore holding the predictions
+        :param filters: Column filters forwarded to 'ResultStore.query' (e.g. offer="Retail")
+        """
+        return cls(store.query(columns=cls.STORE_COLUMNS, **filters))
 
     def plot_top_negative_aspects(self):
         """Plots the top 20 most negative aspects (normalized)."""
-        neg_aspects = (
-            self.aspect_df[self.neg_mask]["aspect_normalized"].value_counts().head(20)
-        )
+        neg_aspects = self.aggregates.top("aspect_normalized", "negative", n=20)
 
         # Apply Arabic fix only to the aspect labels
         neg_aspects_ar = neg_aspects.copy()
-        neg_aspects_ar.index = [display_arabic(x) for x in neg_aspects.index]
+        neg_aspects_ar.index = display_arabic_labels(neg_aspects.index)
 
         plt.figure(figsize=(8, 6))
         sns.barplot(x=neg_aspects_ar.values, y=neg_aspects_ar.index, color="crimson")
@@ -37,13 +74,7 @@ class NegativeAnalysisVisualizer:
 
     def plot_negative_share_by_offering(self, min_rows=30):
         """Plots the negative share by offering, with a minimum volume filter."""
-        agg = (
-            self.aspect_df.assign(is_neg=self.pol.eq("negative"))
-            .groupby("offer")
-            .agg(n=("is_neg", "size"), neg_share=("is_neg", "mean"))
-            .query("n >= @min_rows")
-            .sort_values("neg_share", ascending=False)
-        )
+        agg = self.negative_share("offer", min_rows)
 
         plt.figure(figsize=(8, 6))
         sns.barplot(
@@ -60,13 +91,7 @@ class NegativeAnalysisVisualizer:
 
     def plot_negative_share_by_destination(self, min_rows=30):
         """Plots the negative share by destination, with a minimum volume filter."""
-        agg_d = (
-            self.aspect_df.assign(is_neg=self.pol.eq("negative"))
-            .groupby("destination")
-            .agg(n=("is_neg", "size"), neg_share=("is_neg", "mean"))
-            .query("n >= @min_rows")
-            .sort_values("neg_share", ascending=False)
-        )
+        agg_d = self.negative_share("destination", min_rows)
 
         plt.figure(figsize=(8, 8))
         sns.barplot(
@@ -84,24 +109,15 @@ class NegativeAnalysisVisualizer:
     def plot_negative_share_by_aspect_and_offering(self, min_mentions=5):
         """Plots a heatmap of negative share by aspect and offering."""
         # Get the top 12 most mentioned negative aspects
-        focus_neg_aspects = (
-            self.aspect_df[self.neg_mask]["aspect_normalized"]
-            .value_counts()
-            .head(12)
-            .index.tolist()
-        )
-
-        # Prepare the data
-        subn = self.aspect_df[
-            self.aspect_df["aspect_normalized"].isin(focus_neg_aspects)
-        ].copy()
-        subn = subn.dropna(subset=["offer", "aspect_normalized"])
-        subn["is_neg"] = subn["polarity"].astype(str).str.lower().eq("negative")
+        focus_neg_aspects = self.aggregates.top(
+            "aspect_normalized", "negative", n=12
+        ).index
 
-        # Calculate both count and negative share
+        # Count and negative share per aspect and offering
         hmn = (
-            subn.groupby(["aspect_normalized", "offer"])
-            .agg(total_count=("is_neg", "size"), neg_share=("is_neg", "mean"))
+            self.aggregates.shares(["aspect_normalized", "offer"])
+            .loc[lambda d: d.index.get_level_values(0).isin(focus_neg_aspects)]
+            .rename(columns={"n_rows": "total_count", "negative_share": "neg_share"})
             .reset_index()
         )
 
@@ -109,13 +125,13 @@ class NegativeAnalysisVisualizer:
         hmn_filtered = hmn[hmn["total_count"] >= min_mentions].copy()
 
         # Apply Arabic reshaping to the aspect names for the heatmap index
-        hmn_filtered["aspect_ar"] = hmn_filtered["aspect_normalized"].apply(
-            display_arabic
+        hmn_filtered["aspect_ar"] = display_arabic_labels(
+            hmn_filtered["aspect_normalized"]
         )
 
         # Pivot table with reshaped aspect labels
         pivotn = hmn_filtered.pivot_table(
-            index="aspect_ar", columns="offer", values="neg_share"
+            index="aspect_ar", columns="offer", values="neg_share", observed=True
         )
 
         # Plot the heatmap
@@ -143,10 +159,8 @@ class NegativeAnalysisVisualizer:
     def plot_monthly_negative_share(self):
         """Plots the trend of negative share over time (by month)."""
         # Group by month and calculate the count and negative share
-        by_m = (
-            self.aspect_df.assign(is_neg=self.aspect_df["polarity"].eq("negative"))
-            .groupby("month")
-            .agg(count=("is_neg", "size"), neg_share=("is_neg", "mean"))
+        by_m = self.aggregates.shares("month").rename(
+            columns={"n_rows": "count", "negative_share": "neg_share"}
         )
 
         # Plot the bar chart and line plot with the negative share
@@ -197,36 +211,11 @@ class NegativeAnalysisVisualizer:
 
     def generate_insights_summary(self):
         """Generates a succinct summary of insights related to negative polarity."""
-        pol = self.aspect_df["polarity"].astype(str).str.lower()
-        neg_aspect_counts = self.aspect_df[pol.eq("negative")][
-            "aspect_normalized"
-        ].value_counts()
+        neg_aspect_counts = self.aggregates.top("aspect_normalized", "negative")
 
         MIN_ROWS = 30
-        neg_by_off = (
-            self.aspect_df.assign(is_neg=pol.eq("negative"))
-            .groupby("offer")
-            .agg(n=("is_neg", "size"), neg_share=("is_neg", "mean"))
-            .query("n >= @MIN_ROWS")
-            .sort_values("neg_share", ascending=False)
-        )
-        neg_by_dest = (
-            self.aspect_df.assign(is_neg=pol.eq("negative"))
-            .groupby("destination")
-            .agg(n=("is_neg", "size"), neg_share=("is_neg", "mean"))
-            .query("n >= @MIN_ROWS")
-            .sort_values("neg_share", ascending=False)
-        )
-
-        by_m = (
-            self.aspect_df.assign(is_neg=pol.eq("negative"))
-            .groupby(
-                pd.to_datetime(self.aspect_df["date"])
-                .dt.to_period("M")
-                .dt.to_timestamp()
-            )
-            .agg(count=("is_neg", "size"), neg_share=("is_neg", "mean"))
-        )
+        neg_by_off = self.negative_share("offer", MIN_ROWS)
+        neg_by_dest = self.negative_share("destination", MIN_ROWS)
 
         def pct(x):
             return f"{100 * x:.1f}%"
@@ -240,8 +229,8 @@ class NegativeAnalysisVisualizer:
                 f"Offerings with highest negative share (n≥{MIN_ROWS}): "
                 + ", ".join(
                     [
-                        f"{idx} ({pct(row.neg_share)})"
-                        for idx, row in neg_by_off.head(5).iterrows()
+                        f"{idx} ({pct(share)})"
+                        for idx, share in neg_by_off["neg_share"].head(5).items()
                     ]
                 )
             )
@@ -250,8 +239,8 @@ class NegativeAnalysisVisualizer:
                 f"Destinations with highest negative share (n≥{MIN_ROWS}): "
                 + ", ".join(
                     [
-                        f"{idx} ({pct(row.neg_share)})"
-                        for idx, row in neg_by_dest.head(5).iterrows()
+                        f"{idx} ({pct(share)})"
+                        for idx, share in neg_by_dest["neg_share"].head(5).items()
                     ]
                 )
             )
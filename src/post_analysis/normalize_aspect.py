@@ -1,30 +1,68 @@
 # Imports
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import warnings
 import re
 
-# Configure settings
-warnings.filterwarnings("ignore")
+# Arabic letters (hamza to yeh), used to tell Arabic aspects apart
+ARABIC_LETTERS = re.compile(r"[\u0621-\u064a]")
+# Tatweel and harakat (short vowels, tanween, shadda, sukun, dagger alef)
+ARABIC_MARKS = re.compile(r"[\u0640\u064b-\u065f\u0670]")
+# Letters repeated three times or more for emphasis ("خدمااااات")
+ARABIC_ELONGATION = re.compile(r"([\u0621-\u064a])\1{2,}")
+# Alef variants to bare alef, alef maqsura to yeh, ta marbuta to heh
+ARABIC_LETTER_FORMS = str.maketrans(
+    {"أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا", "ى": "ي", "ة": "ه"}
+)
 
-plt.style.use("seaborn-v0_8-darkgrid")
-sns.set_palette("husl")
 
-pd.set_option("display.max_columns", None)
-pd.set_option("display.max_colwidth", 120)
+def configure_display():
+    """
+    Applies the analysis notebook's plot style and pandas display options.
+
+    Not run at import time; the prediction analysis notebook sets the same options
+    in its first cell.
+    """
+    warnings.filterwarnings("ignore")
+
+    plt.style.use("seaborn-v0_8-darkgrid")
+    sns.set_palette("husl")
 
-print("✓ Libraries ready")
+    pd.set_option("display.max_columns", None)
+    pd.set_option("display.max_colwidth", 120)
 
 
 # 1. Normalize Aspect Function
-def normalize_aspect(aspect):
+def normalize_arabic(aspect, fold_letters=True):
+    """
+    Orthographic normalization of Arabic text, so spelling variants of one word match:
+    - Remove tatweel and diacritics
+    - Collapse letters elongated for emphasis
+    - Unify alef forms, alef maqsura / yeh and ta marbuta / heh
+    - Remove leading/trailing punctuation
+
+    :param fold_letters: Unify the letter forms; the folded text is a matching key,
+        not a correct spelling ("الغرفة" becomes "الغرفه")
+    """
+    aspect = ARABIC_MARKS.sub("", aspect)
+    aspect = ARABIC_ELONGATION.sub(r"\1", aspect)
+    if fold_letters:
+        aspect = aspect.translate(ARABIC_LETTER_FORMS)
+    return aspect.strip(" .,!?:;،؛؟")
+
+
+def normalize_aspect(aspect, fold_letters=True):
     """
     Normalize aspect text to consolidate duplicates:
     - Lowercase
     - Remove extra whitespace
     - Remove leading/trailing punctuation
     - Plurals to singular (simple -s/-es rules)
+    - Arabic aspects get 'normalize_arabic' instead of the English plural rules
+
+    :param fold_letters: Forwarded to 'normalize_arabic'
     """
     if not aspect or not isinstance(aspect, str):
         return ""
@@ -38,6 +76,9 @@ def normalize_aspect(aspect):
     # Normalize whitespace
     aspect = re.sub(r"\s+", " ", aspect).strip()
 
+    if ARABIC_LETTERS.search(aspect):
+        return normalize_arabic(aspect, fold_letters)
+
     # Simple plural to singular conversion
     if len(aspect) > 4:
         if aspect.endswith("ies") and not aspect.endswith("series"):
@@ -60,33 +101,111 @@ def normalize_aspect(aspect):
     return aspect
 
 
+def normalize_aspects(aspects):
+    """
+    'normalize_aspect' over a whole column, normalizing each distinct value once.
+
+    Aspect strings repeat many times, so the column is factorized, only the unique
+    values go through 'normalize_aspect' and the results are mapped back by code.
+
+    Values are grouped by their 'normalize_aspect' key, but since folded Arabic
+    letters misspell words, every key is labelled with its most frequent unfolded
+    spelling (ties by alphabetical order). Each key keeps exactly one label.
+
+    :param aspects: Series (or list) of raw aspect strings
+    :return: Series of normalized aspects aligned with 'aspects' ("" for missing values)
+    """
+    if not isinstance(aspects, pd.Series):
+        aspects = pd.Series(aspects, dtype=object)
+    codes, uniques = pd.factorize(aspects)
+    spellings = [normalize_aspect(u, fold_letters=False) for u in uniques]
+    # Folding the unfolded spelling gives the same key as 'normalize_aspect'
+    keys = [spelling.translate(ARABIC_LETTER_FORMS) for spelling in spellings]
+    rows = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    spelling_rows = (
+        pd.DataFrame({"key": keys, "spelling": spellings, "rows": rows})
+        .groupby(["key", "spelling"])["rows"]
+        .sum()
+        .reset_index()
+    )
+    labels = (
+        spelling_rows.sort_values("rows", ascending=False, kind="stable")
+        .drop_duplicates("key")
+        .set_index("key")["spelling"]
+    )
+    # Missing values get code -1, which picks the trailing ""
+    normalized = np.array(list(labels.reindex(keys)) + [""], dtype=object)
+    return pd.Series(normalized[codes], index=aspects.index, name="aspect_normalized")
+
+
 # 2. Data Cleaning Function
-def clean_and_consolidate_data(aspect_df):
+def _stripped_codes(values):
+    """
+    Integer codes of the stripped string form of every value (-1 for missing values).
+
+    Only the unique values are cast and stripped; codes follow the sorted labels, so
+    ordering by code is ordering by string.
+    """
+    codes, uniques = pd.factorize(values)
+    label_codes, labels = pd.factorize(
+        pd.Index(uniques.astype(str)).str.strip(), sort=True
+    )
+    return np.append(label_codes, -1)[codes], labels
+
+
+def clean_and_consolidate_data(aspect_df, max_examples=5):
     """
     Clean and consolidate data for aspect analysis.
-    - Normalize aspects
+    - Normalize aspects (when there is no 'aspect_normalized' column yet)
     - Remove NaNs and empty strings
     - Group aspects and count occurrences
-    """
-    # Build a clean table for grouping (no NaNs, all strings)
-    tmp = aspect_df[["aspect_normalized", "aspect"]].copy()
-    tmp = tmp.dropna(subset=["aspect_normalized"])  # drop rows with NaN normalized key
-    tmp["aspect_normalized"] = tmp["aspect_normalized"].astype(str).str.strip()
-    tmp = tmp[tmp["aspect_normalized"] != ""]  # drop empty normalized keys
-    tmp["aspect"] = tmp["aspect"].apply(
-        lambda v: str(v).strip() if pd.notna(v) else None
-    )
-    tmp = tmp.dropna(subset=["aspect"])  # drop NaN originals after cast
 
-    # Group: collect unique, sorted variants and counts
-    consolidation_examples = (
-        tmp.groupby("aspect_normalized")["aspect"]
-        .apply(lambda x: sorted(set(x)))
-        .to_frame("original_variants")
+    Works on integer codes: one pass de-duplicates the (normalized, original) pairs
+    and counts rows per normalized aspect, so the cost is one hash per row plus work
+    proportional to the number of distinct pairs.
+
+    :param max_examples: Number of original variants kept per normalized aspect
+        (alphabetical order); None keeps them all
+    :return: DataFrame indexed by 'aspect_normalized' with 'original_variants',
+        'count' (rows) and 'n_variants' (distinct originals), by descending count
+    """
+    if "aspect_normalized" in aspect_df.columns:
+        normalized = aspect_df["aspect_normalized"]
+    else:
+        normalized = normalize_aspects(aspect_df["aspect"])
+    keys, key_labels = _stripped_codes(normalized)
+    variants, variant_labels = _stripped_codes(aspect_df["aspect"])
+
+    # Drop rows with a missing or empty normalized key, or a missing original
+    empty = key_labels.get_indexer([""])[0]
+    valid = (keys >= 0) & (keys != empty) & (variants >= 0)
+    keys, variants = keys[valid], variants[valid]
+
+    counts = np.bincount(keys, minlength=len(key_labels))
+    n_labels = max(len(variant_labels), 1)
+    pairs = np.sort(pd.unique(keys * n_labels + variants))
+    pair_keys, pair_variants = np.divmod(pairs, n_labels)
+    n_variants = np.bincount(pair_keys, minlength=len(key_labels))
+
+    if max_examples is not None:
+        starts = np.cumsum(n_variants) - n_variants
+        keep = np.arange(len(pairs)) - starts[pair_keys] < max_examples
+        pair_keys, pair_variants = pair_keys[keep], pair_variants[keep]
+    present = np.flatnonzero(counts)
+    boundaries = np.searchsorted(pair_keys, present[1:])
+    examples = np.split(variant_labels.to_numpy()[pair_variants], boundaries)
+
+    consolidation_examples = pd.DataFrame(
+        {
+            "original_variants": [list(e) for e in examples],
+            "count": counts[present],
+            "n_variants": n_variants[present],
+        },
+        index=pd.Index(key_labels[present], name="aspect_normalized"),
     )
-    consolidation_examples["count"] = tmp.groupby("aspect_normalized").size()
     consolidation_examples = consolidation_examples.sort_values(
-        "count", ascending=False
+        "count", ascending=False, kind="stable"
     )
 
     return consolidation_examples
@@ -98,18 +217,20 @@ def print_aspect_analysis(aspect_df):
     Print analysis of aspect data: Top 20 normalized aspects, missing data, and distinct counts.
     """
     # Consolidate data
-    consolidation_examples = clean_and_consolidate_data(aspect_df)
+    consolidation_examples = clean_and_consolidate_data(aspect_df).head(20)
 
     # Print top 20
-    for idx, row in consolidation_examples.head(20).iterrows():
-        variants = row["original_variants"]
-        # defensively ensure all strings (in case anything sneaks in)
-        variants = [str(v) for v in variants if pd.notna(v)]
-        preview = ", ".join(variants[:5]) if variants else "(no examples)"
-        if len(variants) > 1:
-            print(f"\n'{idx}' (n={row['count']}): {preview}")
+    for aspect, variants, count, n_variants in zip(
+        consolidation_examples.index,
+        consolidation_examples["original_variants"],
+        consolidation_examples["count"],
+        consolidation_examples["n_variants"],
+    ):
+        preview = ", ".join(variants) if variants else "(no examples)"
+        if n_variants > 1:
+            print(f"\n'{aspect}' (n={count}): {preview}")
         else:
-            print(f"'{idx}' (n={row['count']}): {preview}")
+            print(f"'{aspect}' (n={count}): {preview}")
 
     # Show missingness
     missing = aspect_df.isna().mean().sort_values(ascending=False)
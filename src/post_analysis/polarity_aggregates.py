@@ -0,0 +1,169 @@
+import numpy as np
+import pandas as pd
+from src.eda.stats_cube import month_column
+
+POLARITIES = ("positive", "neutral", "negative")
+# Count columns of every cell; 'other' holds labels outside POLARITIES
+POLARITY_COUNTS = POLARITIES + ("other",)
+# Dimension combinations the post-analysis plots group by; every subset of one of
+# them (e.g. 'offer' or 'aspect_normalized' alone) rolls up from its cells
+GROUPINGS = (
+    ("offer", "aspect_normalized"),
+    ("destination",),
+    ("month",),
+    ("model",),
+)
+
+
+def encode_polarity(values) -> pd.Categorical:
+    """
+    Lower-cased polarity labels as a small categorical over POLARITY_COUNTS.
+
+    Only the unique labels are lower-cased; labels outside POLARITIES become 'other'
+    and missing values stay missing.
+    """
+    codes, uniques = pd.factorize(values)
+    lowered = pd.Index(uniques.astype(str)).str.lower()
+    label_codes = np.array(
+        [POLARITIES.index(p) if p in POLARITIES else len(POLARITIES) for p in lowered]
+        + [-1],
+        dtype=np.int8,
+    )
+    return pd.Categorical.from_codes(label_codes[codes], categories=POLARITY_COUNTS)
+
+
+def month_start(dates: pd.Series) -> pd.Series:
+    """First day of the month of every date, as a timestamp."""
+    return month_column(dates).dt.to_timestamp()
+
+
+def _cell_counts(codes: dict, labels: dict, grouping: tuple, polarity: np.ndarray):
+    """
+    Row and polarity counts of every observed combination of the 'grouping' columns.
+
+    :param codes: Integer code of every row per dimension (0 for missing values)
+    :param labels: Value of every code per dimension (missing at position 0)
+    :param polarity: Polarity code of every row (len(POLARITY_COUNTS) for missing)
+    """
+    shape = tuple(len(labels[d]) for d in grouping)
+    cell = np.ravel_multi_index([codes[d] for d in grouping], shape)
+    flat = cell * (len(POLARITY_COUNTS) + 1) + polarity
+    flat_codes, flat_keys = pd.factorize(flat)
+    counts = np.bincount(flat_codes)
+
+    cell_codes, cell_keys = pd.factorize(flat_keys // (len(POLARITY_COUNTS) + 1))
+    table = np.zeros((len(cell_keys), len(POLARITY_COUNTS) + 1), dtype=np.int64)
+    np.add.at(table, (cell_codes, flat_keys % (len(POLARITY_COUNTS) + 1)), counts)
+
+    cells = {
+        dimension: labels[dimension][code]
+        for dimension, code in zip(grouping, np.unravel_index(cell_keys, shape))
+    }
+    cells["n_rows"] = table.sum(axis=1)
+    for i, polarity_label in enumerate(POLARITY_COUNTS):
+        cells[polarity_label] = table[:, i]
+    return pd.DataFrame(cells)
+
+
+class PolarityAggregates:
+    def __init__(self, cells: dict):
+        """
+        Polarity counts of aspect mentions over the dimension combinations the plots use.
+
+        For every grouping, one row per observed combination of its dimensions, with
+        the row count and the number of positive, neutral, negative and other
+        mentions. Counts (and shares) over a grouping or any subset of it are
+        answered by summing cells.
+
+        :param cells: Dict grouping (tuple of dimensions) -> cell table, as built by
+            'from_frame'
+        """
+        self.cells = cells
+        self.dimensions = list(dict.fromkeys(d for g in cells for d in g))
+        self._rollups = {}
+
+    @classmethod
+    def from_frame(
+        cls,
+        aspect_df: pd.DataFrame,
+        groupings=GROUPINGS,
+        polarity_col="polarity",
+        date_col="date",
+    ):
+        """
+        Builds the cells of every grouping in one pass over the aspect table.
+
+        The polarity column and every dimension are encoded to integer codes once;
+        each grouping is then counted on combined codes. A 'month' dimension is derived
+        from 'date_col', or from an existing 'month' column when there is no date;
+        dimensions missing from the frame are left out.
+        """
+        codes, labels = {}, {}
+        for dimension in dict.fromkeys(d for g in groupings for d in g):
+            if dimension == "month" and date_col in aspect_df.columns:
+                values = month_start(aspect_df[date_col])
+            elif dimension == "month" and "month" in aspect_df.columns:
+                values = month_start(aspect_df["month"])
+            elif dimension in aspect_df.columns:
+                values = aspect_df[dimension]
+            else:
+                continue
+            # Missing values get code 0, so they still count towards other dimensions
+            row_codes, uniques = pd.factorize(values)
+            codes[dimension] = row_codes + 1
+            labels[dimension] = pd.Index(uniques).insert(0, np.nan)
+
+        polarity = encode_polarity(aspect_df[polarity_col]).codes.astype(np.int64)
+        polarity[polarity < 0] = len(POLARITY_COUNTS)
+
+        cells = {}
+        for grouping in groupings:
+            grouping = tuple(d for d in grouping if d in codes)
+            if grouping and grouping not in cells:
+                cells[grouping] = _cell_counts(codes, labels, grouping, polarity)
+        return cls(cells)
+
+    def _grouping(self, by: list) -> tuple:
+        candidates = [g for g in self.cells if set(by) <= set(g)]
+        if not candidates:
+            raise ValueError(
+                f"No grouping covers {by}; available groupings: {list(self.cells)}"
+            )
+        return min(candidates, key=lambda g: len(self.cells[g]))
+
+    def covers(self, by) -> bool:
+        """Whether the cells can answer a grouping by 'by'."""
+        by = [by] if isinstance(by, str) else list(by)
+        return any(set(by) <= set(g) for g in self.cells)
+
+    def counts(self, by) -> pd.DataFrame:
+        """
+        Row count and polarity counts per group, sorted by key like 'groupby'.
+
+        Rows with a missing key are dropped, as 'groupby' does by default. Results are
+        kept, so every plot grouping by the same dimensions shares one rollup.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        if tuple(by) not in self._rollups:
+            cells = self.cells[self._grouping(by)]
+            self._rollups[tuple(by)] = cells.groupby(by, observed=True)[
+                ["n_rows", *POLARITY_COUNTS]
+            ].sum()
+        return self._rollups[tuple(by)]
+
+    def shares(self, by) -> pd.DataFrame:
+        """
+        'counts' plus the share of every polarity among all rows of the group
+        ('positive_share', 'neutral_share', 'negative_share').
+        """
+        counts = self.counts(by)
+        shares = counts.copy()
+        for polarity in POLARITIES:
+            shares[f"{polarity}_share"] = counts[polarity] / counts["n_rows"]
+        return shares
+
+    def top(self, by, column="n_rows", n=None) -> pd.Series:
+        """Groups with a non-zero 'column' count, largest first (ties by key)."""
+        top = self.counts(by)[column]
+        top = top[top > 0].sort_values(ascending=False, kind="stable")
+        return top if n is None else top.head(n)
@@ -0,0 +1,139 @@
+import sqlite3
+from contextlib import closing, contextmanager
+import pandas as pd
+
+# Columns the post-analysis classes filter and group on
+INDEXED_COLUMNS = [
+    "aspect",
+    "aspect_normalized",
+    "polarity",
+    "offer",
+    "destination",
+    "month",
+]
+
+
+class ResultStore:
+    def __init__(self, path="data/aspect_results.sqlite3", table="aspect_results"):
+        """
+        Initializes the ResultStore backed by a local SQLite file.
+
+        :param path: Path of the SQLite database file (created on first write)
+        :param table: Name of the table holding one row per predicted aspect
+        """
+        self.path = str(path)
+        self.table = table
+
+    @contextmanager
+    def _connect(self):
+        # A connection's own context manager only commits or rolls back; closing()
+        # releases it as well
+        with closing(sqlite3.connect(self.path)) as con, con:
+            yield con
+
+    def write(self, aspect_df, if_exists="replace"):
+        """
+        Persists predictions plus review metadata and builds the lookup indexes.
+
+        :param aspect_df: DataFrame of predictions merged with review metadata
+            (e.g. 'offer', 'destination', 'date', 'language')
+        :param if_exists: 'replace' to rebuild the table, 'append' to add rows
+        """
+        df = aspect_df.copy()
+        if "date" in df.columns:
+            dates = pd.to_datetime(df["date"], errors="coerce", utc=True)
+            df["date"] = dates.dt.strftime("%Y-%m-%dT%H:%M:%S%z")
+            df["month"] = dates.dt.strftime("%Y-%m")
+
+        with self._connect() as con:
+            df.to_sql(self.table, con, if_exists=if_exists, index=False)
+            for col in INDEXED_COLUMNS:
+                if col in df.columns:
+                    con.execute(
+                        f'CREATE INDEX IF NOT EXISTS "ix_{self.table}_{col}" '
+                        f'ON "{self.table}" ("{col}")'
+                    )
+        return len(df)
+
+    @classmethod
+    def from_csv(cls, csv_path, path="data/aspect_results.sqlite3", **kwargs):
+        """Builds a store from a prepared predictions CSV (e.g. 'prepared_dataset.csv')."""
+        store = cls(path, **kwargs)
+        store.write(pd.read_csv(csv_path))
+        return store
+
+    def columns(self):
+        """Returns the column names of the stored table."""
+        with self._connect() as con:
+            rows = con.execute(f'PRAGMA table_info("{self.table}")').fetchall()
+        return [row[1] for row in rows]
+
+    def _where(self, filters):
+        """Builds a WHERE clause from equality / IN filters."""
+        clauses, params = [], []
+        for col, value in filters.items():
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set, pd.Index, pd.Series)):
+                values = list(value)
+                placeholders = ", ".join("?" for _ in values)
+                clauses.append(f'"{col}" IN ({placeholders})')
+                params.extend(values)
+            else:
+                clauses.append(f'"{col}" = ?')
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    @staticmethod
+    def _restore_types(df):
+        if "month" in df.columns:
+            df["month"] = pd.to_datetime(df["month"], format="%Y-%m")
+        return df
+
+    def query(self, columns=None, **filters) -> pd.DataFrame:
+        """
+        Loads only the rows (and columns) matching the given filters.
+
+        :param columns: Columns to load; 'None' loads every stored column
+        :param filters: Column equality filters, e.g. offer="Retail" or
+            polarity=["Negative", "Neutral"] or month="2021-04"
+        :return: DataFrame with the matching rows; 'month' is a month-start timestamp
+        """
+        if columns is None:
+            select = "*"
+        else:
+            available = set(self.columns())
+            selected = [c for c in columns if c in available]
+            if not selected:
+                raise ValueError(
+                    f"None of the columns {list(columns)} is stored in '{self.table}'"
+                )
+            select = ", ".join(f'"{c}"' for c in selected)
+        where, params = self._where(filters)
+        with self._connect() as con:
+            df = pd.read_sql_query(
+                f'SELECT {select} FROM "{self.table}"{where}', con, params=params
+            )
+        return self._restore_types(df)
+
+    def count_by(self, group_cols, **filters) -> pd.DataFrame:
+        """
+        Counts rows per group inside the database without loading the rows.
+
+        :param group_cols: Column name or list of column names to group by
+        :param filters: Same filters as 'query'
+        :return: DataFrame with the group columns and an 'n' column
+        """
+        if isinstance(group_cols, str):
+            group_cols = [group_cols]
+        cols = ", ".join(f'"{c}"' for c in group_cols)
+        where, params = self._where(filters)
+        with self._connect() as con:
+            df = pd.read_sql_query(
+                f'SELECT {cols}, COUNT(*) AS n FROM "{self.table}"{where} '
+                f"GROUP BY {cols} ORDER BY n DESC",
+                con,
+                params=params,
+            )
+        return self._restore_types(df)
@@ -1,10 +1,46 @@
+from functools import lru_cache
+import numpy as np
+import pandas as pd
 import arabic_reshaper
 from bidi.algorithm import get_display
 
+# Distinct labels kept reshaped; plots only show a few dozen at a time
+LABEL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=LABEL_CACHE_SIZE)
+def _reshape(text: str) -> str:
+    return get_display(arabic_reshaper.reshape(text))
+
 
 def display_arabic(text):
-    """Reshapes Arabic text so it renders correctly in Matplotlib."""
+    """Reshapes Arabic text so it renders correctly in Matplotlib (memoized)."""
     if not isinstance(text, str):
         return text
-    reshaped_text = arabic_reshaper.reshape(text)
-    return get_display(reshaped_text)
+    return _reshape(text)
+
+
+def display_arabic_labels(values):
+    """
+    'display_arabic' for a whole column of labels, reshaping each distinct label once.
+
+    :param values: Series (object or categorical), Index or list of labels
+    :return: Same kind of container with the reshaped labels (categorical Series stay
+        categorical); missing values are kept
+    """
+    if isinstance(values, pd.Series) and isinstance(values.dtype, pd.CategoricalDtype):
+        # Only the categories are reshaped; the codes (and category order) are kept
+        categories = [display_arabic(c) for c in values.cat.categories]
+        if len(set(categories)) == len(categories):
+            return values.cat.rename_categories(categories)
+    if isinstance(values, (pd.Series, pd.Index)):
+        codes, uniques = pd.factorize(values)
+    else:
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    labels = np.array([display_arabic(u) for u in uniques] + [np.nan], dtype=object)
+    reshaped = labels[codes]
+    if isinstance(values, pd.Series):
+        return pd.Series(reshaped, index=values.index, name=values.name)
+    if isinstance(values, pd.Index):
+        return pd.Index(reshaped, name=values.name)
+    return reshaped.tolist()
@@ -0,0 +1,396 @@
+import argparse
+import contextlib
+import hashlib
+import html
+import importlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pandas as pd
+from src.data.pipeline import code_version
+
+# (data source, "module:Class") of every visualizer in the report, in page order
+FIGURE_CLASSES = [
+    ("reviews", "src.eda.visiualizations:ReviewDataVisualizer"),
+    ("reviews", "src.eda.destination_offer_analysis:Plotter"),
+    ("aspects", "src.post_analysis.aspects_analyzer:AspectVisualization"),
+    ("aspects", "src.post_analysis.aspects_visualizer:AspectAnalysisself"),
+    ("aspects", "src.post_analysis.negative_ana:NegativeAnalysisVisualizer"),
+    ("aspects", "src.post_analysis.confidence_viz:ConfidenceEvidenceVisualizer"),
+]
+
+# Frames loaded by each worker process, by source name
+_SOURCES = {}
+_SOURCE_PATHS = {}
+
+
+def _import_class(class_path: str):
+    module, name = class_path.split(":")
+    return getattr(importlib.import_module(module), name)
+
+
+def discover_figures(figure_classes=None) -> list:
+    """
+    Every plot_* method (except plot_all) that can be called without arguments.
+
+    :return: List of (figure name, source, "module:Class", method, kwargs)
+    """
+    figures = []
+    for source, class_path in (
+        FIGURE_CLASSES if figure_classes is None else figure_classes
+    ):
+        cls = _import_class(class_path)
+        # Definition order, so the report follows the class layout
+        for method, function in vars(cls).items():
+            if not inspect.isfunction(function):
+                continue
+            if not method.startswith("plot_") or method == "plot_all":
+                continue
+            parameters = list(inspect.signature(function).parameters.values())[1:]
+            if any(p.default is inspect.Parameter.empty for p in parameters):
+                continue
+            name = f"{cls.__name__}.{method}"
+            figures.append((name, source, class_path, method, {}))
+    return figures
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a frame: column names, dtypes, index and values."""
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps([list(map(str, df.columns)), list(map(str, df.dtypes))]).encode()
+    )
+    digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+    for column in df.columns:
+        values = df[column]
+        try:
+            hashed = pd.util.hash_pandas_object(values, index=False)
+        except TypeError:
+            # Unhashable cells (e.g. token lists) are hashed through their repr
+            hashed = pd.util.hash_pandas_object(values.map(repr), index=False)
+        digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def figure_fingerprint(source_fingerprint: str, figure: tuple, formats) -> str:
+    """Chains the source data hash with the figure's method, kwargs and module code."""
+    _, _, class_path, method, kwargs = figure
+    module = class_path.split(":")[0]
+    package_dir = Path(importlib.util.find_spec(module).origin).parent
+    key = json.dumps(
+        [
+            source_fingerprint,
+            class_path,
+            method,
+            kwargs,
+            sorted(formats),
+            code_version(package_dir),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _init_worker(source_paths: dict):
+    import matplotlib
+
+    matplotlib.use("Agg", force=True)
+    # Missing-font and non-interactive 'show' warnings would flood the output
+    warnings.filterwarnings("ignore")
+    _SOURCE_PATHS.update(source_paths)
+
+
+def _source(name: str) -> pd.DataFrame:
+    if name not in _SOURCES:
+        _SOURCES[name] = pd.read_pickle(_SOURCE_PATHS[name])
+    return _SOURCES[name]
+
+
+def render_figure(figure: tuple, figures_dir, formats) -> dict:
+    """
+    Runs one plot method under the Agg backend and saves every figure it opened.
+
+    :return: Dict with the written file names, captured stdout, error and seconds
+    """
+    import matplotlib.pyplot as plt
+
+    name, source, class_path, method, kwargs = figure
+    start = time.perf_counter()
+    stdout = io.StringIO()
+    files, error = [], None
+    plt.close("all")
+    try:
+        # Shallow copy: methods may add helper columns, the cached frame stays as is
+        visualizer = _import_class(class_path)(_source(source).copy(deep=False))
+        with contextlib.redirect_stdout(stdout):
+            getattr(visualizer, method)(**kwargs)
+        for i, number in enumerate(plt.get_fignums()):
+            fig = plt.figure(number)
+            for fmt in formats:
+                file_name = f"{name}-{i}.{fmt}"
+                fig.savefig(
+                    Path(figures_dir) / file_name, format=fmt, bbox_inches="tight"
+                )
+                files.append(file_name)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        plt.close("all")
+    return {
+        "files": files,
+        "stdout": stdout.getvalue(),
+        "error": error,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+class ReportBuilder:
+    def __init__(
+        self,
+        sources: dict,
+        output_dir="reports",
+        figures=None,
+        formats=("png",),
+        max_workers: int = None,
+        title: str = "Saudi Arabia Tourism Reviews Analysis",
+    ):
+        """
+        Renders the report figures in parallel worker processes and writes index.html.
+
+        Each figure's fingerprint chains the content hash of its data source with its
+        method, kwargs, output formats and the code of its package. Figures whose
+        fingerprint matches the one in manifest.json (and whose files still exist) are
+        reused instead of re-rendered.
+
+        :param sources: Source name -> DataFrame, or a callable returning one (only
+            called when building)
+        :param figures: List of (name, source, "module:Class", method, kwargs)
+            (default: 'discover_figures()')
+        :param formats: Image formats to write, e.g. ("png", "svg")
+        :param max_workers: Worker processes (default: one per CPU)
+        """
+        self.sources = sources
+        self.output_dir = Path(output_dir)
+        self.figures = figures
+        self.formats = tuple(formats)
+        self.max_workers = max_workers
+        self.title = title
+
+    @property
+    def figures_dir(self) -> Path:
+        return self.output_dir / "figures"
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.output_dir / "manifest.json"
+
+    def _load_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write(self, path: Path, text: str):
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def build(self, force: bool = False, verbose: bool = True) -> dict:
+        """
+        Renders stale figures and rewrites the manifest and index.html.
+
+        :param force: Re-render every figure
+        :return: Dict with the 'rendered' and 'reused' figure names
+        """
+        figures = discover_figures() if self.figures is None else self.figures
+        self.figures_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+
+        frames, source_fingerprints = {}, {}
+        for source in dict.fromkeys(figure[1] for figure in figures):
+            frame = self.sources[source]
+            frames[source] = frame() if callable(frame) else frame
+            source_fingerprints[source] = frame_fingerprint(frames[source])
+
+        stale, entries = [], {}
+        for figure in figures:
+            fingerprint = figure_fingerprint(
+                source_fingerprints[figure[1]], figure, self.formats
+            )
+            entry = manifest.get(figure[0])
+            if (
+                not force
+                and entry is not None
+                and entry["fingerprint"] == fingerprint
+                and entry["error"] is None
+                and all((self.figures_dir / f).exists() for f in entry["files"])
+            ):
+                entries[figure[0]] = entry
+            else:
+                stale.append((figure, fingerprint))
+
+        if stale:
+            source_paths = {}
+            for source in dict.fromkeys(figure[1] for figure, _ in stale):
+                source_paths[source] = str(self.output_dir / f".source-{source}.pkl")
+                frames[source].to_pickle(source_paths[source])
+            for figure, _ in stale:
+                for old in self.figures_dir.glob(f"{figure[0]}-*"):
+                    old.unlink()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(source_paths,),
+                ) as pool:
+                    results = pool.map(
+                        render_figure,
+                        [figure for figure, _ in stale],
+                        [self.figures_dir] * len(stale),
+                        [self.formats] * len(stale),
+                    )
+                    for (figure, fingerprint), result in zip(stale, results):
+                        entries[figure[0]] = {"fingerprint": fingerprint, **result}
+                        if verbose:
+                            status = (
+                                result["error"] or f"{len(result['files'])} file(s)"
+                            )
+                            print(
+                                f"rendered {figure[0]} in {result['seconds']:.1f}s: {status}"
+                            )
+            finally:
+                for path in source_paths.values():
+                    Path(path).unlink(missing_ok=True)
+
+        manifest = {figure[0]: entries[figure[0]] for figure in figures}
+        self._write(
+            self.manifest_path, json.dumps(manifest, indent=1, ensure_ascii=False)
+        )
+        self._write(self.output_dir / "index.html", self.render_html(figures, manifest))
+        rendered = [figure[0] for figure, _ in stale]
+        if verbose:
+            print(
+                f"{len(rendered)} figure(s) rendered, {len(figures) - len(rendered)} reused"
+            )
+        return {
+            "rendered": rendered,
+            "reused": [figure[0] for figure in figures if figure[0] not in rendered],
+        }
+
+    def render_html(self, figures: list, manifest: dict) -> str:
+        """Static page with one section per visualizer class, images and printed output."""
+        sections, current = [], None
+        for name, _, class_path, method, _ in figures:
+            class_name = class_path.split(":")[1]
+            if class_name != current:
+                if current is not None:
+                    sections.append("</section>")
+                sections.append(f"<section><h2>{html.escape(class_name)}</h2>")
+                current = class_name
+            entry = manifest[name]
+            sections.append(f"<h3>{html.escape(method)}</h3>")
+            if entry["error"]:
+                sections.append(f'<p class="error">{html.escape(entry["error"])}</p>')
+            # One image per figure, in the first format (PNG loads fastest)
+            for file_name in entry["files"]:
+                if file_name.endswith(f".{self.formats[0]}"):
+                    sections.append(
+                        f'<img src="figures/{html.escape(file_name)}" alt="{html.escape(name)}" loading="lazy">'
+                    )
+            if entry["stdout"].strip():
+                sections.append(f"<pre>{html.escape(entry['stdout'])}</pre>")
+        if current is not None:
+            sections.append("</section>")
+        body = "\n".join(sections)
+        return f"""<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8" />
+    <title>{html.escape(self.title)}</title>
+    <style>
+      body {{ font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif; margin: 40px; color: #333; }}
+      section {{ margin-bottom: 50px; }}
+      img {{ max-width: 100%; display: block; margin: 10px 0; }}
+      pre {{ background: #f5f5f5; padding: 10px; overflow-x: auto; }}
+      .error {{ color: #b00020; }}
+    </style>
+  </head>
+  <body>
+    <h1>{html.escape(self.title)}</h1>
+{body}
+  </body>
+</html>
+"""
+
+
+def load_review_frame(data_path, mapping_path, cache_dir) -> pd.DataFrame:
+    """The EDA notebook's review frame: cached pipeline stages plus the word counts."""
+    from src.data.pipeline import ReviewPipeline
+
+    df = ReviewPipeline(
+        data_path=data_path,
+        mapping_path=mapping_path,
+        cache_dir=cache_dir,
+        stages=[
+            (
+                "ratings",
+                "process_ratings",
+                {"columns": ["normalized_ratings", "raw_ratings"]},
+            ),
+            ("tags", "process_tags", {}),
+            ("text", "process_text", {}),
+            ("tokens", "process_tokens", {}),
+        ],
+    ).run(verbose=False)
+    df["word_count"] = df["text_for_analysis"].fillna("").str.split().str.len()
+    return df
+
+
+def main():
+    # Run from the project root: python -m src.reporting.builder [--formats png svg]
+    parser = argparse.ArgumentParser(
+        description="Renders every plot_* figure to files and writes index.html"
+    )
+    parser.add_argument("--output", default="reports")
+    parser.add_argument("--data", default="origins/dataset.csv")
+    parser.add_argument("--mapping", default="origins/mappings.json")
+    parser.add_argument("--aspects", default="data/prepared_dataset.csv")
+    parser.add_argument("--cache-dir", default="data/cache")
+    parser.add_argument("--formats", nargs="+", default=["png"], choices=["png", "svg"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    figure_classes = [
+        (source, class_path)
+        for source, class_path in FIGURE_CLASSES
+        if source != "aspects" or Path(args.aspects).exists()
+    ]
+    if len(figure_classes) < len(FIGURE_CLASSES):
+        print(f"{args.aspects} not found, skipping the aspect figures")
+
+    builder = ReportBuilder(
+        sources={
+            "reviews": lambda: load_review_frame(
+                args.data, args.mapping, args.cache_dir
+            ),
+            "aspects": lambda: pd.read_csv(args.aspects),
+        },
+        output_dir=args.output,
+        figures=discover_figures(figure_classes),
+        formats=args.formats,
+        max_workers=args.workers,
+    )
+    builder.build(force=args.force)
+    print(f"report written to {Path(args.output) / 'index.html'}")
+
+
+if __name__ == "__main__":
+    main()
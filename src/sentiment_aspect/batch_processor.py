@@ -1,6 +1,14 @@
+import numpy as np
+from src.data.near_duplicates import NearDuplicateIndex, inference_saved
+
+
 class BatchProcessor:
-    def __init__(self, batch_size=100):
+    def __init__(self, batch_size=100, dedupe=False, index=None):
         self.batch_size = batch_size
+        # Score one representative per near-duplicate cluster and reuse its results
+        self.dedupe = dedupe
+        self.index = index
+        self.inference_saved = 0.0
 
     def split_into_batches(self, data):
         return [
@@ -9,9 +17,44 @@ class BatchProcessor:
         ]
 
     def process_batches(self, extractor, data):
+        if self.dedupe:
+            return self.process_deduplicated(extractor, data)
+
         batch_results = []
         batches = self.split_into_batches(data)
         for batch in batches:
             result = extractor.extract_aspects(batch)
             batch_results.extend(result)
         return batch_results
+
+    def process_deduplicated(self, extractor, data):
+        """
+        Runs the extractor once per near-duplicate cluster and copies the
+        representative's aspects to every member.
+
+        Results carry the row position of the text they belong to as 'text_id'.
+        """
+        index = self.index or NearDuplicateIndex()
+        labels = index.cluster(data["text_for_analysis"].tolist())
+        representatives = np.unique(labels)
+        self.inference_saved = inference_saved(labels)
+        print(
+            f"Near-duplicate dedupe: scoring {len(representatives)} of {len(data)} "
+            f"texts ({self.inference_saved:.1%} of inference saved)"
+        )
+
+        members = {}
+        for position, representative in enumerate(labels.tolist()):
+            members.setdefault(representative, []).append(position)
+
+        batch_results = []
+        for start in range(0, len(representatives), self.batch_size):
+            batch_positions = representatives[start: start + self.batch_size]
+            batch = data.iloc[batch_positions]["text_for_analysis"].tolist()
+            for result in extractor.extract_aspects(batch):
+                representative = int(batch_positions[result["text_id"]])
+                for position in members[representative]:
+                    batch_results.append({**result, "text_id": position})
+
+        batch_results.sort(key=lambda result: result["text_id"])
+        return batch_results
@@ -3,14 +3,15 @@ from src.sentiment_aspect.aspect_extractor import AspectExtractor
 from src.sentiment_aspect.batch_processor import BatchProcessor
 
 
-def predictor(data):
+def predictor(data, dedupe=False):
     # Initialize Model Loader and Aspect Extractor
     model_loader = ModelLoader()
     extractor = model_loader.load_model()
 
     if extractor:
         aspect_extractor = AspectExtractor(extractor)
-        batch_processor = BatchProcessor(batch_size=100)
+        # dedupe=True scores one text per near-duplicate cluster (see BatchProcessor)
+        batch_processor = BatchProcessor(batch_size=100, dedupe=dedupe)
 
         # Process the batches and get the results
         all_results = batch_processor.process_batches(aspect_extractor, data)
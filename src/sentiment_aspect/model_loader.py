@@ -1,6 +1,3 @@
-from pyabsa import AspectTermExtraction as ATEPC
-
-
 class ModelLoader:
     def __init__(self, model_name="multilingual", auto_device=True):
         self.model_name = model_name
@@ -9,6 +6,10 @@ class ModelLoader:
 
     def load_model(self):
         try:
+            # Imported here: pyabsa pulls in torch, transformers and spaCy, which
+            # would otherwise be loaded by merely importing the API
+            from pyabsa import AspectTermExtraction as ATEPC
+
             print("Loading PyABSA multilingual model...")
             self.extractor = ATEPC.AspectExtractor(
                 self.model_name, auto_device=self.auto_device
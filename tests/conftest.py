@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
@@ -9,3 +10,13 @@ for path in (ROOT, SRC):
     path_str = str(path)
     if path_str not in sys.path:
         sys.path.insert(0, path_str)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_stopwords():
+    """Tests patch the NLTK corpus, so don't let loaded stopword sets leak between them."""
+    from src.data.stopword_sets import load_stopwords
+
+    load_stopwords.cache_clear()
+    yield
+    load_stopwords.cache_clear()
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+
+def test_labels_match_row_wise_reshaping():
+    from src.post_analysis import utils
+
+    aspects = pd.Series(
+        ["الغرفة", "الموظفين", None, "الغرفة", "room", "الموظفين"],
+        index=[10, 11, 12, 13, 14, 15],
+        name="aspect_normalized",
+    )
+    utils._reshape.cache_clear()
+    labels = utils.display_arabic_labels(aspects)
+
+    pd.testing.assert_series_equal(labels, aspects.apply(utils.display_arabic))
+    assert utils._reshape.cache_info().misses == 3
+
+    index = utils.display_arabic_labels(pd.Index(aspects.dropna(), name="aspect"))
+    assert index.name == "aspect"
+    assert list(index) == [utils.display_arabic(x) for x in aspects.dropna()]
+    assert utils.display_arabic_labels(["الغرفة", np.nan])[1] is np.nan
+
+
+def test_categorical_labels_reshape_categories_only(monkeypatch):
+    from src.post_analysis import utils
+
+    calls = []
+    monkeypatch.setattr(utils, "display_arabic", lambda x: calls.append(x) or x[::-1])
+    aspects = pd.Series(["ab", "cd", "ab", None] * 1000, dtype="category")
+
+    labels = utils.display_arabic_labels(aspects)
+
+    assert isinstance(labels.dtype, pd.CategoricalDtype)
+    assert list(labels.cat.categories) == ["ba", "dc"]
+    assert labels.tolist()[:4] == ["ba", "dc", "ba", np.nan]
+    assert sorted(calls) == ["ab", "cd"]
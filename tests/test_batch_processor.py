@@ -70,3 +70,40 @@ def test_process_batches_calls_extractor_for_each_batch():
         {"batch": 1, "payload": ["text-0", "text-1"]},
         {"batch": 2, "payload": ["text-2", "text-3"]},
     ]
+
+
+def test_process_batches_dedupe_scores_each_cluster_once():
+    import pandas as pd
+    from src.sentiment_aspect.batch_processor import BatchProcessor
+
+    df = pd.DataFrame(
+        {
+            "text_for_analysis": [
+                "Great staff and clean rooms",
+                "The museum was closed",
+                "great staff and clean rooms!! 😍",
+                "Great staff, and clean rooms.",
+            ]
+        }
+    )
+    processor = BatchProcessor(batch_size=1, dedupe=True)
+
+    class DummyExtractor:
+        def __init__(self):
+            self.calls = []
+
+        def extract_aspects(self, batch):
+            self.calls.append(list(batch))
+            return [{"text_id": 0, "aspect": batch[0].split()[1]}]
+
+    extractor = DummyExtractor()
+    results = processor.process_batches(extractor, df)
+
+    assert extractor.calls == [["Great staff and clean rooms"], ["The museum was closed"]]
+    assert [(r["text_id"], r["aspect"]) for r in results] == [
+        (0, "staff"),
+        (1, "museum"),
+        (2, "staff"),
+        (3, "staff"),
+    ]
+    assert processor.inference_saved == 0.5
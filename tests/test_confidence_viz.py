@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def aspect_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "confidence": rng.beta(8, 2, n),
+            "evidence_span": rng.choice(["room", "staff members", None, "coffee"], n),
+            "polarity": rng.choice(["Positive", "Negative", "Neutral"], n),
+        }
+    )
+
+
+def test_binned_kde_matches_exact_kde():
+    from scipy.stats import gaussian_kde
+    from src.post_analysis.confidence_viz import binned_kde
+
+    values = aspect_frame(5000)["confidence"].to_numpy()
+    grid, density = binned_kde(values)
+
+    assert np.isclose(density.sum() * (grid[1] - grid[0]), 1, atol=0.02)
+    exact = gaussian_kde(values)(grid)
+    assert np.abs(density - exact).max() < 0.02 * exact.max()
+
+
+def test_aggregated_modes_draw_the_same_for_any_row_count(monkeypatch):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.post_analysis.confidence_viz import ConfidenceEvidenceVisualizer
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+
+    def drawn(n, method, mode):
+        getattr(ConfidenceEvidenceVisualizer(aspect_frame(n)), method)(mode=mode)
+        fig = plt.gcf()
+        artists = [
+            len(ax.collections) + len(ax.patches) + len(ax.lines) for ax in fig.axes
+        ]
+        plt.close("all")
+        return artists
+
+    for method, mode in [
+        ("plot_confidence_distribution", "binned"),
+        ("plot_evidence_length_vs_confidence", "hexbin"),
+        ("plot_evidence_length_vs_confidence", "hist2d"),
+    ]:
+        assert drawn(200, method, mode) == drawn(20_000, method, mode)
+
+    with pytest.raises(ValueError):
+        ConfidenceEvidenceVisualizer(aspect_frame(10)).plot_confidence_distribution(
+            mode="hexbin"
+        )
+
+
+def test_evidence_plot_keeps_unlabelled_rows_and_empty_data(monkeypatch):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.post_analysis.confidence_viz import ConfidenceEvidenceVisualizer
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+    df = aspect_frame(100)
+    df.loc[:9, "polarity"] = None
+
+    for mode in ("hexbin", "hist2d"):
+        ConfidenceEvidenceVisualizer(df.copy()).plot_evidence_length_vs_confidence(
+            mode=mode
+        )
+        titles = [ax.get_title() for ax in plt.gcf().axes if ax.get_title()]
+        plt.close("all")
+        assert "unlabelled (n=10)" in titles
+        assert sum(int(t.split("n=")[1].rstrip(")")) for t in titles) == 100
+
+    empty = df.assign(confidence=np.nan)
+    for mode in ("hexbin", "hist2d"):
+        ConfidenceEvidenceVisualizer(empty).plot_evidence_length_vs_confidence(
+            mode=mode
+        )
+        plt.close("all")
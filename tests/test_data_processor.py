@@ -0,0 +1,79 @@
+import pandas as pd
+from types import SimpleNamespace
+
+MAPPING = {"tags_mapping": {"c1": ["Retail", "Abha"], "c2": ["Events", "Riyadh"]}}
+CSV = (
+    "id,content,date,language,tags,title,ratings\n"
+    "r1,the mall,2021-04-11T06:45:00+00:00,eng,\"[{'value': 'c1', 'sentiment': None}, "
+    "{'value': 'c2', 'sentiment': None}]\",Nice,\"{'normalized': 80, 'raw': 4}\"\n"
+    "r2,,2021-05-11T06:45:00+00:00,ara,[],,\n"
+    "r3,great festival,2021-06-11T06:45:00+00:00,eng,\"[{'value': 'c2', "
+    "'sentiment': None}]\",,\"{'normalized': 100, 'raw': 5}\"\n"
+)
+
+
+def test_process_in_chunks_matches_in_memory_processing(tmp_path, monkeypatch):
+    from src.data.data_processor import DataFrameProcessor
+    from src.data.loader import read_processed, read_reviews_csv
+
+    fake = SimpleNamespace(
+        words=lambda language: ["the"] if language == "english" else []
+    )
+    monkeypatch.setattr("nltk.corpus.stopwords", fake)
+
+    data_path = tmp_path / "dataset.csv"
+    data_path.write_text(CSV, encoding="utf-8")
+    stages = [
+        ("process_ratings", {}),
+        ("process_tags", {}),
+        ("process_text", {}),
+        ("process_tokens", {"fast": True, "n_jobs": 1}),
+    ]
+
+    parts = DataFrameProcessor.process_in_chunks(
+        data_path, MAPPING, tmp_path / "parts", chunksize=1, stages=stages
+    )
+    chunked = read_processed(tmp_path / "parts")
+
+    processor = DataFrameProcessor(read_reviews_csv(data_path), MAPPING)
+    for method, params in stages:
+        getattr(processor, method)(**params)
+
+    assert len(parts) == 3
+    # Every part carries the pair columns of the longest tag list, even the empty one
+    assert pd.read_parquet(parts[1]).filter(like="offer").columns.tolist() == [
+        "offer",
+        "offer_2",
+    ]
+    assert chunked["tokens"].tolist() == [["mall"], [], ["great", "festival"]]
+    pd.testing.assert_frame_equal(
+        chunked.astype(str).replace("None", "<NA>"),
+        processor.df.astype(str).replace("None", "<NA>"),
+    )
+
+
+def test_process_in_chunks_with_several_missing_tags_per_chunk(tmp_path):
+    from src.data.data_processor import DataFrameProcessor
+    from src.data.loader import read_processed
+
+    rows = [
+        "r4,a,2021-07-11T06:45:00+00:00,eng,,,\n",
+        "r5,b,2021-07-12T06:45:00+00:00,eng,,,\n",
+        "r6,c,2021-07-13T06:45:00+00:00,eng,not-a-list,,\n",
+        "r7,d,2021-07-14T06:45:00+00:00,eng,broken too,,\n",
+    ]
+    data_path = tmp_path / "dataset.csv"
+    data_path.write_text(CSV + "".join(rows), encoding="utf-8")
+
+    parts = DataFrameProcessor.process_in_chunks(
+        data_path,
+        MAPPING,
+        tmp_path / "parts",
+        chunksize=4,
+        stages=[("process_tags", {})],
+    )
+    chunked = read_processed(tmp_path / "parts")
+
+    assert len(parts) == 2
+    assert chunked["offer"].tolist()[:4] == ["Retail", None, "Events", None]
+    assert chunked["offer"].iloc[4:].isna().all()
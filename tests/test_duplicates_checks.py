@@ -0,0 +1,63 @@
+import pandas as pd
+
+
+def _wide():
+    return pd.DataFrame(
+        {
+            "id": ["r1", "r2", "r3"],
+            "offer": ["Retail", "Retail", "Religious"],
+            "destination": ["Abha", "Abha", "Madinah"],
+            "offer_2": ["Retail", "Accommodation", pd.NA],
+            "destination_2": ["Abha", "Abha", pd.NA],
+            "offer_3": [pd.NA, "Retail", pd.NA],
+            "destination_3": [pd.NA, None, pd.NA],
+        },
+        index=[10, 20, 30],
+    )
+
+
+def test_find_duplicates_wide_layout():
+    from src.data.duplicates_checks import find_duplicate_offer_destination
+
+    duplicates = find_duplicate_offer_destination(_wide())
+
+    assert duplicates.to_dict("records") == [
+        {
+            "row": 10,
+            "id": "r1",
+            "offer": "Retail",
+            "destination": "Abha",
+            "count": 2,
+        }
+    ]
+
+
+def test_find_duplicates_long_layout_and_print_count(capsys):
+    from src.data.duplicates_checks import (
+        find_duplicate_offer_destination,
+        print_duplicate_offer_destination,
+    )
+
+    bridge = pd.DataFrame(
+        {
+            "id": ["r1", "r1", "r2", "r2"],
+            "offer": pd.Categorical(["Retail", "Retail", "Retail", "Religious"]),
+            "destination": pd.Categorical(["Abha", "Abha", "Abha", "Abha"]),
+        }
+    )
+
+    duplicates = find_duplicate_offer_destination(bridge, layout="long")
+    assert duplicates[["id", "count"]].values.tolist() == [["r1", 2]]
+
+    assert print_duplicate_offer_destination(_wide()) == 1
+    assert "Retail" in capsys.readouterr().out
+
+
+def test_print_count_with_repeated_index_labels(capsys):
+    from src.data.duplicates_checks import print_duplicate_offer_destination
+
+    # Two reviews share index label 10; both repeat a pair
+    wide = pd.concat([_wide(), _wide().iloc[[0]]])
+    assert list(wide.index) == [10, 20, 30, 10]
+    assert print_duplicate_offer_destination(wide) == 2
+    assert "position" not in capsys.readouterr().out
@@ -0,0 +1,35 @@
+import pandas as pd
+
+
+def test_detect_language_column_uses_script_ratio():
+    from src.data.language_id import detect_language, detect_language_column
+
+    texts = pd.Series(
+        ["Great staff", "الفندق رائع", "ممتاز جدا very good", "👍 123", None],
+        index=[4, 3, 2, 1, 0],
+    )
+    detected = detect_language_column(texts)
+
+    assert detected.index.equals(texts.index)
+    assert detected.tolist() == ["eng", "ara", "ara", "eng", "eng"]
+    assert detect_language("Très bien") == "eng"
+
+
+def test_fill_language_keeps_known_codes_unless_overwritten():
+    from src.data.language_id import fill_language
+
+    df = pd.DataFrame(
+        {
+            "text_for_analysis": ["hello there", "مرحبا", "مرحبا", "123"],
+            "language": [None, "fra", "eng", "ara"],
+        }
+    )
+
+    assert fill_language(df).tolist() == ["eng", "ara", "eng", "ara"]
+    assert fill_language(df, overwrite=True).tolist() == ["eng", "ara", "ara", "ara"]
+    assert fill_language(df.drop(columns="language")).tolist() == [
+        "eng",
+        "ara",
+        "ara",
+        "eng",
+    ]
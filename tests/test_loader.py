@@ -0,0 +1,37 @@
+import os
+import pandas as pd
+
+CSV = (
+    "id,content,date,language,tags,title,ratings\n"
+    'r1,"great\nstay",2021-04-11T06:45:00+00:00,eng,[],Nice,"{\'raw\': 5}"\n'
+    "r2,,2022-01-02T10:00:00+00:00,ara,[],,\n"
+)
+
+
+def test_read_reviews_csv_types_columns(tmp_path):
+    from src.data.loader import read_reviews_csv
+
+    path = tmp_path / "dataset.csv"
+    path.write_text(CSV, encoding="utf-8")
+    df = read_reviews_csv(path)
+
+    assert str(df["date"].dtype) == "datetime64[ns, UTC]"
+    assert df["language"].dtype == "category"
+    assert df["content"].tolist()[0] == "great\nstay"
+    assert df["date"].equals(pd.to_datetime(pd.read_csv(path)["date"]))
+
+
+def test_load_reviews_reuses_and_refreshes_feather_cache(tmp_path):
+    from src.data.loader import load_reviews
+
+    path, cache_path = tmp_path / "dataset.csv", tmp_path / "cache" / "dataset.feather"
+    path.write_text(CSV, encoding="utf-8")
+    first = load_reviews(path, cache_path)
+    assert cache_path.exists()
+    pd.testing.assert_frame_equal(load_reviews(path, cache_path), first)
+
+    # A newer CSV invalidates the cached copy
+    path.write_text(CSV.replace("Nice", "Great"), encoding="utf-8")
+    stamp = cache_path.stat().st_mtime + 10
+    os.utime(path, (stamp, stamp))
+    assert load_reviews(path, cache_path)["title"].tolist()[0] == "Great"
@@ -0,0 +1,31 @@
+def test_cluster_groups_near_duplicates_and_keeps_distinct_texts():
+    from src.data.near_duplicates import NearDuplicateIndex, inference_saved
+
+    texts = [
+        "the hotel was great and the staff were friendly",
+        "الفندق رائع جدا والخدمة ممتازة",
+        "The hotel was great, and the staff were friendly!! 👍",
+        "the hotel was great and the staff were very friendly",
+        "terrible food and a long wait at the entrance",
+        "الفندق رائع جدا والخدمة ممتازة ❤",
+        "",
+        None,
+    ]
+    labels = NearDuplicateIndex(threshold=0.7).cluster(texts)
+
+    assert labels.tolist() == [0, 1, 0, 0, 4, 1, 6, 6]
+    assert inference_saved(labels) == 0.5
+
+
+def test_signatures_estimate_jaccard_similarity():
+    from src.data.near_duplicates import NearDuplicateIndex
+
+    index = NearDuplicateIndex(num_perm=256, bands=32)
+    a = "the hotel was great and the staff were friendly"
+    b = "the hotel was great and the staff were very friendly"
+    shingles = [{t[i : i + 5] for i in range(len(t) - 4)} for t in (a, b)]
+    jaccard = len(shingles[0] & shingles[1]) / len(shingles[0] | shingles[1])
+
+    signatures = index.signatures([a, b, ""])
+    assert abs((signatures[0] == signatures[1]).mean() - jaccard) < 0.1
+    assert (signatures[2] == signatures.max()).all()
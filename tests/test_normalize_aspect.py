@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+
+def test_arabic_spelling_variants_share_a_key():
+    from src.post_analysis.normalize_aspect import normalize_aspect
+
+    assert normalize_aspect("الغرفة") == normalize_aspect("الغرفه")
+    assert normalize_aspect("الأسعار") == normalize_aspect("الاسعار")
+    assert normalize_aspect("خدمااااات") == "خدمات"
+    assert normalize_aspect("الثَّقلين،") == "الثقلين"
+    # English aspects keep the plural rules
+    assert normalize_aspect(' "Breakfast  Buffets') == "breakfast buffet"
+    assert normalize_aspect(None) == ""
+
+
+def test_bulk_normalization_matches_row_wise():
+    from src.post_analysis.normalize_aspect import (
+        ARABIC_LETTER_FORMS,
+        normalize_aspect,
+        normalize_aspects,
+    )
+
+    aspects = pd.Series(
+        ["Rooms", None, "rooms", "الغرفة", np.nan, "Rooms", "staff", 3.0] * 50,
+        index=np.arange(400) * 2,
+    )
+    normalized = normalize_aspects(aspects)
+
+    assert normalized.index.equals(aspects.index)
+    # Same keys as row-wise; labels only keep the unfolded Arabic spelling
+    assert (
+        normalized.str.translate(ARABIC_LETTER_FORMS).tolist()
+        == aspects.apply(normalize_aspect).tolist()
+    )
+    assert normalized[6] == "الغرفة"
+    assert normalize_aspects(["Rooms", None]).tolist() == ["room", ""]
+
+
+def test_arabic_keys_are_labelled_with_their_most_frequent_spelling():
+    from src.post_analysis.normalize_aspect import normalize_aspects
+
+    aspects = ["الغرفه", "الغرفة", "الغرفة،", "مستوي", "مستوى", None]
+    # One label per key; ties go to the alphabetically first spelling
+    assert normalize_aspects(aspects).tolist() == [
+        "الغرفة",
+        "الغرفة",
+        "الغرفة",
+        "مستوى",
+        "مستوى",
+        "",
+    ]
+
+
+def test_consolidation_counts_and_bounded_variants():
+    from src.post_analysis.normalize_aspect import clean_and_consolidate_data
+
+    aspect_df = pd.DataFrame(
+        {
+            "aspect": ["Rooms", "room ", "ROOMS", "Room", None, "staff", "x", "Rooms"],
+            "aspect_normalized": [
+                "room",
+                "room",
+                "room",
+                "room",
+                "room",
+                " ",
+                "x",
+                None,
+            ],
+        }
+    )
+    result = clean_and_consolidate_data(aspect_df, max_examples=2)
+
+    assert result.index.tolist() == ["room", "x"]
+    assert result["count"].tolist() == [4, 1]
+    assert result["n_variants"].tolist() == [4, 1]
+    assert result.loc["room", "original_variants"] == ["ROOMS", "Room"]
+
+    everything = clean_and_consolidate_data(aspect_df.drop(columns="aspect_normalized"))
+    assert everything.loc["room", "count"] == 5
+    assert everything.loc["room", "original_variants"] == [
+        "ROOMS",
+        "Room",
+        "Rooms",
+        "room",
+    ]
@@ -0,0 +1,84 @@
+import json
+import pandas as pd
+
+STAGES = [
+    ("ratings", "process_ratings", {"columns": ["normalized_ratings", "raw_ratings"]}),
+    ("tags", "process_tags", {}),
+]
+
+
+def _inputs(tmp_path):
+    data_path, mapping_path = tmp_path / "dataset.csv", tmp_path / "mappings.json"
+    pd.DataFrame(
+        {
+            "id": ["r1", "r2"],
+            "ratings": ["{'normalized': 80, 'raw': 4}", "{'normalized': 20, 'raw': 1}"],
+            "tags": ["[{'value': 'c1', 'sentiment': None}]", "[]"],
+        }
+    ).to_csv(data_path, index=False)
+    mapping_path.write_text(json.dumps({"tags_mapping": {"c1": ["Retail", "Abha"]}}))
+    return data_path, mapping_path
+
+
+def test_pipeline_reuses_cached_stages(tmp_path, monkeypatch):
+    from src.data.pipeline import ReviewPipeline
+    from src.data.rating_extractor import RatingExtractor
+    from src.data.tag_parser import TagParser
+
+    data_path, mapping_path = _inputs(tmp_path)
+    pipeline = ReviewPipeline(data_path, mapping_path, tmp_path / "cache", STAGES)
+    first = pipeline.run(verbose=False)
+    assert first["normalized_ratings"].tolist() == [80.0, 20.0]
+    assert first["offer"].tolist()[0] == "Retail"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stage should have been loaded from the cache")
+
+    # Patch what the stages call, not the stage methods, which are fingerprinted
+    monkeypatch.setattr(RatingExtractor, "extract_ratings_bulk", staticmethod(fail))
+    monkeypatch.setattr(TagParser, "flatten_tags", staticmethod(fail))
+    second = pipeline.run(verbose=False)
+    pd.testing.assert_frame_equal(first, second)
+    assert second["offer"].tolist() == ["Retail", pd.NA]
+
+
+def test_pipeline_fingerprint_tracks_inputs_and_params(tmp_path):
+    from src.data.pipeline import ReviewPipeline
+
+    data_path, mapping_path = _inputs(tmp_path)
+    pipeline = ReviewPipeline(data_path, mapping_path, tmp_path / "cache", STAGES)
+    before = pipeline.fingerprints()
+
+    mapping_path.write_text(json.dumps({"tags_mapping": {"c1": ["Retail", "Jeddah"]}}))
+    assert pipeline.fingerprints()[0] != before[0]
+
+    renamed = [("ratings", "process_ratings", {})] + STAGES[1:]
+    other = ReviewPipeline(data_path, mapping_path, tmp_path / "cache", renamed)
+    assert other.fingerprints()[0] != pipeline.fingerprints()[0]
+
+
+def test_stage_fingerprint_tracks_the_stage_source(tmp_path):
+    from src.data.data_processor import DataFrameProcessor
+    from src.data.pipeline import stage_code_version
+
+    # Stages defined in the same module still get their own version
+    assert stage_code_version(DataFrameProcessor.process_ratings) != (
+        stage_code_version(DataFrameProcessor.process_tags)
+    )
+
+    def load(source):
+        stage_module = tmp_path / f"custom_stages_{len(list(tmp_path.iterdir()))}.py"
+        stage_module.write_text(source)
+        namespace = {}
+        exec(compile(source, str(stage_module), "exec"), namespace)
+        return namespace["first"], namespace["second"]
+
+    first, second = load(
+        "def first(self):\n    return 1\n\n\ndef second(self):\n    return 2\n"
+    )
+    edited_first, same_second = load(
+        "def first(self):\n    return 10\n\n\ndef second(self):\n    return 2\n"
+    )
+    # Editing one stage leaves the other stage's version, hence its cache, intact
+    assert stage_code_version(edited_first) != stage_code_version(first)
+    assert stage_code_version(same_second) == stage_code_version(second)
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def aspect_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "aspect_normalized": rng.choice(["room", "staff", "الغرفه", None], n),
+            "polarity": rng.choice(
+                ["Positive", "NEGATIVE", "negative", "Neutral", None], n
+            ),
+            "offer": rng.choice(["Hotel", "Park", None], n),
+            "destination": rng.choice(["Riyadh", "Jeddah"], n),
+            "date": pd.Timestamp("2024-01-15")
+            + pd.to_timedelta(rng.integers(0, 90, n), unit="D"),
+            "model": "pyabsa-multilingual",
+        }
+    )
+
+
+def test_encode_polarity_lowercases_labels():
+    from src.post_analysis.polarity_aggregates import encode_polarity
+
+    encoded = encode_polarity(pd.Series(["Positive", "NEGATIVE", None, "conflict"]))
+
+    assert list(encoded.categories) == ["positive", "neutral", "negative", "other"]
+    assert encoded.tolist()[:2] == ["positive", "negative"]
+    assert pd.isna(encoded[2]) and encoded[3] == "other"
+
+
+def test_rollups_match_row_wise_group_bys():
+    from src.post_analysis.polarity_aggregates import PolarityAggregates
+
+    df = aspect_frame(2000)
+    aggregates = PolarityAggregates.from_frame(df)
+    pol = df["polarity"].astype(str).str.lower()
+    df["month"] = df["date"].dt.to_period("M").dt.to_timestamp()
+
+    for by in ["offer", ["aspect_normalized", "offer"], "month"]:
+        expected = (
+            df.assign(is_neg=pol.eq("negative"), is_pos=pol.eq("positive"))
+            .groupby(by)
+            .agg(n=("is_neg", "size"), neg=("is_neg", "mean"), pos=("is_pos", "mean"))
+        )
+        shares = aggregates.shares(by)
+        assert shares.index.equals(expected.index)
+        assert shares["n_rows"].tolist() == expected["n"].tolist()
+        assert np.allclose(shares["negative_share"], expected["neg"])
+        assert np.allclose(shares["positive_share"], expected["pos"])
+
+    negatives = df.loc[pol.eq("negative"), "aspect_normalized"].value_counts()
+    top = aggregates.top("aspect_normalized", "negative")
+    assert top.to_dict() == negatives.to_dict()
+    assert aggregates.counts("offer") is aggregates.counts(["offer"])
+
+
+def test_visualizers_share_one_aggregate(monkeypatch):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.post_analysis import aspects_analyzer, aspects_visualizer, negative_ana
+    from src.post_analysis.polarity_aggregates import PolarityAggregates
+
+    monkeypatch.setattr(plt, "show", lambda: plt.close("all"))
+    monkeypatch.setattr(aspects_analyzer, "display_arabic_labels", lambda x: x)
+    monkeypatch.setattr(aspects_visualizer, "display_arabic_labels", lambda x: x)
+    monkeypatch.setattr(negative_ana, "display_arabic_labels", lambda x: x)
+    df = aspect_frame(500)
+    aggregates = PolarityAggregates.from_frame(df)
+    monkeypatch.setattr(
+        PolarityAggregates,
+        "from_frame",
+        classmethod(lambda cls, *a, **k: pytest.fail("aggregates rebuilt")),
+    )
+
+    aspects_analyzer.AspectVisualization(df, aggregates).plot_all()
+    aspects_visualizer.AspectAnalysisself(df, aggregates).plot_all()
+    negative_ana.NegativeAnalysisVisualizer(df, aggregates).plot_all()
+
+
+def test_polarity_distribution_keeps_an_other_bar(monkeypatch):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.post_analysis.aspects_analyzer import AspectVisualization
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+
+    def bars(polarities):
+        df = pd.DataFrame({"polarity": polarities, "model": "pyabsa-multilingual"})
+        AspectVisualization(df).plot_polarity_distribution()
+        ax = plt.gca()
+        drawn = {
+            t.get_text(): p.get_height()
+            for t, p in zip(ax.get_xticklabels(), ax.patches)
+        }
+        plt.close("all")
+        return drawn
+
+    assert bars(["Positive", "mixed", "Mixed", "negative", None]) == {
+        "Other": 2,
+        "Positive": 1,
+        "Negative": 1,
+    }
+    assert "Other" not in bars(["Positive", "neutral"])
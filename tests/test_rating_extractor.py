@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+
+def test_extract_ratings_bulk_matches_row_by_row():
+    from src.data.rating_extractor import RatingExtractor
+
+    ratings = pd.Series(
+        [
+            "{'normalized': 100, 'raw': 5}",
+            "{'normalized': 90, 'raw': 4.5}",
+            "{'raw': 3, 'normalized': 60}",
+            {"normalized": 40, "raw": 2},
+            "[{'normalized': 20, 'raw': 1}]",
+            [1, 2],
+            "not a dict",
+            None,
+            np.nan,
+        ],
+        index=[10, 11, 12, 13, 14, 15, 16, 17, 17],
+    )
+
+    bulk = RatingExtractor.extract_ratings_bulk(ratings)
+    # The scalar parser cannot take list objects, so compare the others row by row
+    is_list = ratings.map(type).eq(list)
+    scalar = ratings[~is_list].apply(RatingExtractor.extract_ratings)
+
+    pd.testing.assert_frame_equal(bulk[~is_list], scalar.astype("float64"))
+    assert bulk[is_list].isna().all().all()
+
+    assert list(bulk.columns) == ["normalized", "raw"]
+    assert bulk.dtypes.tolist() == [np.dtype("float64")] * 2
+    assert bulk["raw"].tolist()[:4] == [5.0, 4.5, 3.0, 2.0]
+    assert bulk.iloc[4:].isna().all().all()
+
+
+def test_extract_ratings_bulk_on_all_missing_float_columns():
+    from src.data.rating_extractor import RatingExtractor
+
+    # read_csv gives float64 when every rating of a slice is missing
+    missing = pd.Series([np.nan, np.nan], index=[3, 4])
+    bulk = RatingExtractor.extract_ratings_bulk(missing)
+    assert bulk.index.equals(missing.index)
+    assert bulk.isna().all().all()
+
+    empty = RatingExtractor.extract_ratings_bulk(pd.Series([], dtype=float))
+    assert empty.empty and list(empty.columns) == ["normalized", "raw"]
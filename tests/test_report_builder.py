@@ -0,0 +1,68 @@
+import json
+import pandas as pd
+
+FIGURES = [
+    (
+        "ConfidenceEvidenceVisualizer.plot_confidence_distribution",
+        "aspects",
+        "src.post_analysis.confidence_viz:ConfidenceEvidenceVisualizer",
+        "plot_confidence_distribution",
+        {},
+    ),
+    (
+        "ConfidenceEvidenceVisualizer.plot_evidence_length_vs_confidence",
+        "aspects",
+        "src.post_analysis.confidence_viz:ConfidenceEvidenceVisualizer",
+        "plot_evidence_length_vs_confidence",
+        {},
+    ),
+]
+
+
+def aspect_frame(confidence=0.9):
+    return pd.DataFrame(
+        {
+            "confidence": [confidence, 0.5, 0.7, 0.99],
+            "evidence_span": ["room", "staff", None, "coffee"],
+            "polarity": ["Positive", "Negative", "Neutral", "Positive"],
+        }
+    )
+
+
+def test_build_renders_then_reuses_unchanged_figures(tmp_path):
+    from src.reporting.builder import ReportBuilder
+
+    def build(frame, **kwargs):
+        builder = ReportBuilder(
+            {"aspects": frame}, tmp_path, figures=FIGURES, max_workers=2, **kwargs
+        )
+        return builder.build(verbose=False)
+
+    first = build(aspect_frame(), formats=("png", "svg"))
+    assert len(first["rendered"]) == 2 and first["reused"] == []
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+    for name, *_ in FIGURES:
+        assert manifest[name]["error"] is None
+        assert manifest[name]["files"] == [f"{name}-0.png", f"{name}-0.svg"]
+        assert (tmp_path / "figures" / f"{name}-0.svg").exists()
+    index = (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert index.count("<img ") == 2 and "ConfidenceEvidenceVisualizer" in index
+
+    # Same data: nothing to render; changed data: every figure of that source
+    assert build(aspect_frame(), formats=("png", "svg"))["rendered"] == []
+    assert len(build(aspect_frame(0.1), formats=("png", "svg"))["rendered"]) == 2
+    assert not list(tmp_path.glob(".source-*"))
+
+
+def test_discover_figures_skips_plot_all_and_required_arguments():
+    from src.reporting.builder import discover_figures
+
+    figures = discover_figures(
+        [("reviews", "src.eda.destination_offer_analysis:Plotter")]
+    )
+
+    assert [f[0] for f in figures] == [
+        "Plotter.plot_heatmap",
+        "Plotter.plot_rating_comparison",
+    ]
@@ -0,0 +1,89 @@
+import sqlite3
+
+import pandas as pd
+
+
+def _sample_predictions():
+    return pd.DataFrame(
+        {
+            "text_id": [0, 0, 1, 2],
+            "aspect": ["staff", "room", "coffee", "parking"],
+            "aspect_normalized": ["staff", "room", "coffee", "parking"],
+            "polarity": ["Positive", "Negative", "Positive", "Negative"],
+            "confidence": [0.9, 0.2, 0.8, 0.7],
+            "offer": ["Accommodation", "Accommodation", "Food & Beverage", "Retail"],
+            "destination": ["Abha", "Abha", "Riyadh", "Riyadh"],
+            "date": [
+                "2021-04-11T06:45:00+00:00",
+                "2021-04-11T06:45:00+00:00",
+                "2021-05-02T10:00:00+00:00",
+                "2021-05-20T10:00:00+00:00",
+            ],
+            "language": ["eng", "eng", "eng", "ara"],
+        }
+    )
+
+
+def test_write_creates_indexes(tmp_path):
+    from src.post_analysis.result_store import ResultStore
+
+    store = ResultStore(tmp_path / "results.sqlite3")
+    assert store.write(_sample_predictions()) == 4
+
+    with sqlite3.connect(store.path) as con:
+        indexes = {
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+
+    for col in ["aspect", "polarity", "offer", "destination", "month"]:
+        assert f"ix_aspect_results_{col}" in indexes
+
+
+def test_query_filters_rows_and_columns(tmp_path):
+    from src.post_analysis.result_store import ResultStore
+
+    store = ResultStore(tmp_path / "results.sqlite3")
+    store.write(_sample_predictions())
+
+    df = store.query(
+        columns=["aspect", "polarity", "month"],
+        destination="Riyadh",
+        polarity=["Negative", "Neutral"],
+    )
+
+    assert list(df.columns) == ["aspect", "polarity", "month"]
+    assert df["aspect"].tolist() == ["parking"]
+    assert df["month"].tolist() == [pd.Timestamp("2021-05-01")]
+
+    counts = store.count_by("month")
+    assert counts.set_index("month")["n"].to_dict() == {
+        pd.Timestamp("2021-04-01"): 2,
+        pd.Timestamp("2021-05-01"): 2,
+    }
+
+
+def test_connections_are_closed_and_unknown_columns_rejected(tmp_path, monkeypatch):
+    import pytest
+    from src.post_analysis import result_store
+    from src.post_analysis.result_store import ResultStore
+
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        opened.append(connect(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(result_store.sqlite3, "connect", tracking_connect)
+    store = ResultStore(tmp_path / "results.sqlite3")
+    store.write(_sample_predictions())
+    assert len(store.query(columns=["aspect"], offer="Retail")) == 1
+
+    for con in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            con.execute("SELECT 1")
+    with pytest.raises(ValueError, match="not_a_column"):
+        store.query(columns=["not_a_column"])
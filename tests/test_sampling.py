@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+
+def review_frame(n=2000):
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "offer": rng.choice(["Retail", "Hotel", "Food"], n, p=[0.6, 0.3, 0.1]),
+            "destination": rng.choice(["Abha", "Riyadh"], n),
+            "language": rng.choice(["ara", "eng"], n),
+            "date": pd.Timestamp("2023-01-01", tz="UTC")
+            + pd.to_timedelta(rng.integers(0, 90, n), unit="D"),
+            "normalized_ratings": rng.uniform(0, 100, n),
+            "title": rng.choice(["good", "bad", None], n),
+        }
+    )
+
+
+def test_sample_is_reproducible_and_stratified():
+    from src.eda.sampling import StratifiedSample, allocate
+
+    assert allocate(np.array([60, 30, 9, 1]), 10).tolist() == [6, 3, 2, 1]
+
+    df = review_frame()
+    sample = StratifiedSample(df, 200, seed=3)
+
+    assert sample.strata == ["offer", "destination", "language", "month"]
+    assert sample.frame.index.equals(StratifiedSample(df, 200, seed=3).frame.index)
+    assert not sample.frame.index.equals(StratifiedSample(df, 200, seed=4).frame.index)
+    assert 200 <= len(sample) <= 200 + 2 * len(sample.stratum_sizes)
+    assert np.isclose(sample.weights.sum(), len(df))
+
+    # Stratum columns are estimated exactly, other columns with a standard error
+    offers = sample.counts("offer")
+    assert (
+        offers["count"].round().astype(int).to_dict()
+        == df["offer"].value_counts().to_dict()
+    )
+    assert (offers["se"] < 1e-9).all()
+    titles = sample.counts("title")
+    assert (titles["se"] > 0).all()
+    assert (abs(titles["count"] - df["title"].value_counts()) < 4 * titles["se"]).all()
+
+    mean, se = sample.mean("normalized_ratings")
+    assert 0 < se < 5
+    assert abs(mean - df["normalized_ratings"].mean()) < 4 * se
+
+
+def test_visualizer_plots_sample_with_footer(monkeypatch):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.eda.visiualizations import ReviewDataVisualizer
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+    df = review_frame()
+    full = ReviewDataVisualizer(df, sample_size=len(df))
+    assert full.sample is None and full.df is df
+
+    visualizer = ReviewDataVisualizer(df, sample_size=300)
+    assert len(visualizer.df) < len(df)
+    visualizer.plot_offering_distribution()
+    texts = [t.get_text() for t in plt.gcf().texts]
+    plt.close("all")
+    assert any(t.startswith("Stratified sample:") for t in texts)
+
+
+def test_sample_quantiles_and_std_are_weighted():
+    from src.eda.sampling import StratifiedSample
+
+    # Equal weights reproduce the pandas estimates
+    df = review_frame()
+    whole = StratifiedSample(df, len(df), strata=())
+    ratings = df["normalized_ratings"]
+    assert np.isclose(whole.quantile("normalized_ratings", 0.5), ratings.median())
+    assert np.isclose(
+        whole.quantile("normalized_ratings", 0.95), ratings.quantile(0.95)
+    )
+    assert np.isclose(whole.std("normalized_ratings"), ratings.std())
+
+    # 900 short and 100 long reviews, long ones oversampled: the weights restore the mix
+    skewed = pd.DataFrame(
+        {
+            "offer": ["short"] * 900 + ["long"] * 100,
+            "word_count": [10] * 900 + [500] * 100,
+        }
+    )
+    sample = StratifiedSample(skewed, 20, min_per_stratum=10)
+    assert sample.frame["word_count"].quantile(0.75) == 500
+    assert sample.quantile("word_count", 0.75) == 10
+    assert sample.quantile("word_count", 0.95) == 500
+    assert np.isclose(sample.std("word_count"), skewed["word_count"].std(), rtol=0.01)
+
+
+def test_visualizer_prints_weighted_statistics(monkeypatch, capsys):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from src.eda.visiualizations import ReviewDataVisualizer
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+    df = pd.DataFrame(
+        {
+            "offer": ["short"] * 900 + ["long"] * 100,
+            "language": ["ara"] * 700 + ["eng"] * 300,
+            "word_count": [10] * 900 + [500] * 100,
+        }
+    )
+    visualizer = ReviewDataVisualizer(df, sample_size=100)
+    visualizer.plot_word_count_distribution()
+    visualizer.plot_language_distribution()
+    plt.close("all")
+
+    out = capsys.readouterr().out
+    assert "Median word count: 10\n" in out
+    assert "95th percentile: 500\n" in out
+    assert "Max word count: 500 (in sample)" in out
+    assert "% of reviews with ≤100 words: 90.0%" in out
+    assert "Arabic reviews: 700 (70.0%)" in out
+    assert "English reviews: 300 (30.0%)" in out
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _modules_after_import(statement):
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(output.split())
+
+
+def test_importing_app_does_not_load_the_model_stack():
+    modules = _modules_after_import("import app")
+
+    assert not {"pyabsa", "torch", "transformers", "nltk", "scipy"} & modules
+
+
+def test_stopwords_are_loaded_once_and_shared(monkeypatch):
+    from types import SimpleNamespace
+    from src.data.text_cleaner import TextCleaner
+    from src.data.tokenizer import TextTokenizer
+
+    calls = []
+
+    def words(language):
+        calls.append(language)
+        return ["the"]
+
+    monkeypatch.setattr("nltk.corpus.stopwords", SimpleNamespace(words=words))
+    cleaner, tokenizer = TextCleaner(), TextTokenizer()
+    TextCleaner()
+
+    assert sorted(calls) == ["arabic", "english"]
+    assert cleaner.stop_words_eng is tokenizer.english_stopwords
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+
+def review_frame():
+    return pd.DataFrame(
+        {
+            "id": [str(i) for i in range(7)],
+            "destination": ["Abha", "Abha", "Riyadh", "Riyadh", None, "Abha", "Jeddah"],
+            "offer": ["Retail", "Hotel", "Retail", None, "Hotel", "Retail", "Hotel"],
+            "language": pd.Categorical(
+                ["ara", "eng", "ara", "ara", "eng", "eng", "ara"]
+            ),
+            "date": pd.to_datetime(
+                ["2023-01-05", "2023-01-20", "2023-02-01", "2023-02-11"] * 2, utc=True
+            )[:7],
+            "normalized_ratings": [80.0, 60.0, np.nan, 100.0, 40.0, 90.0, 20.0],
+            "word_count": [10, 3, 7, 12, 5, 1, 8],
+        }
+    )
+
+
+def test_stats_match_groupby():
+    from src.eda.stats_cube import StatsCube
+
+    df = review_frame()
+    cube = StatsCube.from_frame(df)
+
+    assert cube.dimensions == ["destination", "offer", "language", "month"]
+    for by in ["destination", "offer", "language", "month", ["destination", "offer"]]:
+        keys = df["date"].dt.tz_convert(None).dt.to_period("M") if by == "month" else by
+        expected = df.groupby(keys, observed=True)["normalized_ratings"].agg(
+            ["count", "mean", "std", "min", "max"]
+        )
+        stats = cube.stats(by, "normalized_ratings")
+        assert list(stats.index) == list(expected.index)
+        assert np.allclose(
+            stats[expected.columns].to_numpy(float),
+            expected.to_numpy(float),
+            equal_nan=True,
+        )
+    assert cube.stats("offer", "word_count")["n_rows"].tolist() == [3, 3]
+
+
+def test_analyzer_and_plotter_answer_from_cube(monkeypatch):
+    from src.eda.destination_offer_analysis import DataAnalyzer, Plotter
+    from src.eda.stats_cube import StatsCube
+
+    df = review_frame()
+    from_cube = DataAnalyzer(df).analyze_grouped_data(
+        "destination", "normalized_ratings"
+    )
+    from_rows = DataAnalyzer(df, cube=StatsCube(pd.DataFrame(), [], []))
+    pd.testing.assert_frame_equal(
+        from_cube,
+        from_rows.analyze_grouped_data("destination", "normalized_ratings"),
+        check_dtype=False,
+    )
+
+    # The heatmap only reads the cube
+    captured = {}
+    monkeypatch.setattr(
+        "src.eda.destination_offer_analysis.sns.heatmap",
+        lambda data, **kwargs: captured.setdefault("data", data),
+    )
+    monkeypatch.setattr("src.eda.destination_offer_analysis.plt.show", lambda: None)
+    plotter = Plotter(df.iloc[:0], cube=StatsCube.from_frame(df))
+    plotter.plot_heatmap()
+    expected = pd.crosstab(df["destination"], df["offer"])
+    pd.testing.assert_frame_equal(
+        captured["data"].sort_index(), expected, check_names=False, check_dtype=False
+    )
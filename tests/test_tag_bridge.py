@@ -0,0 +1,81 @@
+import pandas as pd
+
+MAPPING = {
+    "tags_mapping": {
+        "c1": ["Accommodation", "Abha"],
+        "c2": ["Retail", "Riyadh"],
+        "c3": ["Retail", "Abha"],
+    }
+}
+
+
+def _reviews():
+    return pd.DataFrame(
+        {
+            "id": ["r1", "r2", "r3"],
+            "tags": [
+                "[{'value': 'c1', 'sentiment': None}, {'value': 'c2', 'sentiment': None}]",
+                "[{'value': 'c3', 'sentiment': None}, {'value': 'c3', 'sentiment': None}]",
+                "[]",
+            ],
+            "rating": [100, 80, 60],
+        }
+    )
+
+
+def test_build_tag_bridge_is_long_and_categorical():
+    from src.data.tag_bridge import build_tag_bridge
+
+    bridge = build_tag_bridge(_reviews(), MAPPING)
+
+    assert bridge[["id", "pair"]].values.tolist() == [["r1", 1], ["r1", 2], ["r2", 1]]
+    assert bridge["offer"].dtype == "category"
+    assert list(bridge["offer"].cat.categories) == ["Accommodation", "Retail"]
+    assert bridge["destination"].astype(str).tolist() == ["Abha", "Riyadh", "Abha"]
+
+    with_repeats = build_tag_bridge(_reviews(), MAPPING, drop_duplicates=False)
+    assert len(with_repeats) == 4
+
+
+def test_bridge_from_wide_matches_bridge_from_tags():
+    from src.data.tag_bridge import bridge_from_wide, build_tag_bridge
+    from src.data.tag_parser import TagParser
+
+    wide = TagParser.flatten_tags(_reviews(), MAPPING)
+
+    from_wide = bridge_from_wide(wide)
+    from_tags = build_tag_bridge(_reviews(), MAPPING)
+
+    pd.testing.assert_frame_equal(
+        from_wide.astype(str), from_tags.astype(str), check_dtype=False
+    )
+
+
+def test_join_reviews_counts_every_pair():
+    from src.data.tag_bridge import build_tag_bridge, join_reviews
+    from src.data.tag_parser import TagParser
+
+    reviews = TagParser.flatten_tags(_reviews(), MAPPING)
+    joined = join_reviews(build_tag_bridge(reviews, MAPPING), reviews)
+
+    assert "offer_2" not in joined.columns
+    counts = joined.groupby("offer", observed=True).size().to_dict()
+    assert counts == {"Accommodation": 1, "Retail": 2}
+
+
+def test_build_tag_bridge_compiles_the_mapping_once(monkeypatch):
+    from src.data import tag_index
+    from src.data.tag_bridge import build_tag_bridge
+
+    calls = []
+    compile_state = tag_index._compile
+
+    def counting_compile(tags_mapping):
+        calls.append(tags_mapping)
+        return compile_state(tags_mapping)
+
+    monkeypatch.setattr(tag_index, "_compile", counting_compile)
+    bridge = build_tag_bridge(_reviews(), MAPPING)
+
+    assert len(calls) == 1
+    assert len(bridge) == 3
@@ -0,0 +1,65 @@
+import json
+import os
+import pandas as pd
+
+MAPPING = {
+    "tags_mapping": {
+        "c1": ["Accommodation", "Abha"],
+        "c2": ["Retail", "Riyadh"],
+        "c3": "Retail",
+    }
+}
+
+
+def test_lookup_returns_category_ids():
+    from src.data.tag_index import TagIndex
+
+    index = TagIndex(MAPPING)
+
+    assert list(index.offer_categories) == ["Accommodation", "Retail"]
+    assert list(index.destination_categories) == ["Abha", "Riyadh"]
+    offer_ids, destination_ids = index.lookup(["c2", "missing", "c3", "c1"])
+    assert offer_ids.tolist() == [1, -1, 1, 0]
+    assert destination_ids.tolist() == [1, -1, -1, 0]
+
+
+def test_flatten_tags_accepts_tag_index():
+    from src.data.tag_index import TagIndex
+    from src.data.tag_parser import TagParser
+
+    df = pd.DataFrame(
+        {
+            "tags": [
+                "[{'value': 'c1', 'sentiment': None}, {'value': 'c3', 'sentiment': None}]",
+                "[{'value': 'zz', 'sentiment': None}]",
+            ]
+        }
+    )
+    from_dict = TagParser.flatten_tags(df.copy(), MAPPING)
+    from_index = TagParser.flatten_tags(df.copy(), TagIndex(MAPPING))
+
+    pd.testing.assert_frame_equal(from_index, from_dict)
+    assert from_index["destination_2"].isna().all()
+
+
+def test_reload_swaps_in_the_edited_mapping(tmp_path):
+    from src.data.tag_index import TagIndex
+
+    path = tmp_path / "mappings.json"
+    path.write_text(json.dumps(MAPPING))
+    index = TagIndex.from_file(path, auto_reload=True)
+    assert index.reload() is False
+
+    edited = {"tags_mapping": {**MAPPING["tags_mapping"], "c4": ["Events", "Jeddah"]}}
+    path.write_text(json.dumps(edited))
+    stamp = os.stat(path).st_mtime + 5
+    os.utime(path, (stamp, stamp))
+    assert index.lookup(["c4"])[0].tolist() == [
+        index.offer_categories.get_loc("Events")
+    ]
+
+    # A half-written file keeps the previous index
+    path.write_text('{"tags_mapping": {')
+    os.utime(path, (stamp + 5, stamp + 5))
+    assert index.reload() is False
+    assert len(index) == 4
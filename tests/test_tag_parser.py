@@ -0,0 +1,101 @@
+import pandas as pd
+
+MAPPING = {
+    "tags_mapping": {
+        "c1": ["Accommodation", "Abha"],
+        "c2": ["Retail", "Riyadh"],
+        "c3": ["Religious"],
+    }
+}
+
+
+def test_flatten_tags_builds_wide_pairs():
+    from src.data.tag_parser import TagParser
+
+    df = pd.DataFrame(
+        {
+            "id": ["a", "b", "c", "d", "e"],
+            "tags": [
+                "[{'value': 'c1', 'sentiment': None}, {'value': 'c2', 'sentiment': None}]",
+                "[{'value': 'c3', 'sentiment': 'positive'}]",
+                "['c2', 'unknown']",
+                "not-a-list",
+                None,
+            ],
+        },
+        index=[7, 3, 9, 1, 5],
+    )
+
+    out = TagParser.flatten_tags(df, MAPPING, drop_original=True)
+
+    assert list(out.columns) == [
+        "id",
+        "offer",
+        "destination",
+        "offer_2",
+        "destination_2",
+    ]
+    assert list(out.index) == [7, 3, 9, 1, 5]
+    assert out["offer"].tolist() == [
+        "Accommodation",
+        "Religious",
+        "Retail",
+        None,
+        pd.NA,
+    ]
+    assert out["destination"].tolist() == ["Abha", None, "Riyadh", None, pd.NA]
+    assert out["offer_2"].tolist() == ["Retail", pd.NA, None, pd.NA, pd.NA]
+    assert out["destination_2"].tolist() == ["Riyadh", pd.NA, None, pd.NA, pd.NA]
+
+
+def test_parse_tags_column_matches_cell_parser():
+    from src.data.tag_parser import TagParser
+
+    tags = pd.Series(
+        [
+            "[{'value': 'c1', 'sentiment': None}]",
+            "[]",
+            "[{'value': 'c1', 'sentiment': None}, 'c2']",
+            ["c3"],
+            float("nan"),
+        ]
+    )
+
+    assert TagParser.parse_tags_column(tags) == [
+        TagParser._parse_tags_cell(cell) for cell in tags
+    ]
+
+
+def test_parse_tags_column_with_several_missing_or_malformed_cells():
+    import numpy as np
+    from src.data.tag_parser import TagParser
+
+    for fallback in (
+        [None, np.nan, None],
+        ["not-a-list", "also broken"],
+        ["['c1']", "['c2']"],
+    ):
+        canonical = ["[{'value': 'c1', 'sentiment': None}]"] * 2
+        tags = pd.Series(canonical + fallback, dtype=object)
+        assert TagParser.parse_tags_column(tags) == [
+            TagParser._parse_tags_cell(c) for c in tags
+        ]
+
+        out = TagParser.flatten_tags(pd.DataFrame({"tags": tags}), MAPPING)
+        assert out["offer"].tolist()[:2] == ["Accommodation", "Accommodation"]
+
+
+def test_all_missing_float_tags_column_is_left_unchanged():
+    import numpy as np
+    from src.data.tag_parser import TagParser
+
+    # read_csv gives float64 when every tags cell of a slice is missing
+    missing = pd.Series([np.nan, np.nan])
+    assert TagParser.parse_tags_column(missing) == [[], []]
+    assert TagParser.parse_tags_column(pd.Series([], dtype=float)) == []
+
+    for tags in ([np.nan, np.nan], []):
+        df = pd.DataFrame({"id": list("ab")[: len(tags)], "tags": tags}, dtype=object)
+        df["tags"] = df["tags"].astype(float)
+        out = TagParser.flatten_tags(df.copy(), MAPPING)
+        pd.testing.assert_frame_equal(out, df)
@@ -0,0 +1,81 @@
+from collections import Counter
+import pandas as pd
+
+TOKENS = pd.Series(
+    [
+        ["good", "hotel", "clean", "good"],
+        ["bad", "service", "hotel"],
+        ["clean", "room", "bad", "bad"],
+        [],
+        ["service", "good", "room"],
+    ]
+)
+OFFERS = pd.Series(["Hotel", "Retail", "Hotel", "Retail", None])
+
+
+def counter_of(rows):
+    return Counter(token for tokens in rows for token in tokens)
+
+
+def test_most_common_matches_counter_including_ties():
+    from src.eda.term_index import DocTermIndex
+
+    index = DocTermIndex(TOKENS)
+
+    for n in (1, 3, 10):
+        assert index.most_common(n) == counter_of(TOKENS).most_common(n)
+    assert index.frequencies() == dict(counter_of(TOKENS))
+
+    mask = [False, True, True, False, True]
+    subset = TOKENS[mask]
+    assert index.most_common(10, rows=mask) == counter_of(subset).most_common(10)
+    assert list(index.frequencies(mask).items()) == counter_of(subset).most_common()
+
+
+def test_group_queries_match_filtered_counters():
+    from src.eda.term_index import DocTermIndex
+
+    index = DocTermIndex(TOKENS)
+
+    groups, sums = index.group_term_counts(OFFERS)
+    assert list(groups) == ["Hotel", "Retail"]
+    assert sums.sum() == sum(len(t) for t in TOKENS[OFFERS.notna()])
+
+    top = index.most_common_by_group(OFFERS, groups=["Retail", "Hotel", "Tours"], n=3)
+    assert top["Hotel"] == counter_of(TOKENS[OFFERS == "Hotel"]).most_common(3)
+    assert top["Retail"] == counter_of(TOKENS[OFFERS == "Retail"]).most_common(3)
+    assert top["Tours"] == []
+
+
+def test_distinctive_terms_match_dense_formula():
+    import numpy as np
+    from src.eda.distinctive_terms import weighted_log_odds
+    from src.eda.term_index import DocTermIndex
+
+    index = DocTermIndex(TOKENS)
+    groups, sums = index.group_term_counts(OFFERS)
+
+    y = sums.toarray().astype(float)
+    totals = y.sum(axis=0)
+    alpha = totals
+    rest = totals - y
+    n, rest_n, alpha0 = (
+        y.sum(axis=1, keepdims=True),
+        y.sum() - y.sum(axis=1, keepdims=True),
+        y.sum(),
+    )
+    with np.errstate(divide="ignore"):
+        delta = np.log(y + alpha) - np.log(n + alpha0 - y - alpha)
+        delta -= np.log(rest + alpha) - np.log(rest_n + alpha0 - rest - alpha)
+    expected = delta / np.sqrt(1 / (y + alpha) + 1 / (rest + alpha))
+    scores = weighted_log_odds(sums).toarray()
+    assert np.allclose(scores[y > 0], expected[y > 0])
+
+    top = index.distinctive_terms(OFFERS, groups=["Hotel"], n=2)
+    hotel = np.flatnonzero(y[0])
+    best = hotel[np.argsort(-expected[0, hotel], kind="stable")][:2]
+    assert [word for word, _ in top["Hotel"]] == list(index.vocabulary[best])
+
+    tfidf = index.distinctive_terms(OFFERS, method="tfidf", min_count=2)
+    # 'bad' also occurs in Retail; 'hotel' and 'room' are below min_count
+    assert [word for word, _ in tfidf["Hotel"]] == ["good", "clean", "bad"]
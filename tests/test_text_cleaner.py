@@ -0,0 +1,68 @@
+import pandas as pd
+from types import SimpleNamespace
+
+
+def test_clean_column_matches_apply_cleaning(monkeypatch):
+    import src.data.text_cleaner as text_cleaner
+
+    monkeypatch.setattr(
+        "nltk.corpus.stopwords", SimpleNamespace(words=lambda language: [])
+    )
+    cleaner = text_cleaner.TextCleaner()
+
+    df = pd.DataFrame(
+        {
+            "text_for_analysis": [
+                "Great VIEW!! see www.example.com\nand http://t.co/x ok",
+                "مَرْحَبًا بِكُم في إأٱآ ؤ، رائع!! https://t.co/y",
+                "Mixed  tabs\tand\r\nnewlines  ",
+                None,
+                "",
+                "ΟΔΟΣ café",
+            ],
+            "language": ["eng", "ara", "ara", "eng", "ara", None],
+        },
+        index=[5, 4, 3, 2, 1, 0],
+    )
+
+    expected = df.apply(cleaner.apply_cleaning, axis=1)
+    cleaned = cleaner.clean_column(df)
+
+    assert cleaned.index.equals(df.index)
+    assert [t.encode() for t in cleaned] == [t.encode() for t in expected]
+    assert cleaned[4] == "مرحبا بكم في اااا ء، رائع"
+
+
+def test_clean_column_detects_missing_languages(monkeypatch):
+    import src.data.text_cleaner as text_cleaner
+
+    monkeypatch.setattr(
+        "nltk.corpus.stopwords", SimpleNamespace(words=lambda language: [])
+    )
+    cleaner = text_cleaner.TextCleaner()
+    df = pd.DataFrame({"text_for_analysis": ["Great VIEW!!", "رائع، إأ!!"]})
+
+    assert cleaner.clean_column(df).tolist() == [
+        cleaner.clean_text_english("Great VIEW!!"),
+        cleaner.clean_text_arabic("رائع، إأ!!"),
+    ]
+
+
+def test_clean_column_overwrites_untrusted_language_codes(monkeypatch):
+    import src.data.text_cleaner as text_cleaner
+
+    monkeypatch.setattr(
+        "nltk.corpus.stopwords", SimpleNamespace(words=lambda language: [])
+    )
+    cleaner = text_cleaner.TextCleaner()
+    df = pd.DataFrame(
+        {"text_for_analysis": ["رائع، إأ!!", "Great VIEW!!"], "language": ["eng"] * 2}
+    )
+
+    assert cleaner.clean_column(df, detect=True).tolist()[0] == (
+        cleaner.clean_text_english("رائع، إأ!!")
+    )
+    assert cleaner.clean_column(df, detect=True, overwrite=True).tolist() == [
+        cleaner.clean_text_arabic("رائع، إأ!!"),
+        cleaner.clean_text_english("Great VIEW!!"),
+    ]
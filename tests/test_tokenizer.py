@@ -0,0 +1,96 @@
+import pandas as pd
+from types import SimpleNamespace
+
+STOPWORDS = {"english": ["the", "was", "not"], "arabic": ["في", "من", "هذا"]}
+
+
+def _tokenizer(monkeypatch):
+    import src.data.tokenizer as tokenizer
+
+    monkeypatch.setattr(
+        "nltk.corpus.stopwords",
+        SimpleNamespace(words=lambda language: STOPWORDS[language]),
+    )
+    return tokenizer.TextTokenizer()
+
+
+def test_fast_word_tokenize_matches_nltk_on_cleaned_text():
+    from nltk.tokenize import NLTKWordTokenizer
+    from src.data.tokenizer import fast_word_tokenize
+
+    texts = [
+        "we cannot wait gonna come back wanna stay",
+        "gotta love it lemme know gimme more",
+        "الفندق رائع جدا، والخدمة ممتازة",
+        "room_2 was 100 clean cannot_x",
+        "",
+    ]
+    nltk_tokenizer = NLTKWordTokenizer()
+
+    for text in texts:
+        assert fast_word_tokenize(text) == nltk_tokenizer.tokenize(text)
+
+
+def test_tokenize_column_is_aligned_and_matches_row_by_row(monkeypatch):
+    tokenizer = _tokenizer(monkeypatch)
+    df = pd.DataFrame(
+        {
+            "cleaned_text": [
+                "the staff was not friendly",
+                "الفندق في مكان جميل من المدينة",
+                "",
+                "we cannot wait to visit again",
+            ],
+            "language": ["eng", "ara", "eng", "eng"],
+        },
+        index=[30, 10, 20, 0],
+    )
+
+    expected = [
+        tokenizer.remove_stopwords_and_tokenize(text, language, fast=True)
+        for text, language in zip(df["cleaned_text"], df["language"])
+    ]
+    tokens = tokenizer.tokenize_column(df, n_jobs=2, chunk_size=1, fast=True)
+
+    assert tokens.index.equals(df.index)
+    assert tokens.tolist() == expected
+    assert tokens[30] == ["staff", "friendly"]
+    assert tokens[0] == ["can", "wait", "visit", "again"]
+
+
+def test_encoded_tokens_round_trip_and_counts():
+    from collections import Counter
+    from src.data.tokenizer import EncodedTokens
+
+    tokens = pd.Series(
+        [["hotel", "clean"], [], ["clean", "staff", "hotel"], ["staff"]],
+        index=[5, 3, 9, 1],
+    )
+    encoded = EncodedTokens.from_lists(tokens)
+
+    assert encoded.vocabulary.tolist() == ["hotel", "clean", "staff"]
+    assert encoded.ids.tolist() == [0, 1, 1, 2, 0, 2]
+    assert encoded.offsets.tolist() == [0, 2, 2, 5, 6]
+    assert encoded.to_lists().equals(tokens)
+    assert encoded.most_common(2) == Counter(
+        w for row in tokens for w in row
+    ).most_common(2)
+
+    more = EncodedTokens.from_lists([["staff", "pool"]], vocabulary=encoded.vocabulary)
+    assert more.vocabulary.tolist() == ["hotel", "clean", "staff", "pool"]
+    assert more.ids.tolist() == [2, 3]
+
+
+def test_tokenize_column_overwrites_untrusted_language_codes(monkeypatch):
+    tokenizer = _tokenizer(monkeypatch)
+    df = pd.DataFrame(
+        {
+            "cleaned_text": ["هذا الفندق جميل", "the staff was friendly"],
+            "language": ["eng", "eng"],
+        }
+    )
+
+    tokens = tokenizer.tokenize_column(df, n_jobs=1, fast=True, overwrite=True)
+
+    assert tokens.tolist() == [["الفندق", "جميل"], ["staff", "friendly"]]
+    assert "هذا" in tokenizer.tokenize_column(df, n_jobs=1, fast=True)[0]